@@ -0,0 +1,77 @@
+"""add article_search full-text index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS article_search_fts USING fts5("
+    "document, content='article_search', content_rowid='article_id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS article_search_ai AFTER INSERT ON article_search BEGIN "
+    "INSERT INTO article_search_fts(rowid, document) VALUES (new.article_id, new.document); END",
+    "CREATE TRIGGER IF NOT EXISTS article_search_ad AFTER DELETE ON article_search BEGIN "
+    "INSERT INTO article_search_fts(article_search_fts, rowid, document) VALUES ('delete', old.article_id, old.document); END",
+    "CREATE TRIGGER IF NOT EXISTS article_search_au AFTER UPDATE ON article_search BEGIN "
+    "INSERT INTO article_search_fts(article_search_fts, rowid, document) VALUES ('delete', old.article_id, old.document); "
+    "INSERT INTO article_search_fts(rowid, document) VALUES (new.article_id, new.document); END",
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    op.create_table(
+        'article_search',
+        sa.Column('article_id', sa.Integer(), sa.ForeignKey('articles.id'), primary_key=True),
+        sa.Column('document', sa.Text(), nullable=False),
+    )
+
+    if dialect == 'postgresql':
+        op.create_index(
+            'ix_article_search_document_tsv',
+            'article_search',
+            [sa.text("to_tsvector('simple', document)")],
+            postgresql_using='gin',
+        )
+        keywords_text = (
+            "(SELECT string_agg(kw, ' ') FROM json_array_elements_text(an.keywords) AS kw)"
+        )
+    else:
+        for ddl in SQLITE_FTS_DDL:
+            op.execute(ddl)
+        keywords_text = "(SELECT group_concat(value, ' ') FROM json_each(an.keywords))"
+
+    # 기존 기사 백필 (트리거가 FTS5 테이블도 함께 채움)
+    op.execute(
+        "INSERT INTO article_search (article_id, document) "
+        "SELECT a.id, a.title || ' ' || COALESCE(a.content_clean, '') || ' ' || "
+        f"COALESCE({keywords_text}, '') "
+        "FROM articles a LEFT JOIN analyses an ON an.article_id = a.id"
+    )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.drop_index('ix_article_search_document_tsv', table_name='article_search')
+    else:
+        for trigger in ('article_search_ai', 'article_search_ad', 'article_search_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS article_search_fts")
+
+    op.drop_table('article_search')
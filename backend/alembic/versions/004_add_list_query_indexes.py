@@ -0,0 +1,57 @@
+"""add composite indexes for article list queries
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _desc(column: str, dialect: str) -> sa.TextClause:
+    # 목록 쿼리는 `정렬 컬럼 DESC NULLS LAST, id DESC`로 정렬.
+    # SQLite는 인덱스에 NULLS LAST를 쓸 수 없지만 DESC에서 NULL이 이미 마지막
+    return sa.text(f"{column} DESC NULLS LAST" if dialect == 'postgresql' else f"{column} DESC")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    op.create_index(
+        'ix_articles_published_at_id', 'articles', [_desc('published_at', dialect), sa.text('id DESC')]
+    )
+    op.create_index(
+        'ix_articles_source_published_at',
+        'articles',
+        ['source_id', _desc('published_at', dialect), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_analyses_label_score',
+        'analyses',
+        ['sentiment_label', _desc('sentiment_score', dialect), sa.text('article_id DESC')],
+    )
+
+    # 새 복합 인덱스의 접두어와 겹치는 단일 컬럼 인덱스 제거
+    op.drop_index('ix_articles_published_at', table_name='articles', if_exists=True)
+    op.drop_index('ix_analyses_sentiment_label', table_name='analyses', if_exists=True)
+
+    # 플래너 통계 갱신
+    op.execute('ANALYZE')
+
+
+def downgrade() -> None:
+    op.create_index('ix_analyses_sentiment_label', 'analyses', ['sentiment_label'])
+    op.create_index('ix_articles_published_at', 'articles', ['published_at'])
+    op.drop_index('ix_analyses_label_score', table_name='analyses')
+    op.drop_index('ix_articles_source_published_at', table_name='articles')
+    op.drop_index('ix_articles_published_at_id', table_name='articles')
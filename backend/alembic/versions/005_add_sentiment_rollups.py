@@ -0,0 +1,60 @@
+"""add sentiment_rollups
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bucket(granularity: str, dialect: str) -> str:
+    published = 'COALESCE(articles.published_at, articles.created_at)'
+    if dialect == 'postgresql':
+        return f"date_trunc('{granularity}', {published})"
+    # SQLAlchemy의 SQLite DateTime 저장 형식과 맞춘다
+    fmt = '%Y-%m-%d %H:00:00.000000' if granularity == 'hour' else '%Y-%m-%d 00:00:00.000000'
+    return f"strftime('{fmt}', {published})"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sentiment_rollups',
+        sa.Column('granularity', sa.String(length=8), primary_key=True),
+        sa.Column('bucket', sa.DateTime(), primary_key=True),
+        sa.Column('source_id', sa.Integer(), sa.ForeignKey('sources.id'), primary_key=True),
+        sa.Column('sentiment_label', sa.String(length=16), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('score_sum', sa.Float(), nullable=False),
+        sa.Column('score_min', sa.Float(), nullable=False),
+        sa.Column('score_max', sa.Float(), nullable=False),
+    )
+
+    # 기존 분석 결과로 채우기
+    dialect = op.get_bind().dialect.name
+    for granularity in ('hour', 'day'):
+        bucket = _bucket(granularity, dialect)
+        op.execute(
+            f"""
+            INSERT INTO sentiment_rollups
+                (granularity, bucket, source_id, sentiment_label, count, score_sum, score_min, score_max)
+            SELECT '{granularity}', {bucket}, articles.source_id, analyses.sentiment_label,
+                   COUNT(*), SUM(analyses.sentiment_score), MIN(analyses.sentiment_score), MAX(analyses.sentiment_score)
+            FROM articles JOIN analyses ON analyses.article_id = articles.id
+            GROUP BY {bucket}, articles.source_id, analyses.sentiment_label
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('sentiment_rollups')
@@ -0,0 +1,86 @@
+"""add keywords / analysis_keywords
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _normalize(term: str) -> str:
+    # app.services.keywords.normalize_keyword와 같은 규칙 (마이그레이션은 앱 코드에 의존하지 않는다)
+    return " ".join(unicodedata.normalize('NFKC', term).lower().split())[:128]
+
+
+def upgrade() -> None:
+    keywords = op.create_table(
+        'keywords',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('term', sa.String(length=128), nullable=False, unique=True),
+    )
+    analysis_keywords = op.create_table(
+        'analysis_keywords',
+        sa.Column('keyword_id', sa.Integer(), sa.ForeignKey('keywords.id'), primary_key=True),
+        sa.Column('article_id', sa.Integer(), sa.ForeignKey('articles.id'), primary_key=True),
+        sa.Column('published_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_analysis_keywords_published_at', 'analysis_keywords', ['published_at', 'keyword_id'])
+    op.create_index('ix_analysis_keywords_article_id', 'analysis_keywords', ['article_id'])
+
+    # 기존 analyses.keywords(JSON 배열)로 역색인 채우기
+    # 정규화를 Python에서 하므로 오프라인(--sql) 모드에서는 건너뛰고 `python -m app.services.keywords rebuild`로 채운다
+    if op.get_context().as_sql:
+        return
+    bind = op.get_bind()
+    articles = sa.table(
+        'articles', sa.column('id'), sa.column('published_at', sa.DateTime()), sa.column('created_at', sa.DateTime())
+    )
+    analyses = sa.table('analyses', sa.column('article_id'), sa.column('keywords', sa.JSON()))
+    rows = bind.execute(
+        sa.select(
+            analyses.c.article_id,
+            sa.func.coalesce(articles.c.published_at, articles.c.created_at),
+            analyses.c.keywords,
+        ).join(articles, articles.c.id == analyses.c.article_id)
+    ).all()
+
+    postings: dict[tuple[int, str], object] = {}
+    for article_id, published_at, terms in rows:
+        for raw in terms or []:
+            term = _normalize(raw) if isinstance(raw, str) else ''
+            if term:
+                postings[(article_id, term)] = published_at
+    if not postings:
+        return
+
+    terms = sorted({term for _, term in postings})
+    for i in range(0, len(terms), BATCH_SIZE):
+        bind.execute(keywords.insert(), [{'term': term} for term in terms[i:i + BATCH_SIZE]])
+    ids = dict(bind.execute(sa.select(keywords.c.term, keywords.c.id)).all())
+    values = [
+        {'keyword_id': ids[term], 'article_id': article_id, 'published_at': published_at}
+        for (article_id, term), published_at in postings.items()
+    ]
+    for i in range(0, len(values), BATCH_SIZE):
+        bind.execute(analysis_keywords.insert(), values[i:i + BATCH_SIZE])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_keywords_article_id', table_name='analysis_keywords')
+    op.drop_index('ix_analysis_keywords_published_at', table_name='analysis_keywords')
+    op.drop_table('analysis_keywords')
+    op.drop_table('keywords')
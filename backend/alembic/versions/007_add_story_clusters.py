@@ -0,0 +1,44 @@
+"""add near-duplicate story clusters
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('cluster_id', sa.Integer(), nullable=True))
+    op.create_index('ix_articles_cluster_id', 'articles', ['cluster_id'])
+
+    op.create_table(
+        'story_signatures',
+        sa.Column('article_id', sa.Integer(), sa.ForeignKey('articles.id'), primary_key=True),
+        sa.Column('signature', sa.LargeBinary(), nullable=False),
+    )
+    op.create_table(
+        'story_bands',
+        sa.Column('bucket', sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column('article_id', sa.Integer(), sa.ForeignKey('articles.id'), primary_key=True),
+    )
+    op.create_index('ix_story_bands_article_id', 'story_bands', ['article_id'])
+    # 기존 기사의 서명/묶음은 `python -m app.services.dedup rebuild`로 채운다 (MinHash 계산이 앱 코드에 있음)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_story_bands_article_id', table_name='story_bands')
+    op.drop_table('story_bands')
+    op.drop_table('story_signatures')
+    op.drop_index('ix_articles_cluster_id', table_name='articles')
+    op.drop_column('articles', 'cluster_id')
@@ -0,0 +1,31 @@
+"""add text_pattern_ops index for keyword prefix search
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PostgreSQL 접두어 검색(LIKE 'term%')용. 로케일 정렬(en_US.UTF-8 등)의 유니크 인덱스는 LIKE에 쓰이지 않는다.
+    # SQLite는 BINARY 정렬의 유니크 인덱스 범위 검색을 그대로 쓴다
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_keywords_term_pattern', 'keywords', ['term'], postgresql_ops={'term': 'text_pattern_ops'}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_keywords_term_pattern', table_name='keywords')
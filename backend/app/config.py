@@ -11,8 +11,76 @@ class Settings(BaseSettings):
     gemini_api_key: str | None = None
     newsdata_api_key: str | None = None
     database_url: str = "sqlite:///./local.db"
+    # DB 연결 풀 (동기/async 엔진 공통)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # 시작 시 빈 DB면 테이블을 만들고 Alembic head로 stamp (false면 `alembic upgrade head`로만 생성)
+    db_auto_create: bool = True
+    # /ready가 미리 열어 두는 연결 수 (연결 풀 워밍업)
+    db_warm_connections: int = 2
     allowed_origins: list[str] | str = ["*"]
     rate_limit_per_min: int = 60
+    # 분당 Gemini 토큰 예산 (0이면 미적용), 요청 버킷 버스트 크기 (기본값: rate_limit_per_min)
+    tokens_per_min: int = 0
+    rate_limit_burst: int | None = None
+    gemini_base_url: str = "https://generativelanguage.googleapis.com"
+    newsdata_base_url: str = "https://newsdata.io"
+    # NEWSDATA.io 수집 한도: 쿼리당 최대 페이지 수, 수집 회차당 최대 크레딧(요청 수)
+    newsdata_max_pages: int = 5
+    newsdata_max_credits: int = 10
+    # 수집 대상: NEWSDATA.io 쿼리(쿼리 문자열, ';'로 구분), RSS 피드("이름=URL" 또는 URL, ','로 구분)
+    newsdata_queries: list[str] | str = ["country=kr&language=ko"]
+    rss_feeds: list[str] | str = []
+    # 수집 시 같은 호스트에 동시에 보낼 요청 수 (대상끼리는 모두 동시에 진행)
+    fetch_per_host_concurrency: int = 4
+    # 외부 API 공용 HTTP 클라이언트 (서비스별 연결 풀, keep-alive, 재시도).
+    # gemini/newsdata는 호스트가 하나라 풀 크기가 곧 호스트별 한도. rss는 모든 피드 호스트가 이 값의 4배 크기
+    # 풀 하나를 나눠 쓰므로, 호스트별 동시 요청은 fetch_per_host_concurrency가 제한한다
+    http_max_connections_per_host: int = 10
+    http_keepalive_expiry: float = 30.0
+    http_retries: int = 2
+    http_retry_backoff: float = 0.5
+    http2: bool = False
+    gemini_timeout: float = 30.0
+    newsdata_timeout: float = 15.0
+    rss_timeout: float = 10.0
+    # 수집 시 동시에 실행할 Gemini 분석 수, 분석 결과를 한 번에 커밋할 건수
+    analysis_concurrency: int = 4
+    analysis_write_batch_size: int = 20
+    # 1보다 크면 짧은 기사 여러 건을 한 번의 Gemini 호출로 분석 (배치당 최대 건수 / 본문 글자 수 합계)
+    analysis_prompt_batch_size: int = 1
+    analysis_prompt_max_chars: int = 6000
+    # 근접 중복 기사 묶기 (묶음마다 대표 기사만 분석), 같은 묶음으로 볼 추정 자카드 유사도
+    story_dedup_enabled: bool = True
+    story_dedup_threshold: float = 0.5
+    # 본문 정제 프로세스 풀 워커 수(0이면 스레드에서만 처리), 프로세스 풀로 보낼 배치의 원문 글자 수 합계 기준
+    text_clean_workers: int = 2
+    text_clean_process_threshold: int = 2_000_000
+    # 분석 결과 캐시의 in-process LRU 계층 한도
+    analysis_cache_max_entries: int = 5000
+    analysis_cache_max_bytes: int = 32 * 1024 * 1024
+    analysis_cache_ttl_seconds: int = 24 * 60 * 60
+    # 기사 조회 응답 캐시 (수집 세대가 바뀌면 무효화), 클라이언트 Cache-Control max-age(초)
+    response_cache_max_entries: int = 1000
+    response_cache_max_bytes: int = 16 * 1024 * 1024
+    response_cache_ttl_seconds: int = 10 * 60
+    response_cache_max_age: int = 0
+    # 조회 응답 압축(br/gzip, Accept-Encoding 협상) 최소 본문 크기(바이트, 0이면 압축하지 않음)
+    response_compression_min_bytes: int = 1024
+    # 백그라운드 수집 주기(분, 0이면 수동 실행만), 상태를 보관할 최근 작업 수
+    ingest_interval_minutes: float = 0
+    ingest_job_history: int = 50
+    # 보존 정책: 이보다 오래된 기사(발행 시각, 없으면 저장 시각 기준)를 아카이브 후 삭제 (0이면 미적용)
+    retention_days: int = 90
+    # 아카이브 디렉터리(비우면 아카이브 없이 삭제만), 형식(jsonl: gzip JSONL, parquet: pyarrow 필요)
+    retention_archive_dir: str = "./archive"
+    retention_archive_format: str = "jsonl"
+    # 한 번에 아카이브/삭제하고 커밋할 기사 수, 자동 실행 주기(시간, 0이면 /admin/retention/run 수동 실행만)
+    retention_chunk_size: int = 500
+    retention_interval_hours: float = 0
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
@@ -24,6 +92,25 @@ class Settings(BaseSettings):
         # "http://a,https://b" 형태를 리스트로 변환
         return [part.strip() for part in v.split(",") if part.strip()]
 
+    @field_validator("newsdata_queries", mode="before")
+    @classmethod
+    def _coerce_queries(cls, v: str | list[str] | None) -> list[str]:
+        if v is None:
+            return []
+        if isinstance(v, list):
+            return v
+        # "country=kr&language=ko;country=kr&category=business" 형태 (쿼리 문자열에 ','가 들어갈 수 있어 ';'로 구분)
+        return [part.strip() for part in v.split(";") if part.strip()]
+
+    @field_validator("rss_feeds", mode="before")
+    @classmethod
+    def _coerce_feeds(cls, v: str | list[str] | None) -> list[str]:
+        if v is None:
+            return []
+        if isinstance(v, list):
+            return v
+        return [part.strip() for part in v.split(",") if part.strip()]
+
     @property
     def allowed_origins_list(self) -> List[str]:
         return self.allowed_origins  # validator에서 이미 리스트로 정규화됨
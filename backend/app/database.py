@@ -1,33 +1,131 @@
+from contextlib import AsyncExitStack
+from functools import lru_cache
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
-from app.models import Base
+from app.services.metrics import instrument_engine
 
 
-settings = get_settings()
+def database_url() -> str:
+    # Render Postgres URL이 `postgres://` 형태로 올 경우 SQLAlchemy가 psycopg2 드라이버를 찾으려 함
+    # psycopg v3를 사용하도록 스킴을 강제 변환
+    url = get_settings().database_url
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql+psycopg://", 1)
+    elif url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+psycopg://", 1)
+    return url
 
-# Render Postgres URL이 `postgres://` 형태로 올 경우 SQLAlchemy가 psycopg2 드라이버를 찾으려 함
-# psycopg v3를 사용하도록 스킴을 강제 변환
-db_url = settings.database_url
-if db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql+psycopg://", 1)
-elif db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+psycopg://", 1)
 
-engine = create_engine(db_url, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+def async_url(url: str) -> str:
+    """동기 URL을 async 드라이버 URL로 변환합니다. (psycopg v3는 같은 스킴으로 async 지원)"""
+    parsed = make_url(url)
+    if parsed.drivername in ("sqlite", "sqlite+pysqlite"):
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
 
 
-def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def pool_options(url: str, is_async: bool = False) -> dict:
+    """연결 풀 설정. 인메모리 SQLite는 단일 연결(StaticPool)이라 풀 크기 옵션을 받지 않는다."""
+    if _is_memory_sqlite(url):
+        return {}
+    settings = get_settings()
+    options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    # aiosqlite 파일 DB는 기본이 NullPool(매 요청 새 연결)이므로 큐 풀을 명시
+    if is_async and make_url(url).get_backend_name() == "sqlite":
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+
+def _enable_sqlite_wal(engine) -> None:
+    # 파일 SQLite: 수집 중 쓰기가 목록 조회(읽기)를 막지 않도록 WAL 모드 사용
+    if engine.dialect.name != "sqlite" or _is_memory_sqlite(str(engine.url)):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+
+# 엔진/세션 팩토리는 처음 쓰일 때 만든다. import만으로 DB 설정을 읽거나 연결 풀을 만들지 않도록
+# (헬스 체크, 테스트, CLI 도움말 등). 앱에서는 startup의 스키마 확인이 첫 사용 시점이다.
+@lru_cache
+def get_engine() -> Engine:
+    url = database_url()
+    engine = create_engine(url, future=True, **pool_options(url))
+    _enable_sqlite_wal(engine)
+    instrument_engine(engine)
+    return engine
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker[Session]:
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """라우트/파이프라인용 async 엔진."""
+    url = database_url()
+    engine = create_async_engine(async_url(url), **pool_options(url, is_async=True))
+    _enable_sqlite_wal(engine.sync_engine)
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # 커밋 후 속성 접근이 지연 로딩(I/O)을 일으키지 않도록 expire_on_commit=False
+    return async_sessionmaker(get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+async def dispose_engines() -> None:
+    """만들어진 엔진만 닫습니다 (한 번도 쓰지 않았으면 아무것도 하지 않음)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """연결을 최대 connections개(풀 크기 이내) 동시에 열어 `SELECT 1`을 실행하고 풀에 돌려 놓습니다."""
+    size = getattr(engine.pool, "size", None)
+    if callable(size):
+        connections = min(connections, size())
+    async with AsyncExitStack() as stack:
+        for _ in range(max(connections, 1)):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+    return max(connections, 1)
 
 
 def get_db():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -1,13 +1,28 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.config import get_settings
-from app.database import init_db
-from app.routes import admin, analyses, articles
-from app.schemas import HealthResponse
+from app.database import dispose_engines, get_async_engine, warm_pool
+from app.routes import admin, analyses, articles, export, keywords, metrics, stats
+from app.schemas import HealthResponse, ReadyResponse
+from app.services.http_client import http_clients
+from app.services.metrics import MetricsMiddleware
+from app.services.migrations import check_database, schema_status
+from app.services.preprocess import get_text_cleaner
+from app.services.serialization import ORJSONResponse
+from app.services.scheduler import get_ingest_scheduler, get_retention_scheduler
 
 settings = get_settings()
-app = FastAPI(title="Rokey News Backend", version="0.1.0", description="뉴스 요약/감성 분석 API")
+app = FastAPI(
+    title="Rokey News Backend",
+    version="0.1.0",
+    description="뉴스 요약/감성 분석 API",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,18 +31,62 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(articles.router)
 app.include_router(analyses.router)
+app.include_router(stats.router)
+app.include_router(keywords.router)
+app.include_router(export.router)
 app.include_router(admin.router)
+app.include_router(metrics.router)
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     print(f"[STARTUP] Allowed CORS origins: {settings.allowed_origins_list}")
-    init_db()
+    # create_all 대신 리비전 한 행만 확인 (빈 DB는 생성 후 head로 stamp)
+    await check_database(get_async_engine())
+    await http_clients.startup()
+    await get_ingest_scheduler().start()
+    await get_retention_scheduler().start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await get_ingest_scheduler().stop()
+    await get_retention_scheduler().stop()
+    await http_clients.aclose()
+    get_text_cleaner().shutdown()
+    await dispose_engines()
 
 
 @app.get("/health", response_model=HealthResponse, tags=["health"])
 def health_check() -> HealthResponse:
     return HealthResponse(status="ok")
+
+
+@app.get("/ready", response_model=ReadyResponse, tags=["health"], responses={503: {"model": ReadyResponse}})
+async def readiness_check(response: Response, engine: AsyncEngine = Depends(get_async_engine)) -> ReadyResponse:
+    """
+    DB 스키마가 Alembic head와 같은지 확인하고 연결 풀을 미리 채웁니다.
+    /health는 DB를 건드리지 않는 생존 확인, /ready는 트래픽을 받아도 되는지 확인하는 용도입니다.
+    """
+    started = time.perf_counter()
+    try:
+        async with engine.connect() as conn:
+            status = await conn.run_sync(schema_status)
+        warmed = await warm_pool(engine, settings.db_warm_connections)
+    except (SQLAlchemyError, OSError) as exc:
+        response.status_code = 503
+        return ReadyResponse(status="not_ready", elapsed_ms=(time.perf_counter() - started) * 1000, detail=str(exc))
+    if not status.ok:
+        response.status_code = 503
+    return ReadyResponse(
+        status="ready" if status.ok else "not_ready",
+        schema_state=status.state,
+        revision=status.revision,
+        head=status.head,
+        connections_warmed=warmed,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
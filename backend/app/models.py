@@ -1,7 +1,22 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -29,11 +44,13 @@ class Article(Base):
     source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     link: Mapped[str] = mapped_column(String(2048), nullable=False)
-    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     content_raw: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     content_clean: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     hash: Mapped[str] = mapped_column(String(128), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 근접 중복 기사 묶음 (대표 기사 id). 본문이 너무 짧아 서명을 만들지 못하면 NULL
+    cluster_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
 
     source: Mapped["Source"] = relationship(back_populates="articles")
     analysis: Mapped[Optional["Analysis"]] = relationship(back_populates="article", uselist=False)
@@ -48,7 +65,7 @@ class Analysis(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), nullable=False, index=True)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    sentiment_label: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    sentiment_label: Mapped[str] = mapped_column(String(16), nullable=False)
     sentiment_score: Mapped[float] = mapped_column(Float, nullable=False)
     keywords: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
     json_meta: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
@@ -56,3 +73,120 @@ class Analysis(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     article: Mapped["Article"] = relationship(back_populates="analysis")
+
+
+def _keyset_index(name: str, *leading, sort: tuple = ()) -> None:
+    """
+    목록 쿼리 모양(등치 필터 + `정렬 컬럼 DESC NULLS LAST, id DESC`)에 맞춘 복합 인덱스.
+    SQLite는 인덱스에 NULLS LAST를 지정할 수 없지만 DESC에서 NULL이 이미 마지막이므로 DESC만 사용한다.
+    """
+    head, *rest = sort
+    tail = [col.desc() for col in rest]  # id 타이브레이커는 NOT NULL, 쿼리도 기본 DESC
+    Index(name, *leading, head.desc().nulls_last(), *tail).ddl_if(dialect="postgresql")
+    Index(name, *leading, head.desc(), *tail).ddl_if(dialect="sqlite")
+
+
+# 기본 목록: ORDER BY published_at DESC, id DESC (키셋 페이지)
+_keyset_index("ix_articles_published_at_id", sort=(Article.published_at, Article.id))
+# 출처 필터 + 최신순
+_keyset_index("ix_articles_source_published_at", Article.source_id, sort=(Article.published_at, Article.id))
+# 감성 필터 + 점수순
+_keyset_index("ix_analyses_label_score", Analysis.sentiment_label, sort=(Analysis.sentiment_score, Analysis.article_id))
+
+
+class ArticleSearch(Base):
+    """검색용 문서(제목+본문+키워드). PostgreSQL은 GIN tsvector 인덱스, SQLite는 FTS5 테이블로 색인."""
+
+    __tablename__ = "article_search"
+    __table_args__ = (
+        Index(
+            "ix_article_search_document_tsv",
+            func.to_tsvector(literal_column("'simple'"), literal_column("document")),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), primary_key=True)
+    document: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+class AnalysisCacheEntry(Base):
+    """정규화 본문 + 프롬프트 버전 + 모델명 해시로 찾는 Gemini 분석 결과 캐시 (영구 계층)."""
+
+    __tablename__ = "analysis_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+    model_name: Mapped[str] = mapped_column(String(128), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class SentimentRollup(Base):
+    """
+    시간 버킷(hour/day) × 소스 × 감성 라벨별 기사 수와 점수 합계/최소/최대.
+    수집 파이프라인이 분석 저장 시 증분 갱신하며, 평균은 score_sum / count로 계산합니다.
+    """
+
+    __tablename__ = "sentiment_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)  # 'hour' or 'day'
+    bucket: Mapped[datetime] = mapped_column(DateTime, primary_key=True)  # 버킷 시작 시각 (UTC)
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), primary_key=True)
+    sentiment_label: Mapped[str] = mapped_column(String(16), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    score_min: Mapped[float] = mapped_column(Float, nullable=False)
+    score_max: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class Keyword(Base):
+    """정규화된 분석 키워드 사전 (소문자, 공백 정리)."""
+
+    __tablename__ = "keywords"
+    __table_args__ = (
+        # 접두어 검색(LIKE 'term%')용: 로케일 정렬의 유니크 인덱스는 LIKE에 쓰이지 않는다
+        Index("ix_keywords_term_pattern", "term", postgresql_ops={"term": "text_pattern_ops"}).ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    term: Mapped[str] = mapped_column(String(128), nullable=False, unique=True)  # 완전 일치/접두어 검색용
+
+
+class AnalysisKeyword(Base):
+    """
+    분석 키워드 역색인: 키워드 → 기사. PK (keyword_id, article_id)가 키워드 필터를,
+    (published_at, keyword_id) 인덱스가 기간별 키워드 집계를 받칩니다.
+    """
+
+    __tablename__ = "analysis_keywords"
+    __table_args__ = (
+        Index("ix_analysis_keywords_published_at", "published_at", "keyword_id"),
+        Index("ix_analysis_keywords_article_id", "article_id"),
+    )
+
+    keyword_id: Mapped[int] = mapped_column(ForeignKey("keywords.id"), primary_key=True)
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), primary_key=True)
+    # 기사 발행 시각 (없으면 저장 시각) - 기간 집계가 articles를 조인하지 않도록 복제
+    published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class StorySignature(Base):
+    """근접 중복 탐지용 본문 MinHash 서명 (app.services.dedup 참고)."""
+
+    __tablename__ = "story_signatures"
+
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), primary_key=True)
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class StoryBand(Base):
+    """MinHash LSH 밴드 버킷 → 기사. 같은 버킷을 공유하는 기사만 유사도 비교 후보가 됩니다."""
+
+    __tablename__ = "story_bands"
+    __table_args__ = (Index("ix_story_bands_article_id", "article_id"),)
+
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), primary_key=True)
@@ -1,24 +1,90 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Article, Analysis, Source
-from app.schemas import IngestResponse
-from app.services.pipeline import run_ingest
+from app.config import get_settings
+from app.models import Source
+from app.schemas import IngestJobOut, RetentionJobOut
+from app.services.analysis_cache import get_analysis_cache
+from app.services.http_client import http_clients
+from app.services.rate_limit import get_rate_limiter
+from app.services.response_cache import get_response_cache
+from app.services.retention import purge_source_articles
+from app.services.rollups import delete_source_rollups
+from app.services.scheduler import IngestScheduler, get_ingest_scheduler, get_retention_scheduler
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-@router.post("/ingest/run", response_model=IngestResponse)
-async def ingest_run(db: Session = Depends(get_db)):
-    result = await run_ingest(db)
-    return result
+@router.post("/ingest/run", response_model=IngestJobOut, status_code=status.HTTP_202_ACCEPTED)
+def ingest_run(scheduler: IngestScheduler = Depends(get_ingest_scheduler)):
+    """
+    수집 작업을 큐에 넣고 바로 반환합니다. 진행 상황은 /admin/ingest/jobs/{id}로 조회합니다.
+    아직 시작하지 않은 작업이 있으면 그 작업을 그대로 돌려줍니다.
+    """
+    return scheduler.submit(trigger="manual").to_dict()
+
+
+@router.get("/ingest/jobs", response_model=list[IngestJobOut])
+def ingest_jobs(scheduler: IngestScheduler = Depends(get_ingest_scheduler)):
+    """최근 수집 작업 목록 (최신순)."""
+    return [job.to_dict() for job in scheduler.jobs()]
+
+
+@router.get("/ingest/jobs/{job_id}", response_model=IngestJobOut)
+def ingest_job(job_id: str, scheduler: IngestScheduler = Depends(get_ingest_scheduler)):
+    job = scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@router.get("/rate-limit")
+def rate_limit_status():
+    """Gemini 레이트 리미터의 현재 버킷 잔량과 대기 상태를 반환합니다."""
+    return get_rate_limiter().snapshot()
+
+
+@router.get("/http/stats")
+def http_stats():
+    """외부 API 호출 지연 히스토그램 (서비스별). 연결 재사용 시 핸드셰이크 비용이 빠져 하위 버킷으로 이동합니다."""
+    return http_clients.stats()
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    """분석 결과 캐시와 기사 조회 응답 캐시의 적중/크기 통계."""
+    return {"analysis": get_analysis_cache().stats(), "response": get_response_cache().stats()}
+
+
+@router.post("/retention/run", response_model=RetentionJobOut, status_code=status.HTTP_202_ACCEPTED)
+def retention_run(scheduler: IngestScheduler = Depends(get_retention_scheduler)):
+    """
+    RETENTION_DAYS보다 오래된 기사/분석을 아카이브하고 삭제하는 작업을 큐에 넣습니다.
+    진행 상황(아카이브/삭제 건수, 회수 바이트)은 /admin/retention/jobs/{id}로 조회합니다.
+    """
+    return scheduler.submit(trigger="manual").to_dict()
+
+
+@router.get("/retention/jobs", response_model=list[RetentionJobOut])
+def retention_jobs(scheduler: IngestScheduler = Depends(get_retention_scheduler)):
+    """최근 보존 정책 작업 목록 (최신순)."""
+    return [job.to_dict() for job in scheduler.jobs()]
+
+
+@router.get("/retention/jobs/{job_id}", response_model=RetentionJobOut)
+def retention_job(job_id: str, scheduler: IngestScheduler = Depends(get_retention_scheduler)):
+    job = scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
 
 
 @router.post("/cleanup/finnhub")
-async def cleanup_finnhub(db: Session = Depends(get_db)):
+def cleanup_finnhub(db: Session = Depends(get_db)):
     """
     Finnhub 소스의 모든 기사와 분석 데이터를 삭제합니다.
+    기사 id만 청크 단위로 읽어 집합 DELETE로 지우고 청크마다 커밋합니다.
     """
     # Finnhub 소스 찾기
     finnhub_source = db.query(Source).filter(Source.name == "finnhub").first()
@@ -26,30 +92,21 @@ async def cleanup_finnhub(db: Session = Depends(get_db)):
     if not finnhub_source:
         return {"deleted_articles": 0, "deleted_analyses": 0, "message": "Finnhub source not found"}
 
-    # Finnhub 기사들의 ID 수집
-    finnhub_article_ids = [
-        article.id for article in
-        db.query(Article).filter(Article.source_id == finnhub_source.id).all()
-    ]
+    # 기사와 딸린 키워드 색인, 중복 탐지 서명, 검색 문서, 분석 데이터 삭제
+    deleted = purge_source_articles(db, finnhub_source.id, get_settings().retention_chunk_size)
+    deleted_articles, deleted_analyses = deleted["articles"], deleted["analyses"]
 
-    # 해당 기사들의 분석 데이터 삭제
-    deleted_analyses = db.query(Analysis).filter(
-        Analysis.article_id.in_(finnhub_article_ids)
-    ).delete(synchronize_session=False) if finnhub_article_ids else 0
-
-    # Finnhub 기사 삭제
-    deleted_articles = db.query(Article).filter(
-        Article.source_id == finnhub_source.id
-    ).delete(synchronize_session=False)
+    # 감성 롤업에서도 제거
+    delete_source_rollups(db, finnhub_source.id)
 
     # Finnhub 소스도 삭제 (선택사항)
     db.delete(finnhub_source)
 
     db.commit()
+    get_response_cache().bump()
 
     return {
         "deleted_articles": deleted_articles,
         "deleted_analyses": deleted_analyses,
         "message": f"Successfully deleted {deleted_articles} Finnhub articles and {deleted_analyses} analyses"
     }
-
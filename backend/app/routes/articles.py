@@ -1,111 +1,356 @@
+import base64
+import json
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import Annotated, Any, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, desc, func, or_, String
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Date, and_, case, cast, desc, func, literal, null, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query as OrmQuery, Session, aliased
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_async_db
 from app.models import Analysis, Article, Source
-from app.schemas import AnalysisOut, ArticleDetail, ArticleListResponse
+from app.schemas import AnalysisOut, ArticleDetail, ArticleFacetsResponse, ArticleListResponse
+from app.services.keywords import keyword_article_ids
+from app.services.response_cache import get_response_cache
+from app.services.search import apply_search
+from app.services.serialization import compress_stream, dumps, negotiate_encoding
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
 
-DbDep = Annotated[Session, Depends(get_db)]
+# 조회 라우트는 async 세션 사용 (수집 중 DB I/O가 이벤트 루프를 막지 않도록)
+DbDep = Annotated[AsyncSession, Depends(get_async_db)]
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_CHUNK_SIZE = 500
 
-@router.get("", response_model=ArticleListResponse)
-def list_articles(
-    db: DbDep,
+# 같은 근접 중복 묶음의 기사 수 (articles.cluster_id 인덱스로 페이지의 행마다 계산)
+_cluster_member = aliased(Article)
+CLUSTER_SIZE = (
+    select(func.count())
+    .where(_cluster_member.cluster_id == Article.cluster_id)
+    .correlate(Article)
+    .scalar_subquery()
+    .label("cluster_size")
+)
+
+# 목록 화면에 필요한 컬럼만 조회 (content_raw/content_clean 같은 대용량 텍스트는 제외)
+LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.link,
+    Article.published_at,
+    Analysis.summary,
+    Analysis.sentiment_label,
+    Analysis.sentiment_score,
+    Analysis.keywords,
+    Article.cluster_id,
+    CLUSTER_SIZE,
+)
+# 응답 필드 이름 (ArticleListItem 필드 순서와 같음)
+LIST_KEYS = tuple(column.key for column in LIST_COLUMNS)
+
+DETAIL_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.link,
+    Article.published_at,
+    Analysis.summary,
+    Analysis.sentiment_label,
+    Analysis.sentiment_score,
+    Analysis.keywords,
+    Article.source_id,
+)
+DETAIL_KEYS = tuple(column.key for column in DETAIL_COLUMNS)
+
+
+def _encode_cursor(sort_value: Any, article_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, article_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, article_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if sort_value is not None:
+            sort_value = datetime.fromisoformat(sort_value) if sort == "published_desc" else float(sort_value)
+        return sort_value, int(article_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+@dataclass
+class ArticleFilters:
+    q: Optional[str] = None
+    sentiment: Optional[str] = None
+    source: Optional[str] = None
+    from_date: Optional[datetime] = None
+    to_date: Optional[datetime] = None
+    keyword: Optional[str] = None
+    keyword_match: str = "exact"
+
+
+def article_filters(
     q: Optional[str] = Query(None, description="검색어"),
     sentiment: Optional[str] = Query(None, description="positive|neutral|negative"),
     source: Optional[str] = Query(None, description="source name"),
     from_date: Optional[datetime] = Query(None, alias="from"),
     to_date: Optional[datetime] = Query(None, alias="to"),
-    sort: str = Query("published_desc", description="published_desc|score_desc"),
-):
-    query = (
-        db.query(Article, Analysis, Source)
-        .join(Source, Source.id == Article.source_id, isouter=True)
-        .join(Analysis, Analysis.article_id == Article.id, isouter=True)
+    keyword: Optional[str] = Query(None, description="분석 키워드"),
+    keyword_match: str = Query("exact", pattern="^(exact|prefix)$", description="exact|prefix"),
+) -> ArticleFilters:
+    return ArticleFilters(
+        q=q,
+        sentiment=sentiment,
+        source=source,
+        from_date=from_date,
+        to_date=to_date,
+        keyword=keyword,
+        keyword_match=keyword_match,
     )
 
+
+FiltersDep = Annotated[ArticleFilters, Depends(article_filters)]
+
+
+def filtered_query(db: Session, columns, filters: ArticleFilters):
+    """
+    목록 필터를 적용한 쿼리와 검색 relevance 표현식을 반환합니다.
+    검색어가 없으면 relevance는 None입니다.
+    """
+    query = db.query(*columns).join(Analysis, Analysis.article_id == Article.id, isouter=True)
+
+    rank = None
+    if filters.q:
+        # 제목, 본문, 키워드에서 검색 (PostgreSQL tsvector / SQLite FTS5 색인 사용)
+        query, rank = apply_search(query, db.get_bind().dialect.name, filters.q)
+
     conditions = []
-    if q:
-        like = f"%{q}%"
-        # 제목, 본문, 키워드에서 검색 (한국어 지원)
-        # ilike는 PostgreSQL에서 대소문자 무시, SQLite는 like가 기본적으로 대소문자 무시
-        search_conditions = [
-            Article.title.ilike(like),
-            Article.content_clean.ilike(like),
-            # 키워드 JSON을 텍스트로 변환하여 검색 (JSON 타입을 Text로 cast)
-            func.cast(Analysis.keywords, String).ilike(like),
-        ]
-        conditions.append(or_(*search_conditions))
-    if sentiment:
-        conditions.append(Analysis.sentiment_label == sentiment)
-    if source:
-        like_source = f"%{source}%"
-        conditions.append(Source.name.ilike(like_source))
-    if from_date:
-        conditions.append(Article.published_at >= from_date)
-    if to_date:
-        conditions.append(Article.published_at <= to_date)
+    if filters.sentiment:
+        conditions.append(Analysis.sentiment_label == filters.sentiment)
+    if filters.source:
+        # sources를 조인하지 않고 id 목록으로 걸러 (source_id, published_at) 인덱스를 쓸 수 있게 한다
+        like_source = f"%{filters.source}%"
+        conditions.append(Article.source_id.in_(select(Source.id).where(Source.name.ilike(like_source))))
+    if filters.keyword:
+        # 정규화 키워드 역색인 조회 (JSON 문자열 부분 일치가 아님: '금리'는 '금리인하'와 일치하지 않음)
+        prefix = filters.keyword_match == "prefix"
+        dialect = db.get_bind().dialect.name
+        conditions.append(Article.id.in_(keyword_article_ids(filters.keyword, prefix=prefix, dialect=dialect)))
+    if filters.from_date:
+        conditions.append(Article.published_at >= filters.from_date)
+    if filters.to_date:
+        conditions.append(Article.published_at <= filters.to_date)
 
     if conditions:
         query = query.filter(and_(*conditions))
+    return query, rank
+
 
-    if sort == "score_desc":
-        query = query.order_by(desc(Analysis.sentiment_score).nullslast())
-    else:
-        query = query.order_by(desc(Article.published_at).nullslast())
-
-    items = []
-    for art, ana, src in query.all():
-        items.append(
-            {
-                "id": art.id,
-                "title": art.title,
-                "link": art.link,
-                "published_at": art.published_at,
-                "summary": getattr(ana, "summary", None),
-                "sentiment_label": getattr(ana, "sentiment_label", None),
-                "sentiment_score": getattr(ana, "sentiment_score", None),
-                "keywords": getattr(ana, "keywords", None),
-            }
+def facets_statement(session: Session, filters: ArticleFilters):
+    """
+    필터에 맞는 기사의 감성 라벨별/소스별/발행일별 개수를 한 번의 집계 쿼리로 구합니다.
+    행: (facet, sentiment_label, source_id, source_name, day, count), facet은 sentiment|source|day.
+    PostgreSQL은 GROUPING SETS, SQLite는 필터 결과를 CTE로 한 번 만든 뒤 UNION ALL로 세 번 집계합니다.
+    """
+    dialect = session.get_bind().dialect.name
+    day = cast(Article.published_at, Date) if dialect == "postgresql" else func.date(Article.published_at)
+    columns = (
+        Analysis.sentiment_label.label("sentiment_label"),
+        Article.source_id.label("source_id"),
+        Source.name.label("source_name"),
+        day.label("day"),
+    )
+    query, _ = filtered_query(session, columns, filters)
+    query = query.join(Source, Source.id == Article.source_id)
+
+    if dialect == "postgresql":
+        # GROUPING(label, source_id, day) 비트: 집계에서 빠진 컬럼이 1 → 어느 그룹 집합의 행인지 구분
+        facet = case(
+            {3: "sentiment", 5: "source", 6: "day"},
+            value=func.grouping(Analysis.sentiment_label, Article.source_id, day),
+        )
+        return (
+            query.add_columns(facet.label("facet"), func.count().label("count"))
+            .group_by(func.grouping_sets(Analysis.sentiment_label, tuple_(Article.source_id, Source.name), day))
+            .statement
         )
-    return {"items": items}
 
+    base = query.statement.cte("facet_base").prefix_with("MATERIALIZED")
 
-@router.get("/{article_id}", response_model=ArticleDetail)
-def get_article(article_id: int, db: DbDep):
-    article = (
-        db.query(Article)
-        .options(joinedload(Article.analysis))
-        .filter(Article.id == article_id)
-        .one_or_none()
+    def _branch(facet: str, *grouped):
+        # 모든 분기가 같은 이름/순서의 컬럼을 내도록 그룹 컬럼 외에는 NULL
+        values = [base.c[name] if base.c[name] in grouped else null().label(name) for name in base.c.keys()]
+        return select(literal(facet).label("facet"), *values, func.count().label("count")).group_by(*grouped)
+
+    return union_all(
+        _branch("sentiment", base.c.sentiment_label),
+        _branch("source", base.c.source_id, base.c.source_name),
+        _branch("day", base.c.day),
     )
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    ana = article.analysis
+
+
+def _facets_payload(rows) -> dict[str, Any]:
+    sentiment, sources, days = [], [], []
+    for row in rows:
+        if row.facet == "sentiment":
+            sentiment.append({"sentiment_label": row.sentiment_label, "count": row.count})
+        elif row.facet == "source":
+            sources.append({"source_id": row.source_id, "source_name": row.source_name, "count": row.count})
+        elif row.facet == "day" and row.day is not None:
+            days.append({"day": row.day, "count": row.count})
     return {
-        "id": article.id,
-        "title": article.title,
-        "link": article.link,
-        "published_at": article.published_at,
-        "summary": ana.summary if ana else None,
-        "sentiment_label": ana.sentiment_label if ana else None,
-        "sentiment_score": ana.sentiment_score if ana else None,
-        "keywords": ana.keywords if ana else None,
-        "source_id": article.source_id,
+        "total": sum(item["count"] for item in sentiment),
+        "sentiment": sorted(sentiment, key=lambda item: (-item["count"], item["sentiment_label"] or "")),
+        "sources": sorted(sources, key=lambda item: (-item["count"], item["source_id"])),
+        "days": sorted(days, key=lambda item: str(item["day"])),
     }
 
 
+def _apply_keyset(query: OrmQuery, sort_col, cursor: Optional[str], sort: str) -> OrmQuery:
+    """(정렬 컬럼, id) 키셋 조건과 정렬을 적용합니다. NULL 값은 항상 마지막에 위치합니다."""
+    if cursor:
+        last_value, last_id = _decode_cursor(cursor, sort)
+        if last_value is None:
+            query = query.filter(and_(sort_col.is_(None), Article.id < last_id))
+        else:
+            query = query.filter(
+                or_(
+                    sort_col < last_value,
+                    and_(sort_col == last_value, Article.id < last_id),
+                    sort_col.is_(None),
+                )
+            )
+    return query.order_by(desc(sort_col).nullslast(), desc(Article.id))
+
+
+def _row_to_item(row) -> dict[str, Any]:
+    # 컬럼 프로젝션 순서 그대로 dict를 만들어 Pydantic 검증 없이 직렬화 (relevance 정렬의 rank 컬럼은 zip에서 빠짐)
+    item = dict(zip(LIST_KEYS, row))
+    if item["cluster_id"] is None:
+        item["cluster_size"] = None
+    return item
+
+
+async def _stream_ndjson(bind, build_query, limit: Optional[int]) -> AsyncIterator[bytes]:
+    # 요청 스코프 세션은 응답 전송 전에 닫히므로 같은 엔진에 스트리밍 전용 세션을 연다
+    async with AsyncSession(bind=bind) as db:
+        query = build_query(db.sync_session)
+        if limit:
+            query = query.limit(limit)
+        result = await db.stream(query.statement.execution_options(yield_per=STREAM_CHUNK_SIZE))
+        async for rows in result.partitions():
+            yield b"".join(dumps(_row_to_item(row)) + b"\n" for row in rows)
+
+
+@router.get("", response_model=ArticleListResponse)
+async def list_articles(
+    request: Request,
+    db: DbDep,
+    filters: FiltersDep,
+    sort: str = Query("published_desc", description="published_desc|score_desc|relevance"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description=f"페이지 크기 (기본 {DEFAULT_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    response_format: str = Query("json", alias="format", description="json|ndjson (ndjson은 limit 없이 전체 스트리밍)"),
+):
+    # relevance 정렬은 검색어가 있을 때만 의미가 있음
+    if sort == "relevance" and not filters.q:
+        sort = "published_desc"
+
+    def build_query(session: Session) -> OrmQuery:
+        query, rank = filtered_query(session, LIST_COLUMNS, filters)
+        if sort == "relevance":
+            query = query.add_columns(rank.label("rank"))
+            sort_col = rank
+        elif sort == "score_desc":
+            sort_col = Analysis.sentiment_score
+        else:
+            sort_col = Article.published_at
+        return _apply_keyset(query, sort_col, cursor, sort)
+
+    if response_format == "ndjson":
+        if cursor:
+            _decode_cursor(cursor, sort)  # 스트리밍 시작 전에 커서 검증
+        chunks = _stream_ndjson(db.bind, build_query, limit)
+        headers = {}
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding and get_settings().response_compression_min_bytes:
+            chunks = compress_stream(chunks, encoding)
+            headers = {"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+        return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
+
+    async def build_page() -> bytes:
+        # 필터/키셋 조립은 동기 Query API를 그대로 쓰고 실행만 async 드라이버로 (run_sync)
+        payload = await db.run_sync(lambda session: _list_page(build_query(session), sort, limit or DEFAULT_PAGE_SIZE))
+        return dumps(payload)
+
+    # 같은 수집 세대 안에서는 같은 조회 결과를 재사용 (ETag/304 지원)
+    return await get_response_cache().respond(request, build_page)
+
+
+def _list_page(query: OrmQuery, sort: str, page_size: int) -> dict[str, Any]:
+    rows = query.limit(page_size + 1).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        if sort == "relevance":
+            last_value = last.rank
+        elif sort == "score_desc":
+            last_value = last.sentiment_score
+        else:
+            last_value = last.published_at
+        next_cursor = _encode_cursor(last_value, last.id)
+
+    return {"items": [_row_to_item(row) for row in rows], "next_cursor": next_cursor}
+
+
+@router.get("/facets", response_model=ArticleFacetsResponse)
+async def article_facets(request: Request, db: DbDep, filters: FiltersDep):
+    """목록과 같은 필터를 적용한 감성/소스/발행일 개수 (필터 바 표시용)."""
+
+    async def build_facets() -> bytes:
+        rows = await db.run_sync(lambda session: session.execute(facets_statement(session, filters)).all())
+        return ArticleFacetsResponse.model_validate(_facets_payload(rows)).model_dump_json().encode("utf-8")
+
+    return await get_response_cache().respond(request, build_facets)
+
+
+# /facets보다 뒤에 선언해야 "facets"가 article_id로 해석되지 않는다
+@router.get("/{article_id}", response_model=ArticleDetail)
+async def get_article(article_id: int, request: Request, db: DbDep):
+    async def build_detail() -> bytes:
+        return dumps(await _article_detail(db, article_id))
+
+    return await get_response_cache().respond(request, build_detail)
+
+
+async def _article_detail(db: AsyncSession, article_id: int) -> dict[str, Any]:
+    # ORM 객체(본문 컬럼 포함) 대신 응답에 필요한 컬럼만 조회
+    row = (
+        await db.execute(
+            select(*DETAIL_COLUMNS)
+            .join(Analysis, Analysis.article_id == Article.id, isouter=True)
+            .where(Article.id == article_id)
+        )
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return dict(zip(DETAIL_KEYS, row))
+
+
 @router.get("/{article_id}/analysis", response_model=AnalysisOut)
-def get_article_analysis(article_id: int, db: DbDep):
-    ana = db.query(Analysis).filter(Analysis.article_id == article_id).one_or_none()
+async def get_article_analysis(article_id: int, db: DbDep):
+    ana = await db.scalar(select(Analysis).where(Analysis.article_id == article_id))
     if not ana:
         raise HTTPException(status_code=404, detail="Analysis not found")
     return ana
-
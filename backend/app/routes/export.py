@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_async_db
+from app.routes.articles import FiltersDep, filtered_query
+from app.services.export import MEDIA_TYPES, parquet_available, stream_export
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+DbDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+@router.get("/articles")
+async def export_articles(
+    db: DbDep,
+    filters: FiltersDep,
+    export_format: str = Query("ndjson", alias="format", pattern="^(csv|ndjson|parquet)$", description="csv|ndjson|parquet"),
+    compression: str = Query("none", pattern="^(none|gzip)$", description="none|gzip (csv/ndjson)"),
+    include_raw: bool = Query(False, description="원문(content_raw) 포함 여부"),
+    limit: Optional[int] = Query(None, ge=1, description="최대 행 수 (기본: 전체)"),
+):
+    """
+    목록 API와 같은 필터로 기사와 분석 결과 전체(정제 본문, json_meta, model_name 포함)를 id 순으로 스트리밍합니다.
+    서버 측 커서로 배치씩 읽어 바로 내보내므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    compression=gzip이면 .gz 파일(application/gzip)로 내려갑니다.
+    """
+    if export_format == "parquet":
+        if not parquet_available():
+            raise HTTPException(status_code=501, detail="Parquet export requires the 'pyarrow' package")
+        if compression != "none":
+            raise HTTPException(status_code=400, detail="Parquet is already compressed; use compression=none")
+
+    def build_query(session: Session, columns):
+        return filtered_query(session, columns, filters)[0]
+
+    gzip = compression == "gzip"
+    filename = f"articles-{datetime.utcnow():%Y%m%dT%H%M%S}.{export_format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        stream_export(db.bind, build_query, export_format, gzip=gzip, include_raw=include_raw, limit=limit),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
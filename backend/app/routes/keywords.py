@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import Source
+from app.schemas import TopKeywordsResponse
+from app.services.keywords import top_keywords_query
+from app.services.response_cache import get_response_cache
+
+router = APIRouter(prefix="/keywords", tags=["keywords"])
+
+DbDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+@router.get("/top", response_model=TopKeywordsResponse)
+async def top_keywords(
+    request: Request,
+    db: DbDep,
+    from_date: Optional[datetime] = Query(None, alias="from", description="기본값: to - hours"),
+    to_date: Optional[datetime] = Query(None, alias="to", description="기본값: 현재 시각 (UTC)"),
+    hours: int = Query(24, ge=1, le=24 * 90, description="from을 생략했을 때의 기간"),
+    source: Optional[str] = Query(None, description="source name"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    기간 내 분석 기사 수 기준 상위 키워드.
+    키워드 역색인(analysis_keywords)의 기간 인덱스로 집계하므로 JSON 키워드 배열을 훑지 않습니다.
+    """
+    to_date = to_date or datetime.utcnow()
+    from_date = from_date or to_date - timedelta(hours=hours)
+    source_ids = select(Source.id).where(Source.name.ilike(f"%{source}%")) if source else None
+
+    async def build() -> bytes:
+        rows = (await db.execute(top_keywords_query(from_date, to_date, limit, source_ids))).all()
+        payload = {"from": from_date, "to": to_date, "items": [row._asdict() for row in rows]}
+        return TopKeywordsResponse.model_validate(payload).model_dump_json(by_alias=True).encode("utf-8")
+
+    return await get_response_cache().respond(request, build)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from app.services.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus 스크레이프용 텍스트 형식 메트릭."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
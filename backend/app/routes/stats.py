@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import Source
+from app.schemas import SentimentSeriesResponse, SourceStatsResponse
+from app.services.response_cache import get_response_cache
+from app.services.rollups import sentiment_series_query, source_stats_query
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+DbDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+@router.get("/sentiment", response_model=SentimentSeriesResponse)
+async def sentiment_series(
+    request: Request,
+    db: DbDep,
+    granularity: str = Query("day", pattern="^(hour|day)$", description="hour|day"),
+    sentiment: Optional[str] = Query(None, description="positive|neutral|negative"),
+    source: Optional[str] = Query(None, description="source name"),
+    from_date: Optional[datetime] = Query(None, alias="from"),
+    to_date: Optional[datetime] = Query(None, alias="to"),
+):
+    """
+    감성 추이: 시간 버킷 × 라벨별 기사 수와 평균/최소/최대 점수.
+    사전 집계된 롤업 테이블을 읽으므로 비용은 기사 수가 아니라 버킷 수에 비례합니다.
+    """
+    source_ids = select(Source.id).where(Source.name.ilike(f"%{source}%")) if source else None
+    stmt = sentiment_series_query(granularity, from_date, to_date, source_ids=source_ids, label=sentiment)
+
+    async def build() -> bytes:
+        rows = (await db.execute(stmt)).all()
+        payload = {"granularity": granularity, "items": [row._asdict() for row in rows]}
+        return SentimentSeriesResponse.model_validate(payload).model_dump_json().encode("utf-8")
+
+    return await get_response_cache().respond(request, build)
+
+
+@router.get("/sources", response_model=SourceStatsResponse)
+async def source_stats(
+    request: Request,
+    db: DbDep,
+    from_date: Optional[datetime] = Query(None, alias="from"),
+    to_date: Optional[datetime] = Query(None, alias="to"),
+):
+    """소스별 분석 기사 수, 평균/최소/최대 감성 점수, 라벨 분포 (일 단위 롤업 합산)."""
+
+    async def build() -> bytes:
+        items: dict[int, dict] = {}
+        for row in (await db.execute(source_stats_query(from_date, to_date))).all():
+            item = items.setdefault(
+                row.source_id,
+                {"source_id": row.source_id, "source_name": row.source_name, "count": 0, "score_sum": 0.0, "labels": {}},
+            )
+            item["count"] += row.count
+            item["score_sum"] += row.score_sum
+            item["labels"][row.sentiment_label] = row.count
+            item["min_score"] = min(item.get("min_score", row.min_score), row.min_score)
+            item["max_score"] = max(item.get("max_score", row.max_score), row.max_score)
+        for item in items.values():
+            item["mean_score"] = item.pop("score_sum") / item["count"] if item["count"] else None
+        return SourceStatsResponse.model_validate({"items": list(items.values())}).model_dump_json().encode("utf-8")
+
+    return await get_response_cache().respond(request, build)
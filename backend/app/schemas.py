@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -8,6 +8,16 @@ class HealthResponse(BaseModel):
     status: str = "ok"
 
 
+class ReadyResponse(BaseModel):
+    status: str  # ready | not_ready
+    schema_state: Optional[str] = None  # current | created | outdated | unversioned | empty
+    revision: Optional[str] = None
+    head: Optional[str] = None
+    connections_warmed: int = 0
+    elapsed_ms: float
+    detail: Optional[str] = None
+
+
 class SourceOut(BaseModel):
     id: int
     name: str
@@ -41,12 +51,39 @@ class ArticleListItem(BaseModel):
     sentiment_label: Optional[str] = None
     sentiment_score: Optional[float] = None
     keywords: Optional[list[str]] = None
+    # 근접 중복 묶음 (대표 기사 id, 묶음에 속한 기사 수)
+    cluster_id: Optional[int] = None
+    cluster_size: Optional[int] = None
 
     model_config = {"from_attributes": True}
 
 
 class ArticleListResponse(BaseModel):
     items: list[ArticleListItem]
+    next_cursor: Optional[str] = None
+
+
+class SentimentFacetOut(BaseModel):
+    sentiment_label: Optional[str] = None  # None: 분석 전 기사
+    count: int
+
+
+class SourceFacetOut(BaseModel):
+    source_id: int
+    source_name: str
+    count: int
+
+
+class DayFacetOut(BaseModel):
+    day: date
+    count: int
+
+
+class ArticleFacetsResponse(BaseModel):
+    total: int
+    sentiment: list[SentimentFacetOut]
+    sources: list[SourceFacetOut]
+    days: list[DayFacetOut]  # 발행일 기준, 기사가 없는 날은 생략
 
 
 class ArticleDetail(BaseModel):
@@ -106,4 +143,76 @@ class AnalysisResult(BaseModel):
 class IngestResponse(BaseModel):
     fetched: int
     analyzed: int
+    cache_hits: int = 0
+    cache_misses: int = 0
+    duplicates: int = 0
+
+
+class IngestJobOut(BaseModel):
+    id: str
+    trigger: str
+    status: str = Field(description="queued|running|succeeded|failed")
+    stage: Optional[str] = None
+    progress: dict[str, int] = Field(default_factory=dict)
+    stage_seconds: dict[str, float] = Field(default_factory=dict)
+    result: Optional[IngestResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+
+
+class RetentionResponse(BaseModel):
+    archived: int
+    deleted: int
+    deleted_analyses: int = 0
+    bytes_reclaimed: int = Field(0, description="지운 행의 JSON 직렬화 크기 합(압축 전, 근사값)")
+    archive_bytes: int = 0
+    archive_path: Optional[str] = None
+    cutoff: Optional[datetime] = None
+
+
+class RetentionJobOut(IngestJobOut):
+    result: Optional[RetentionResponse] = None
+
+
+class SentimentBucketOut(BaseModel):
+    bucket: datetime
+    sentiment_label: str
+    count: int
+    mean_score: float
+    min_score: float
+    max_score: float
+
+
+class SentimentSeriesResponse(BaseModel):
+    granularity: str
+    items: list[SentimentBucketOut]
+
+
+class SourceStatsOut(BaseModel):
+    source_id: int
+    source_name: str
+    count: int
+    mean_score: Optional[float] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    labels: dict[str, int] = Field(default_factory=dict)
+
+
+class SourceStatsResponse(BaseModel):
+    items: list[SourceStatsOut]
+
+
+class KeywordCountOut(BaseModel):
+    keyword: str
+    count: int
+
+
+class TopKeywordsResponse(BaseModel):
+    model_config = {"populate_by_name": True}
 
+    from_date: datetime = Field(alias="from")
+    to_date: datetime = Field(alias="to")
+    items: list[KeywordCountOut]
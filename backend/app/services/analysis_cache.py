@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import AnalysisCacheEntry
+from app.schemas import AnalysisResult
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_content(text: str) -> str:
+    """전각/반각, 대소문자, 공백 차이를 없앤 캐시 키용 본문."""
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip().lower()
+
+
+def cache_key(content: str, model_name: str, prompt_version: str) -> str:
+    raw = f"{prompt_version}\x00{model_name}\x00{normalize_content(content)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _model_size(value: Any) -> int:
+    return len(value.model_dump_json())
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class LruTtlCache:
+    """
+    항목 수, 대략적인 바이트 크기, TTL로 제한되는 in-process LRU 캐시.
+    값의 크기는 sizeof로 계산합니다 (기본값: pydantic 모델의 JSON 길이).
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        sizeof: Callable[[Any], int] = _model_size,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sizeof = sizeof
+        self._data: OrderedDict[str, _Entry] = OrderedDict()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return entry.value
+
+    def put(self, key: str, value: Any) -> None:
+        if key in self._data:
+            self._remove(key)
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+        self._data[key] = _Entry(value, size, self._clock() + self.ttl_seconds)
+        self.size_bytes += size
+        while len(self._data) > self.max_entries or self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._data)))
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key)
+        self.size_bytes -= entry.size
+
+
+class AnalysisCache:
+    """
+    2단계 분석 캐시: in-process LRU → DB(analysis_cache 테이블).
+    DB 쓰기는 세션에 추가만 하며 커밋은 호출자가 담당합니다.
+    """
+
+    def __init__(self, memory: LruTtlCache):
+        self.memory = memory
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get_many(self, db: Session, keys: Iterable[str]) -> dict[str, AnalysisResult]:
+        found: dict[str, AnalysisResult] = {}
+        remaining = []
+        for key in set(keys):
+            value = self.memory.get(key)
+            if value is not None:
+                found[key] = value
+                self.memory_hits += 1
+            else:
+                remaining.append(key)
+
+        if remaining:
+            rows = db.query(AnalysisCacheEntry).filter(AnalysisCacheEntry.key.in_(remaining)).all()
+            for row in rows:
+                value = AnalysisResult.model_validate(row.result)
+                found[row.key] = value
+                self.memory.put(row.key, value)
+                self.db_hits += 1
+            self.misses += len(remaining) - len(rows)
+        return found
+
+    def put(self, db: Session, key: str, value: AnalysisResult, model_name: str, prompt_version: str) -> None:
+        self.memory.put(key, value)
+        db.merge(
+            AnalysisCacheEntry(
+                key=key,
+                result=json.loads(value.model_dump_json()),
+                model_name=model_name,
+                prompt_version=prompt_version,
+            )
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size_bytes,
+        }
+
+
+@lru_cache
+def get_analysis_cache() -> AnalysisCache:
+    settings = get_settings()
+    return AnalysisCache(
+        LruTtlCache(
+            max_entries=settings.analysis_cache_max_entries,
+            max_bytes=settings.analysis_cache_max_bytes,
+            ttl_seconds=settings.analysis_cache_ttl_seconds,
+        )
+    )
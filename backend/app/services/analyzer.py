@@ -4,31 +4,63 @@ import json
 import logging
 import re
 import time
-from collections import deque
-from typing import Any, Deque
+from typing import Any
 
-import httpx
+from pydantic import ValidationError
 
 from app.config import get_settings
 from app.schemas import AnalyzeRequest, AnalysisResult
+from app.services.http_client import get_http_client, request_with_retries
+from app.services.metrics import GEMINI_REQUEST_DURATION, GEMINI_TOKENS
+from app.services.rate_limit import RateLimiter, estimate_tokens, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 # Use v1 API with gemini-2.5-flash model (1.5 models are retired as of 2026)
-GEMINI_URL = (
-    "https://generativelanguage.googleapis.com/v1/models/gemini-2.5-flash:generateContent"
+GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_PATH = f"/v1/models/{GEMINI_MODEL}:generateContent"
+# 프롬프트를 바꾸면 올려서 이전 분석 캐시를 무효화
+PROMPT_VERSION = "2026-01"
+
+BATCH_INPUT_HEADER = "입력 기사 목록:"
+
+_OUTPUT_OBJECT = (
+    "{\n"
+    '  "summary": "3-4문장의 요약 (수치와 주체 포함, 중립적 서술)",\n'
+    '  "sentiment": {\n'
+    '    "label": "positive 또는 neutral 또는 negative 중 하나",\n'
+    '    "score": -1.0에서 1.0 사이의 숫자\n'
+    '  },\n'
+    '  "keywords": ["키워드1", "키워드2", "키워드3"],\n'
+    '  "reason": "이 감성 점수를 부여한 이유",\n'
+    '  "safety_flag": false,\n'
+    '  "safety_reason": ""\n'
+    "}"
 )
 
+_RULES = (
+    "규칙:\n"
+    "1. 감성 label은 반드시 'positive', 'neutral', 'negative' 중 하나\n"
+    "2. 감성 score는 -1.0 ~ 1.0 범위의 숫자 (positive: 0.3~1.0, neutral: -0.3~0.3, negative: -1.0~-0.3)\n"
+    "3. keywords는 핵심 명사/표현 3~6개를 배열로\n"
+    "4. reason은 반드시 문자열로 제공 (빈 문자열이라도 \"\"로 제공)\n"
+    "5. safety_flag는 개인정보/민감 표현 발견 시 true, 아니면 false\n"
+    "6. safety_reason은 safety_flag가 true일 때만 내용 작성, 아니면 빈 문자열 \"\"\n"
+    "7. 절대 한글 필드명을 사용하지 마세요 (요약 X, summary O)\n"
+    "8. **중요: summary, reason 등의 텍스트에 큰따옴표(\")가 포함될 경우 반드시 작은따옴표(')로 대체하세요**\n"
+    '   예: "그는 "안녕"이라고 말했다" (X) → "그는 \'안녕\'이라고 말했다" (O)\n\n'
+)
 
-class AnalyzerClient:
-    _calls: Deque[float] = deque()
 
-    def __init__(self, api_key: str | None = None):
+class AnalyzerClient:
+    def __init__(self, api_key: str | None = None, base_url: str | None = None, limiter: RateLimiter | None = None):
         settings = get_settings()
         self.api_key = api_key or settings.gemini_api_key
         if not self.api_key:
             raise RuntimeError("GEMINI_API_KEY not configured")
-        self.rate_limit_per_min = settings.rate_limit_per_min
+        # 기본값은 프로세스 공용 리미터 (동시 analyze() 호출이 같은 예산을 공유)
+        self.limiter = limiter or get_rate_limiter()
+        self.url = (base_url or settings.gemini_base_url).rstrip("/") + GEMINI_PATH
 
     def _build_prompt(self, request: AnalyzeRequest) -> str:
         return (
@@ -36,52 +68,59 @@ class AnalyzerClient:
             "입력된 뉴스 기사를 분석하고, 아래의 **정확한 JSON 형식**으로만 응답하세요.\n\n"
             "**중요: 반드시 영어 필드명을 사용하고, 아래 예제와 동일한 구조로 응답해야 합니다.**\n\n"
             "출력 JSON 형식:\n"
-            "{\n"
-            '  "summary": "3-4문장의 요약 (수치와 주체 포함, 중립적 서술)",\n'
-            '  "sentiment": {\n'
-            '    "label": "positive 또는 neutral 또는 negative 중 하나",\n'
-            '    "score": -1.0에서 1.0 사이의 숫자\n'
-            '  },\n'
-            '  "keywords": ["키워드1", "키워드2", "키워드3"],\n'
-            '  "reason": "이 감성 점수를 부여한 이유",\n'
-            '  "safety_flag": false,\n'
-            '  "safety_reason": ""\n'
-            "}\n\n"
-            "규칙:\n"
-            "1. 감성 label은 반드시 'positive', 'neutral', 'negative' 중 하나\n"
-            "2. 감성 score는 -1.0 ~ 1.0 범위의 숫자 (positive: 0.3~1.0, neutral: -0.3~0.3, negative: -1.0~-0.3)\n"
-            "3. keywords는 핵심 명사/표현 3~6개를 배열로\n"
-            "4. reason은 반드시 문자열로 제공 (빈 문자열이라도 \"\"로 제공)\n"
-            "5. safety_flag는 개인정보/민감 표현 발견 시 true, 아니면 false\n"
-            "6. safety_reason은 safety_flag가 true일 때만 내용 작성, 아니면 빈 문자열 \"\"\n"
-            "7. 절대 한글 필드명을 사용하지 마세요 (요약 X, summary O)\n"
-            "8. **중요: summary, reason 등의 텍스트에 큰따옴표(\")가 포함될 경우 반드시 작은따옴표(')로 대체하세요**\n"
-            '   예: "그는 "안녕"이라고 말했다" (X) → "그는 \'안녕\'이라고 말했다" (O)\n\n'
+            f"{_OUTPUT_OBJECT}\n\n"
+            f"{_RULES}"
             f"입력 기사:\n{request.model_dump_json()}"
         )
 
-    async def analyze(self, request: AnalyzeRequest) -> AnalysisResult:
-        self._respect_rate_limit()
+    def _build_batch_prompt(self, requests: list[AnalyzeRequest]) -> str:
+        articles = [{"id": i, **req.model_dump()} for i, req in enumerate(requests)]
+        return (
+            "당신은 한국어 뉴스 요약/감성 분석기입니다.\n"
+            f"입력된 뉴스 기사 {len(requests)}건을 각각 독립적으로 분석하고, 아래의 **정확한 JSON 배열 형식**으로만 응답하세요.\n\n"
+            "**중요: 반드시 영어 필드명을 사용하고, 입력 기사마다 하나의 객체를 만들어 입력의 id를 그대로 넣으세요.**\n\n"
+            "출력 JSON 형식 (배열, 입력과 같은 순서):\n"
+            "[\n"
+            f'{{"id": 0, ...아래 객체의 필드...}},\n'
+            "...\n"
+            "]\n\n"
+            "각 객체의 필드:\n"
+            f"{_OUTPUT_OBJECT}\n\n"
+            f"{_RULES}"
+            f"{BATCH_INPUT_HEADER}\n{json.dumps(articles, ensure_ascii=False)}"
+        )
+
+    async def _generate(self, prompt: str) -> str:
+        await self.limiter.acquire(tokens=estimate_tokens(prompt))
         payload = {
             "contents": [
                 {
                     "parts": [
-                        {"text": self._build_prompt(request)},
+                        {"text": prompt},
                     ]
                 }
             ]
         }
         params = {"key": self.api_key}
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(GEMINI_URL, params=params, json=payload)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            resp = await request_with_retries(get_http_client("gemini"), "POST", self.url, params=params, json=payload)
             resp.raise_for_status()
             data = resp.json()
+            outcome = "ok"
+        finally:
+            GEMINI_REQUEST_DURATION.labels(outcome).observe(time.perf_counter() - started)
+        _record_usage(data.get("usageMetadata"))
 
         text = _extract_text(data)
-        logger.info(f"Raw Gemini response: {text[:500]}")  # Log first 500 chars
+        logger.debug("Raw Gemini response: %s", text[:500])
 
         # Strip markdown code blocks if present
-        text = _strip_markdown_json(text)
+        return _strip_markdown_json(text)
+
+    async def analyze(self, request: AnalyzeRequest) -> AnalysisResult:
+        text = await self._generate(self._build_prompt(request))
 
         try:
             parsed = json.loads(text)
@@ -91,17 +130,76 @@ class AnalyzerClient:
 
         return AnalysisResult(**parsed)
 
-    def _respect_rate_limit(self) -> None:
-        # 간단한 토큰 버킷: 1분 윈도우에서 설정된 호출 수를 초과하면 대기
-        now = time.time()
-        window = 60.0
-        while self._calls and now - self._calls[0] > window:
-            self._calls.popleft()
-        if len(self._calls) >= self.rate_limit_per_min:
-            sleep_time = window - (now - self._calls[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        self._calls.append(time.time())
+    async def analyze_batch(self, requests: list[AnalyzeRequest]) -> list[AnalysisResult | None]:
+        """
+        여러 기사를 한 번의 호출로 분석합니다. 결과 배열은 항목별로 검증하고,
+        누락/파싱 실패 항목은 단건 analyze()로 하나씩 다시 시도합니다. 단건도 실패하면 None입니다.
+        호출자가 잡은 동시성 슬롯 하나 안에서 실행되므로 재시도도 동시에 보내지 않습니다 (ANALYSIS_CONCURRENCY 유지).
+        """
+        if len(requests) == 1:
+            return [await self._analyze_or_none(requests[0])]
+
+        results: list[AnalysisResult | None] = [None] * len(requests)
+        try:
+            parsed = json.loads(await self._generate(self._build_batch_prompt(requests)))
+            if not isinstance(parsed, list):
+                raise ValueError("batch response is not a JSON array")
+            for item in parsed:
+                if not isinstance(item, dict):
+                    continue
+                idx = item.get("id")
+                if isinstance(idx, int) and 0 <= idx < len(requests) and results[idx] is None:
+                    try:
+                        results[idx] = AnalysisResult.model_validate(item)
+                    except ValidationError as exc:
+                        logger.warning("Batch item %s failed validation: %s", idx, exc)
+        except Exception as exc:
+            logger.warning("Batch analysis of %d articles failed, falling back to single calls: %s", len(requests), exc)
+
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = await self._analyze_or_none(requests[i])
+        return results
+
+    async def _analyze_or_none(self, request: AnalyzeRequest) -> AnalysisResult | None:
+        try:
+            return await self.analyze(request)
+        except Exception as exc:  # pragma: no cover - 모니터링 목적
+            logger.exception("Analyze failed: %s", exc)
+            return None
+
+
+def pack_batches(requests: list[AnalyzeRequest], batch_size: int, max_chars: int) -> list[list[int]]:
+    """
+    요청 인덱스를 배치로 묶습니다. 배치당 최대 batch_size건, 본문 합계 max_chars자 이하이며
+    max_chars보다 긴 기사는 단독 배치가 됩니다.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_chars = 0
+    for i, req in enumerate(requests):
+        size = len(req.article.content)
+        if current and (len(current) >= batch_size or current_chars + size > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(i)
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+# usageMetadata 필드 → gemini_tokens_total{type}
+_USAGE_FIELDS = {"promptTokenCount": "prompt", "candidatesTokenCount": "completion", "thoughtsTokenCount": "thoughts"}
+
+
+def _record_usage(usage: Any) -> None:
+    if not isinstance(usage, dict):
+        return
+    for field, kind in _USAGE_FIELDS.items():
+        count = usage.get(field)
+        if isinstance(count, int) and count > 0:
+            GEMINI_TOKENS.labels(kind).inc(count)
 
 
 def _extract_text(response_json: dict[str, Any]) -> str:
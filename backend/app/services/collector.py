@@ -0,0 +1,146 @@
+"""
+수집 대상(NEWSDATA.io 쿼리, RSS 피드) fan-out.
+
+대상 목록은 설정(NEWSDATA_QUERIES, RSS_FEEDS)에서 만들고 모두 동시에 가져오므로, 수집 시간은 대상별 시간의 합이 아니라
+가장 느린 대상에 맞춰집니다. 같은 호스트로 가는 요청은 FETCH_PER_HOST_CONCURRENCY개까지만 동시에 나가고
+(http_clients.host_slot), 한 대상이 실패해도 나머지 대상의 결과는 그대로 사용합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from app.config import Settings, get_settings
+from app.services.metrics import FETCH_DURATION
+from app.services.news_fetcher import CreditBudget, NewsdataWalk, NormalizedArticle, iter_newsdata_news
+from app.services.rss import fetch_feed
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchTarget:
+    kind: str  # "newsdata" | "rss"
+    name: str  # NEWSDATA 쿼리 문자열 또는 피드 이름 (로그/리포트용)
+    url: str = ""  # RSS 피드 URL
+    params: dict[str, str] = field(default_factory=dict)  # NEWSDATA 쿼리 파라미터
+
+    @property
+    def label(self) -> str:
+        return f"{self.kind}:{self.name}"
+
+
+@dataclass
+class FetchReport:
+    items: List[NormalizedArticle] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    not_modified: list[str] = field(default_factory=list)
+    # NEWSDATA 쿼리별 페이지 순회 결과 (대상 label → walk)
+    newsdata_walks: dict[str, NewsdataWalk] = field(default_factory=dict)
+
+    @property
+    def newsdata_complete(self) -> bool:
+        """모든 NEWSDATA 쿼리가 실패 없이 워터마크 또는 마지막 페이지까지 읽었는지."""
+        if any(label.startswith("newsdata:") for label in self.failed):
+            return False
+        return all(walk.complete for walk in self.newsdata_walks.values())
+
+    def newsdata_watermark(self, since: Optional[datetime]) -> Optional[datetime]:
+        """
+        이번 회차 뒤에 둘 NEWSDATA 워터마크를 돌려줍니다 (None이면 그대로 둠).
+        모든 쿼리가 끝까지 읽었으면 이번에 본 가장 최신 발행 시각으로 올립니다.
+        한도로 중간에 멈춘 쿼리가 있으면 since와 가장 오래된 기사 사이를 아직 못 받았으므로 그대로 두고,
+        워터마크가 없던 첫 회차만 멈춘 쿼리들이 받은 가장 오래된 시각까지 올립니다 (그보다 오래된 기사는 받지 않음).
+        """
+        if any(label.startswith("newsdata:") for label in self.failed):
+            return None
+        if self.newsdata_complete:
+            newest = [item.published_at for item in self.items if item.source_name.startswith("newsdata:")]
+            return max((p for p in newest if p is not None), default=None)
+        if since is not None:
+            return None
+        oldest = [walk.oldest for walk in self.newsdata_walks.values() if not walk.complete]
+        if any(value is None for value in oldest):
+            return None
+        return min(oldest)
+
+
+def _feed_target(entry: str) -> FetchTarget:
+    # "이름=URL" 또는 URL (이름이 없으면 호스트명)
+    name, sep, url = entry.partition("=")
+    if not sep or "://" in name:
+        name, url = urlsplit(entry).hostname or entry, entry
+    return FetchTarget(kind="rss", name=name.strip(), url=url.strip())
+
+
+def build_targets(settings: Settings, newsdata_key: Optional[str]) -> list[FetchTarget]:
+    """설정의 NEWSDATA 쿼리(API 키가 있을 때만)와 RSS 피드로 수집 대상 목록을 만듭니다."""
+    targets: list[FetchTarget] = []
+    if newsdata_key:
+        for query in settings.newsdata_queries:
+            targets.append(FetchTarget(kind="newsdata", name=query, params=dict(parse_qsl(query))))
+    targets.extend(_feed_target(entry) for entry in settings.rss_feeds)
+    return targets
+
+
+async def _fetch_target(
+    target: FetchTarget,
+    newsdata_key: Optional[str],
+    since: Optional[datetime],
+    budget: CreditBudget,
+    walk: Optional[NewsdataWalk] = None,
+) -> Optional[List[NormalizedArticle]]:
+    if target.kind == "rss":
+        return await fetch_feed(target.url, f"rss:{target.name}")
+    return [
+        item
+        async for item in iter_newsdata_news(newsdata_key, since=since, budget=budget, query=target.params, walk=walk)
+    ]
+
+
+async def fetch_sources(
+    newsdata_key: Optional[str],
+    since: Optional[datetime] = None,
+    targets: Optional[list[FetchTarget]] = None,
+) -> FetchReport:
+    """
+    수집 대상을 모두 동시에 가져옵니다. since(NEWSDATA 워터마크)는 NEWSDATA 쿼리에만 적용되고,
+    NEWSDATA 크레딧 한도(newsdata_max_credits)는 회차 전체에서 공유합니다.
+    대상 순서대로 결과를 이어 붙이며, 여러 쿼리에 걸친 같은 기사는 저장 단계에서 hash로 걸러집니다.
+    """
+    settings = get_settings()
+    if targets is None:
+        targets = build_targets(settings, newsdata_key)
+    budget = CreditBudget(settings.newsdata_max_credits)
+    # 크레딧을 나눠 쓰는 쿼리마다 끝까지 읽었는지 따로 기록
+    report = FetchReport(
+        newsdata_walks={target.label: NewsdataWalk() for target in targets if target.kind == "newsdata"}
+    )
+
+    async def _timed(target: FetchTarget):
+        started = time.perf_counter()
+        try:
+            items = await _fetch_target(target, newsdata_key, since, budget, report.newsdata_walks.get(target.label))
+        except Exception as e:
+            logger.warning("Failed to fetch %s: %s", target.label, e)
+            FETCH_DURATION.labels(target.kind, "error").observe(time.perf_counter() - started)
+            return e
+        FETCH_DURATION.labels(target.kind, "ok" if items is not None else "not_modified").observe(
+            time.perf_counter() - started
+        )
+        return items
+
+    results = await asyncio.gather(*(_timed(target) for target in targets))
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            report.failed.append(target.label)
+        elif result is None:
+            report.not_modified.append(target.label)
+        else:
+            report.items.extend(result)
+    return report
@@ -0,0 +1,207 @@
+"""
+근접 중복 기사 탐지 (통신사 기사를 조금씩 고쳐 재배포한 기사 등).
+
+본문을 단어 2-gram(어절 쌍) 집합으로 보고 One Permutation MinHash(빈 64개)로 서명을 만든 뒤,
+LSH 밴딩(빈 4개씩 밴드 16개)으로 후보를 찾고 추정 자카드 유사도가 임계값 이상이면 같은 묶음으로 배정합니다.
+서명과 밴드 버킷은 DB(story_signatures, story_bands)에 저장되어 수집 회차를 넘어 비교됩니다.
+묶음 id는 대표(처음 저장된) 기사의 id입니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import operator
+import re
+import struct
+import sys
+import zlib
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Article, StoryBand, StorySignature
+
+SHINGLE_SIZE = 2
+NUM_BINS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_BINS // BANDS
+# 이보다 shingle이 적은 본문은 서명을 만들지 않음 (짧은 요약문끼리 잘못 묶이지 않도록)
+MIN_SHINGLES = 24
+# 흔한 어구만으로 이뤄진 밴드는 관련 없는 기사가 계속 쌓이므로, 이보다 큰 버킷은 후보에서 제외 (불용어처럼 취급)
+MAX_BUCKET_SIZE = 200
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_BIN_MASK = NUM_BINS - 1
+_SIGNATURE = struct.Struct(f"<{NUM_BINS}I")
+_BAND = struct.Struct(f"<B{ROWS_PER_BAND}I")
+_CHUNK_SIZE = 500
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+Signature = tuple[int, ...]
+
+
+def _shingle_hashes(text: str) -> set[int]:
+    # 문자 n-gram은 관련 없는 기사끼리도 흔한 어구(~했다, ~것으로)를 많이 공유해 LSH 후보가 급증하므로 단어 단위로 자른다
+    tokens = _TOKEN_RE.findall(text.lower())
+    shingles = (" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1))
+    return set(map(zlib.crc32, (shingle.encode("utf-8") for shingle in shingles)))
+
+
+def signature(text: Optional[str]) -> Optional[Signature]:
+    """
+    One Permutation MinHash 서명. 해시 하위 비트로 빈을 고르고 빈마다 최솟값을 남깁니다.
+    빈 빈은 오른쪽 이웃 빈의 값을 빌려 채웁니다 (rotation densification).
+    """
+    if not text:
+        return None
+    hashes = _shingle_hashes(text)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    # 내림차순으로 덮어쓰면 빈마다 가장 작은 해시가 남는다
+    mins = {h & _BIN_MASK: h >> _BIN_BITS for h in sorted(hashes, reverse=True)}
+    bins = [mins.get(i) for i in range(NUM_BINS)]
+    for i in range(NUM_BINS):
+        if bins[i] is None:
+            for step in range(1, NUM_BINS):
+                borrowed = mins.get((i + step) & _BIN_MASK)
+                if borrowed is not None:
+                    # 빈 값은 (32 - _BIN_BITS)비트이므로 남는 상위 비트에 거리를 넣어 구분
+                    bins[i] = borrowed | (step << (32 - _BIN_BITS))
+                    break
+    return tuple(bins)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """추정 자카드 유사도 (같은 값을 가진 빈의 비율)."""
+    return sum(map(operator.eq, a, b)) / NUM_BINS
+
+
+def band_buckets(sig: Signature) -> list[int]:
+    """밴드별 버킷 키 (부호 있는 64비트, 밴드 번호 포함)."""
+    keys = []
+    for band in range(BANDS):
+        start = band * ROWS_PER_BAND
+        packed = _BAND.pack(band, *sig[start:start + ROWS_PER_BAND])
+        keys.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), "little", signed=True))
+    return keys
+
+
+def pack_signature(sig: Signature) -> bytes:
+    return _SIGNATURE.pack(*sig)
+
+
+def unpack_signature(data: bytes) -> Signature:
+    return _SIGNATURE.unpack(data)
+
+
+def _candidates(db: Session, buckets: set[int]) -> dict[int, list[int]]:
+    index: dict[int, list[int]] = defaultdict(list)
+    keys = list(buckets)
+    for i in range(0, len(keys), _CHUNK_SIZE):
+        # 큰 버킷은 인덱스에서 개수만 세고 행은 가져오지 않는다
+        small = (
+            select(StoryBand.bucket)
+            .where(StoryBand.bucket.in_(keys[i:i + _CHUNK_SIZE]))
+            .group_by(StoryBand.bucket)
+            .having(func.count() <= MAX_BUCKET_SIZE)
+        )
+        for bucket, article_id in db.execute(select(StoryBand.bucket, StoryBand.article_id).where(StoryBand.bucket.in_(small))):
+            index[bucket].append(article_id)
+    return index
+
+
+def _stored(db: Session, article_ids: list[int]) -> dict[int, tuple[Signature, Optional[int]]]:
+    stored: dict[int, tuple[Signature, Optional[int]]] = {}
+    for i in range(0, len(article_ids), _CHUNK_SIZE):
+        rows = db.execute(
+            select(StorySignature.article_id, StorySignature.signature, Article.cluster_id)
+            .join(Article, Article.id == StorySignature.article_id)
+            .where(StorySignature.article_id.in_(article_ids[i:i + _CHUNK_SIZE]))
+        )
+        for article_id, data, cluster_id in rows:
+            stored[article_id] = (unpack_signature(data), cluster_id)
+    return stored
+
+
+def assign_clusters(db: Session, articles: Iterable[tuple[int, Optional[str]]], threshold: float) -> dict[int, int]:
+    """
+    새 기사들을 근접 중복 묶음에 배정하고 {article_id: cluster_id}를 반환한 뒤 커밋합니다.
+    기존 기사 또는 같은 배치의 앞선 기사와 추정 유사도가 threshold 이상이면 그 묶음에 합류하고,
+    아니면 자기 자신이 대표인 새 묶음이 됩니다. 서명을 만들 수 없는 짧은 본문은 결과에 없습니다.
+    """
+    signed = [(article_id, sig) for article_id, text in articles if (sig := signature(text)) is not None]
+    if not signed:
+        return {}
+    buckets = {article_id: band_buckets(sig) for article_id, sig in signed}
+
+    index = _candidates(db, {key for keys in buckets.values() for key in keys})
+    stored = _stored(db, sorted({article_id for ids in index.values() for article_id in ids}))
+
+    assigned: dict[int, int] = {}
+    for article_id, sig in signed:
+        best_id, best_score = None, threshold
+        for candidate in {c for key in buckets[article_id] for c in index.get(key, ())}:
+            if candidate not in stored:
+                continue
+            score = similarity(sig, stored[candidate][0])
+            if score > best_score or (score == best_score and best_id is None):
+                best_id, best_score = candidate, score
+        cluster_id = (stored[best_id][1] or best_id) if best_id is not None else article_id
+        assigned[article_id] = cluster_id
+        # 같은 배치의 뒤따르는 기사가 이 기사와도 비교되도록 메모리 색인에 추가
+        stored[article_id] = (sig, cluster_id)
+        for key in buckets[article_id]:
+            index[key].append(article_id)
+
+    db.execute(
+        insert(StorySignature), [{"article_id": article_id, "signature": pack_signature(sig)} for article_id, sig in signed]
+    )
+    db.execute(
+        insert(StoryBand),
+        [{"bucket": key, "article_id": article_id} for article_id, keys in buckets.items() for key in set(keys)],
+    )
+    db.execute(update(Article), [{"id": article_id, "cluster_id": cluster} for article_id, cluster in assigned.items()])
+    db.commit()
+    return assigned
+
+
+def delete_article_signatures(db: Session, article_ids: Iterable[int]) -> None:
+    ids = list(article_ids)
+    if ids:
+        db.execute(delete(StoryBand).where(StoryBand.article_id.in_(ids)))
+        db.execute(delete(StorySignature).where(StorySignature.article_id.in_(ids)))
+
+
+def rebuild_clusters(db: Session, threshold: float, chunk_size: int = 1000) -> int:
+    """
+    전체 기사의 서명과 묶음을 id 순서로 다시 만듭니다 (가장 먼저 저장된 기사가 대표). 배정한 기사 수를 반환합니다.
+    기존 분석 결과는 건드리지 않습니다.
+    """
+    db.execute(delete(StoryBand))
+    db.execute(delete(StorySignature))
+    db.execute(update(Article).values(cluster_id=None))
+    db.commit()
+    total, last_id = 0, 0
+    while True:
+        rows = db.execute(
+            select(Article.id, Article.content_clean).where(Article.id > last_id).order_by(Article.id).limit(chunk_size)
+        ).all()
+        if not rows:
+            return total
+        total += len(assign_clusters(db, [tuple(row) for row in rows], threshold))
+        last_id = rows[-1].id
+
+
+if __name__ == "__main__":
+    # python -m app.services.dedup rebuild
+    from app.config import get_settings
+    from app.database import get_sessionmaker
+
+    if sys.argv[1:] != ["rebuild"]:
+        sys.exit("usage: python -m app.services.dedup rebuild")
+    session = get_sessionmaker()()
+    try:
+        print(f"clustered {rebuild_clusters(session, get_settings().story_dedup_threshold)} articles")
+    finally:
+        session.close()
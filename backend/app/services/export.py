@@ -0,0 +1,208 @@
+"""
+기사/분석 전체 내보내기 (CSV, NDJSON, Parquet).
+
+행은 서버 측 커서(`yield_per`, PostgreSQL은 named cursor)로 EXPORT_BATCH_SIZE건씩 받아 바로 인코딩해 흘려보내므로,
+내보내는 행 수와 관계없이 메모리는 배치 하나 분량으로 일정합니다 (`python -m benchmarks.bench_export`로 확인).
+gzip은 zlib 스트림 압축이라 마찬가지로 전체를 모으지 않습니다. Parquet은 pyarrow가 설치된 경우에만 지원하며,
+배치마다 row group 하나를 써서 내보냅니다.
+"""
+from __future__ import annotations
+
+import csv
+import importlib.util
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from app.models import Analysis, Article, Source
+
+EXPORT_BATCH_SIZE = 1000
+FORMATS = ("csv", "ndjson", "parquet")
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson", "parquet": "application/vnd.apache.parquet"}
+
+# 목록 API와 달리 분석 메타데이터와 정제 본문까지 포함
+EXPORT_COLUMNS = (
+    Article.id,
+    Source.name.label("source"),
+    Article.title,
+    Article.link,
+    Article.published_at,
+    Article.created_at,
+    Article.content_clean,
+    Article.cluster_id,
+    Analysis.summary,
+    Analysis.sentiment_label,
+    Analysis.sentiment_score,
+    Analysis.keywords,
+    Analysis.json_meta,
+    Analysis.model_name,
+    Analysis.created_at.label("analyzed_at"),
+)
+RAW_COLUMN = Article.content_raw
+
+
+def parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def column_names(include_raw: bool) -> list[str]:
+    names = [column.key for column in EXPORT_COLUMNS]
+    return names + ["content_raw"] if include_raw else names
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class CsvEncoder:
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+
+    @staticmethod
+    def _write(rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def start(self) -> bytes:
+        return self._write([self.names])
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        # 목록/객체(keywords, json_meta)는 JSON 문자열, 시각은 ISO 8601, NULL은 빈 칸
+        return self._write([_cell(value) for value in row] for row in rows)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class NdjsonEncoder:
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+
+    def start(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        names = self.names
+        lines = []
+        for row in rows:
+            record = {name: value.isoformat() if isinstance(value, datetime) else value for name, value in zip(names, row)}
+            lines.append(json.dumps(record, ensure_ascii=False))
+        return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모았다가 배치마다 꺼내 가는 출력 스트림."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+class ParquetEncoder:
+    def __init__(self, names: Sequence[str]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            "id": pa.int64(),
+            "cluster_id": pa.int64(),
+            "sentiment_score": pa.float64(),
+            "keywords": pa.list_(pa.string()),
+            "published_at": pa.timestamp("us"),
+            "created_at": pa.timestamp("us"),
+            "analyzed_at": pa.timestamp("us"),
+        }
+        self.names = list(names)
+        self._pa = pa
+        self._schema = pa.schema([(name, types.get(name, pa.string())) for name in self.names])
+        self._json_index = self.names.index("json_meta")
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def start(self) -> bytes:
+        return self._sink.drain()
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in self.names]
+        json_column = columns[self._json_index]
+        columns[self._json_index] = [json.dumps(v, ensure_ascii=False) if v is not None else None for v in json_column]
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+ENCODERS = {"csv": CsvEncoder, "ndjson": NdjsonEncoder, "parquet": ParquetEncoder}
+
+
+def export_query(build_query: Callable[[Session, tuple], Query], session: Session, include_raw: bool) -> Query:
+    columns = EXPORT_COLUMNS + (RAW_COLUMN,) if include_raw else EXPORT_COLUMNS
+    return build_query(session, columns).join(Source, Source.id == Article.source_id).order_by(Article.id)
+
+
+async def stream_export(
+    bind,
+    build_query: Callable[[Session, tuple], Query],
+    fmt: str,
+    gzip: bool = False,
+    include_raw: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    limit: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    build_query(session, columns)가 만든 필터 쿼리를 id 순으로 내보냅니다.
+    요청 스코프 세션은 응답 전송 전에 닫히므로 같은 엔진에 스트리밍 전용 세션을 엽니다.
+    """
+    encoder = ENCODERS[fmt](column_names(include_raw))
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if gzip else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor is not None and data else data
+
+    head = emit(encoder.start())
+    if head:
+        yield head
+    async with AsyncSession(bind=bind) as db:
+        query = export_query(build_query, db.sync_session, include_raw)
+        if limit:
+            query = query.limit(limit)
+        result = await db.stream(query.statement.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            chunk = emit(encoder.encode(rows))
+            if chunk:
+                yield chunk
+    tail = emit(encoder.finish())
+    if compressor is not None:
+        tail += compressor.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config import get_settings
+from app.services.metrics import REGISTRY, render_histogram
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 (연결 실패는 transport 레벨에서 재시도)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 호출 지연 히스토그램 버킷 상한(초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(frozen=True)
+class ServiceConfig:
+    timeout: float
+    max_connections: int
+
+
+class LatencyHistogram:
+    """서비스별 누적 지연 히스토그램 (버킷별 개수, 합계, 건수)."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._counts: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+
+    def observe(self, service: str, seconds: float) -> None:
+        counts = self._counts.setdefault(service, [0] * (len(self.buckets) + 1))
+        counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self._sums[service] = self._sums.get(service, 0.0) + seconds
+
+    def series(self) -> list[tuple[tuple[str], list[int], float]]:
+        """(서비스, 버킷별 개수, 합계) 목록 (Prometheus 렌더링용)."""
+        return [((service,), list(counts), self._sums[service]) for service, counts in sorted(self._counts.items())]
+
+    def snapshot(self) -> dict[str, dict]:
+        result = {}
+        for service, counts in self._counts.items():
+            labels = [f"le_{b}" for b in self.buckets] + ["le_inf"]
+            total = sum(counts)
+            result[service] = {
+                "count": total,
+                "mean_seconds": round(self._sums[service] / total, 6) if total else 0.0,
+                "buckets": dict(zip(labels, counts)),
+            }
+        return result
+
+
+class _TimedTransport(httpx.AsyncBaseTransport):
+    """요청 전송~응답 헤더 수신까지 걸린 시간을 기록하는 transport 래퍼 (연결/TLS 핸드셰이크 포함)."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, service: str, histogram: LatencyHistogram):
+        self._inner = inner
+        self._service = service
+        self._histogram = histogram
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            return await self._inner.handle_async_request(request)
+        finally:
+            self._histogram.observe(self._service, time.perf_counter() - started)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class HttpClientRegistry:
+    """
+    외부 API별로 keep-alive 연결 풀을 공유하는 httpx.AsyncClient 레지스트리.
+    앱 lifespan(startup/shutdown)에서 관리되며, 테스트는 configure(transport=...)로 mock transport를 주입합니다.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._closing: set[asyncio.Task] = set()
+        self.latency = LatencyHistogram()
+
+    def configure(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """모든 서비스 클라이언트가 사용할 transport를 지정합니다. (None이면 실제 네트워크)"""
+        self._transport = transport
+        self._clients = {}
+
+    def _service_configs(self) -> dict[str, ServiceConfig]:
+        settings = get_settings()
+        per_host = settings.http_max_connections_per_host
+        return {
+            "gemini": ServiceConfig(timeout=settings.gemini_timeout, max_connections=per_host),
+            "newsdata": ServiceConfig(timeout=settings.newsdata_timeout, max_connections=per_host),
+            # RSS는 모든 피드 호스트가 풀 하나를 공유 (호스트별 한도가 아니라 전체 한도, 호스트별은 host_slot)
+            "rss": ServiceConfig(timeout=settings.rss_timeout, max_connections=per_host * 4),
+        }
+
+    def _build(self, service: str) -> httpx.AsyncClient:
+        settings = get_settings()
+        config = self._service_configs().get(service)
+        if config is None:
+            raise KeyError(f"Unknown HTTP service: {service}")
+
+        transport = self._transport
+        if transport is None:
+            http2 = settings.http2 and importlib.util.find_spec("h2") is not None
+            if settings.http2 and not http2:
+                logger.warning("HTTP2 requested but 'h2' package is not installed; using HTTP/1.1")
+            transport = httpx.AsyncHTTPTransport(
+                http2=http2,
+                retries=settings.http_retries,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+            )
+        return httpx.AsyncClient(
+            transport=_TimedTransport(transport, service, self.latency),
+            timeout=config.timeout,
+        )
+
+    def _bind_loop(self) -> None:
+        # 연결 풀과 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면(테스트, 스크립트) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            stale, self._clients = list(self._clients.values()), {}
+            self._host_slots = {}
+            self._loop = loop
+            if stale:
+                task = loop.create_task(self._close_stale(stale))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_stale(clients: list[httpx.AsyncClient]) -> None:
+        """이전 루프의 클라이언트를 닫아 풀의 연결을 정리합니다 (루프가 이미 닫혔으면 소켓 종료에서 나는 오류는 무시)."""
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.debug("Error closing HTTP client from a previous event loop: %s", exc)
+
+    def get(self, service: str) -> httpx.AsyncClient:
+        self._bind_loop()
+        client = self._clients.get(service)
+        if client is None or client.is_closed:
+            client = self._clients[service] = self._build(service)
+        return client
+
+    def host_slot(self, url: str) -> asyncio.Semaphore:
+        """
+        URL 호스트(host:port)별 동시 요청 한도 (fetch_per_host_concurrency).
+        수집 대상은 모두 동시에 진행되므로, 같은 호스트의 여러 쿼리/피드가 한 서버에 몰리지 않게 요청마다 잡습니다.
+        """
+        self._bind_loop()
+        host = urlsplit(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(max(1, get_settings().fetch_per_host_concurrency))
+        return slot
+
+    async def startup(self) -> None:
+        for service in self._service_configs():
+            self.get(service)
+
+    async def aclose(self) -> None:
+        self._bind_loop()
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._closing if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending)
+
+    def stats(self) -> dict:
+        return {"open_clients": sorted(self._clients), "latency": self.latency.snapshot()}
+
+
+http_clients = HttpClientRegistry()
+REGISTRY.register_collector(
+    lambda: render_histogram(
+        "http_client_request_duration_seconds",
+        "Outbound HTTP request latency per service (each attempt, headers received).",
+        http_clients.latency.buckets,
+        ("service",),
+        http_clients.latency.series(),
+    )
+)
+
+
+def get_http_client(service: str) -> httpx.AsyncClient:
+    return http_clients.get(service)
+
+
+async def request_with_retries(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """429/5xx 응답을 지수 백오프로 최대 http_retries회 재시도합니다. 마지막 응답을 그대로 반환합니다."""
+    settings = get_settings()
+    attempt = 0
+    while True:
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUS or attempt >= settings.http_retries:
+            return response
+        await response.aclose()
+        await asyncio.sleep(settings.http_retry_backoff * (2 ** attempt))
+        attempt += 1
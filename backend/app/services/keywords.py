@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sys
+import unicodedata
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import Select, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, AnalysisKeyword, Article, Keyword
+
+MAX_TERM_LENGTH = 128
+
+# (article_id, 발행 시각, 분석 키워드 목록)
+KeywordRow = tuple[int, datetime, Optional[Iterable[str]]]
+
+
+def normalize_keyword(term: str) -> str:
+    """키워드 정규화: NFKC, 소문자, 연속 공백 하나로. 색인과 필터가 같은 규칙을 쓴다."""
+    return " ".join(unicodedata.normalize("NFKC", term).lower().split())[:MAX_TERM_LENGTH]
+
+
+def _insert_ignore(db: Session, model):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing()
+    return None
+
+
+def _keyword_ids(db: Session, terms: list[str], chunk_size: int = 500) -> dict[str, int]:
+    """키워드 id를 조회하고 없는 키워드는 새로 만듭니다 (동시 수집과 경합해도 중복 없이)."""
+    ids: dict[str, int] = {}
+    for i in range(0, len(terms), chunk_size):
+        chunk = terms[i:i + chunk_size]
+        ids.update(db.execute(select(Keyword.term, Keyword.id).where(Keyword.term.in_(chunk))).all())
+    missing = [{"term": term} for term in terms if term not in ids]
+    if missing:
+        stmt = _insert_ignore(db, Keyword)
+        db.execute(stmt if stmt is not None else insert(Keyword), missing)
+        created = [row["term"] for row in missing]
+        for i in range(0, len(created), chunk_size):
+            chunk = created[i:i + chunk_size]
+            ids.update(db.execute(select(Keyword.term, Keyword.id).where(Keyword.term.in_(chunk))).all())
+    return ids
+
+
+def index_keywords(db: Session, rows: Iterable[KeywordRow]) -> int:
+    """
+    분석 키워드를 역색인에 추가하고 추가한 항목 수를 반환합니다.
+    커밋은 호출자가 담당하므로 분석 INSERT와 같은 트랜잭션에 묶입니다.
+    """
+    postings: dict[tuple[int, str], datetime] = {}
+    for article_id, published_at, keywords in rows:
+        for raw in keywords or []:
+            term = normalize_keyword(raw) if isinstance(raw, str) else ""
+            if term:
+                postings[(article_id, term)] = published_at
+    if not postings:
+        return 0
+
+    ids = _keyword_ids(db, sorted({term for _, term in postings}))
+    values = [
+        {"keyword_id": ids[term], "article_id": article_id, "published_at": published_at}
+        for (article_id, term), published_at in postings.items()
+    ]
+    stmt = _insert_ignore(db, AnalysisKeyword)
+    db.execute(stmt if stmt is not None else insert(AnalysisKeyword), values)
+    return len(values)
+
+
+def delete_article_keywords(db: Session, article_ids: Iterable[int]) -> None:
+    ids = list(article_ids)
+    if ids:
+        db.execute(delete(AnalysisKeyword).where(AnalysisKeyword.article_id.in_(ids)))
+
+
+def rebuild_keyword_index(db: Session, chunk_size: int = 1000) -> int:
+    """analyses.keywords 전체에서 역색인을 다시 만듭니다. 추가한 항목 수를 반환합니다."""
+    db.execute(delete(AnalysisKeyword))
+    rows = db.execute(
+        select(Analysis.article_id, func.coalesce(Article.published_at, Article.created_at), Analysis.keywords)
+        .join(Article, Article.id == Analysis.article_id)
+        .order_by(Analysis.article_id)
+        .execution_options(yield_per=chunk_size)
+    )
+    total = 0
+    for partition in rows.partitions():
+        total += index_keywords(db, [tuple(row) for row in partition])
+    # 더 이상 쓰이지 않는 키워드 정리
+    db.execute(delete(Keyword).where(~Keyword.id.in_(select(AnalysisKeyword.keyword_id))))
+    db.commit()
+    return total
+
+
+def _like_prefix(term: str) -> str:
+    # 사용자 입력의 LIKE 와일드카드(%, _)와 이스케이프 문자를 글자 그대로 취급.
+    # 백슬래시는 standard_conforming_strings 설정에 따라 리터럴 해석이 달라지므로 '/'로 이스케이프
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
+
+
+def keyword_article_ids(term: str, prefix: bool = False, dialect: str = "sqlite") -> Select:
+    """
+    키워드가 붙은 article_id 서브쿼리. prefix=True면 접두어 일치.
+    PostgreSQL은 로케일 정렬에서 범위 조건이 접두어와 맞지 않으므로 LIKE 'term%'(text_pattern_ops 인덱스),
+    SQLite는 바이트 순서(BINARY) 정렬이므로 유니크 인덱스 범위 검색을 씁니다.
+    """
+    normalized = normalize_keyword(term)
+    if prefix and dialect == "postgresql":
+        matched = Keyword.term.like(_like_prefix(normalized), escape="/")
+    elif prefix:
+        # SQLite의 LIKE는 대소문자를 무시하므로 인덱스를 타지 않는다
+        matched = Keyword.term.between(normalized, normalized + "\U0010ffff")
+    else:
+        matched = Keyword.term == normalized
+    return select(AnalysisKeyword.article_id).join(Keyword, Keyword.id == AnalysisKeyword.keyword_id).where(matched)
+
+
+def top_keywords_query(
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    limit: int = 20,
+    source_ids: Optional[Select] = None,
+) -> Select:
+    """기간 내 기사 수 기준 상위 키워드 (analysis_keywords의 (published_at, keyword_id) 인덱스 사용)."""
+    count = func.count().label("count")
+    hits = select(AnalysisKeyword.keyword_id, count).group_by(AnalysisKeyword.keyword_id)
+    if from_date:
+        hits = hits.where(AnalysisKeyword.published_at >= from_date)
+    if to_date:
+        hits = hits.where(AnalysisKeyword.published_at <= to_date)
+    if source_ids is not None:
+        hits = hits.where(
+            AnalysisKeyword.article_id.in_(select(Article.id).where(Article.source_id.in_(source_ids)))
+        )
+    hits = hits.order_by(count.desc(), AnalysisKeyword.keyword_id).limit(limit).subquery("hits")
+    return (
+        select(Keyword.term.label("keyword"), hits.c.count)
+        .join(hits, hits.c.keyword_id == Keyword.id)
+        .order_by(hits.c.count.desc(), Keyword.term)
+    )
+
+
+if __name__ == "__main__":
+    # python -m app.services.keywords rebuild
+    from app.database import get_sessionmaker
+
+    if sys.argv[1:] != ["rebuild"]:
+        sys.exit("usage: python -m app.services.keywords rebuild")
+    session = get_sessionmaker()()
+    try:
+        print(f"indexed {rebuild_keyword_index(session)} article keywords")
+    finally:
+        session.close()
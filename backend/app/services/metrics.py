@@ -0,0 +1,300 @@
+"""
+Prometheus 텍스트 형식(0.0.4) 메트릭. `GET /metrics`로 노출됩니다.
+
+외부 의존성 없이 카운터/히스토그램만 구현합니다. 라벨 조합별 값은 labels()가 돌려주는 child에 보관되며,
+기록은 bisect 한 번과 잠금 안의 덧셈 두 번뿐이라 요청/쿼리 경로에 넣어도 비용이 거의 없습니다
+(`python -m benchmarks.bench_metrics`로 확인).
+"""
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import time
+from typing import Callable, Iterable, Optional, Sequence
+
+from sqlalchemy import event
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 버킷 상한(초)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+EXTERNAL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+WAIT_BUCKETS = (0.0, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_histogram(
+    name: str,
+    documentation: str,
+    buckets: Sequence[float],
+    labelnames: Sequence[str],
+    series: Iterable[tuple[Sequence[str], Sequence[int], float]],
+) -> list[str]:
+    """(라벨 값, 버킷별 개수(마지막은 +Inf), 합계) 목록을 누적 버킷 형식의 줄로 만듭니다."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} histogram"]
+    bounds = ['le="' + _format_number(b) + '"' for b in buckets] + ['le="+Inf"']
+    for values, counts, total in series:
+        cumulative = 0
+        for bound, count in zip(bounds, counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labelnames, values, bound)} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        lines.append(f"{name}_sum{labels} {_format_number(total)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+    return lines
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "counts", "total", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children = {}
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def value(self, *values: str) -> float:
+        child = self._children.get(values)
+        return child.value if child is not None else 0.0
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for values, child in sorted(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_number(child.value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = REQUEST_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def count(self, *values: str) -> int:
+        child = self._children.get(values)
+        return sum(child.counts) if child is not None else 0
+
+    def render(self) -> list[str]:
+        series = [(values, list(child.counts), child.total) for values, child in sorted(self._children.items())]
+        return render_histogram(self.name, self.documentation, self.buckets, self.labelnames, series)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], list[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = REQUEST_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def register_collector(self, collector: Callable[[], list[str]]) -> None:
+        """렌더링 시점에 줄 목록을 만들어 주는 함수 (다른 모듈이 이미 집계하는 값을 노출할 때)."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 값을 지웁니다 (테스트용)."""
+        for metric in self._metrics.values():
+            metric.clear()
+        _STATEMENT_CHILDREN.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "API request latency by route template.", ("method", "route", "status")
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds", "Database statement execution time.", ("operation",), DB_BUCKETS
+)
+GEMINI_REQUEST_DURATION = REGISTRY.histogram(
+    "gemini_request_duration_seconds", "Gemini generateContent latency including retries.", ("outcome",), EXTERNAL_BUCKETS
+)
+GEMINI_TOKENS = REGISTRY.counter("gemini_tokens_total", "Gemini token usage reported by the API.", ("type",))
+FETCH_DURATION = REGISTRY.histogram(
+    "fetch_duration_seconds",
+    "Fetch duration per ingest target (NEWSDATA query: all pages, RSS feed: one conditional GET).",
+    ("kind", "outcome"),
+    EXTERNAL_BUCKETS,
+)
+RATE_LIMIT_WAIT = REGISTRY.histogram(
+    "rate_limiter_wait_seconds", "Time spent waiting for the Gemini rate limiter.", (), WAIT_BUCKETS
+)
+INGEST_RUNS = REGISTRY.counter("ingest_runs_total", "Ingest runs by final status.", ("status",))
+INGEST_RUN_DURATION = REGISTRY.histogram(
+    "ingest_run_duration_seconds", "Ingest run duration.", ("status",), EXTERNAL_BUCKETS + (120.0, 300.0, 600.0)
+)
+INGEST_ARTICLES = REGISTRY.counter("ingest_articles_total", "Ingested articles by outcome.", ("outcome",))
+RETENTION_RUNS = REGISTRY.counter("retention_runs_total", "Retention (archive + purge) runs by final status.", ("status",))
+RETENTION_RUN_DURATION = REGISTRY.histogram(
+    "retention_run_duration_seconds", "Retention run duration.", ("status",), EXTERNAL_BUCKETS + (120.0, 300.0, 600.0)
+)
+RETENTION_ARTICLES = REGISTRY.counter("retention_articles_total", "Articles removed by retention.", ("outcome",))
+
+_OPERATION_RE = re.compile(r"\s*(\w+)")
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK"}
+# SQL 문자열 → 히스토그램 child. 컴파일 캐시 덕분에 같은 문장은 같은 문자열이라 조회 한 번으로 끝난다
+_STATEMENT_CHILDREN: dict[str, _HistogramChild] = {}
+_MAX_CACHED_STATEMENTS = 2048
+
+
+def _operation(statement: str) -> str:
+    match = _OPERATION_RE.match(statement)
+    operation = match.group(1).upper() if match else ""
+    return operation if operation in _OPERATIONS else "OTHER"
+
+
+def _statement_child(statement: str) -> _HistogramChild:
+    child = _STATEMENT_CHILDREN.get(statement)
+    if child is None:
+        child = DB_QUERY_DURATION.labels(_operation(statement))
+        if len(_STATEMENT_CHILDREN) < _MAX_CACHED_STATEMENTS:
+            _STATEMENT_CHILDREN[statement] = child
+    return child
+
+
+def instrument_engine(engine) -> None:
+    """동기 Engine(async 엔진은 .sync_engine)의 문장 실행 시간을 db_query_duration_seconds에 기록합니다."""
+    perf_counter = time.perf_counter
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is not None:
+            _statement_child(statement).observe(perf_counter() - started)
+
+
+class MetricsMiddleware:
+    """
+    요청 처리 시간을 라우트 템플릿(/articles/{article_id}) 기준으로 기록하는 ASGI 미들웨어.
+    매칭되는 라우트가 없으면 route="unmatched"로 모아 라벨 수가 늘어나지 않게 합니다.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path: Optional[str] = getattr(route, "path", None)
+            HTTP_REQUEST_DURATION.labels(scope["method"], path or "unmatched", status).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,132 @@
+"""
+DB 스키마 리비전 확인.
+
+앱 시작 시 create_all(테이블마다 카탈로그 조회) 대신 alembic_version 한 행을 읽어 Alembic head와 비교합니다.
+테이블이 하나도 없는 새 DB는 DB_AUTO_CREATE가 켜져 있으면 현재 모델로 만든 뒤 head로 stamp합니다.
+리비전이 head와 다르면 앱은 뜨지만 `/ready`가 503을 반환하므로, 배포 시 `alembic upgrade head`를 먼저 실행합니다.
+"""
+from __future__ import annotations
+
+import ast
+import logging
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_LOCATION = Path(__file__).resolve().parents[2] / "alembic"
+
+# 스키마 상태
+CURRENT = "current"  # head와 같음
+CREATED = "created"  # 빈 DB를 이번에 만들고 head로 stamp함
+EMPTY = "empty"  # 테이블 없음 (DB_AUTO_CREATE=false)
+OUTDATED = "outdated"  # 리비전이 head와 다름 → alembic upgrade head 필요
+UNVERSIONED = "unversioned"  # 테이블은 있지만 alembic_version이 없음 (create_all로 만든 DB) → alembic stamp 필요
+
+
+@dataclass
+class SchemaStatus:
+    state: str
+    revision: Optional[str]
+    head: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.state in (CURRENT, CREATED)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _script_directory():
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(str(SCRIPT_LOCATION))
+
+
+def _revision_ids(path: Path) -> tuple[Optional[str], tuple[str, ...]]:
+    """스크립트를 실행하지 않고 모듈 수준의 revision/down_revision 값만 읽습니다."""
+    values: dict[str, object] = {}
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+            name, value = node.target.id, node.value
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name, value = node.targets[0].id, node.value
+        else:
+            continue
+        if name in ("revision", "down_revision"):
+            values[name] = ast.literal_eval(value)
+    down = values.get("down_revision")
+    if down is None:
+        parents: tuple[str, ...] = ()
+    elif isinstance(down, str):
+        parents = (down,)
+    else:
+        parents = tuple(down)
+    return values.get("revision"), parents
+
+
+@lru_cache
+def head_revision() -> Optional[str]:
+    """
+    마이그레이션 스크립트의 head 리비전 (여러 개면 정렬해 ','로 연결).
+    ScriptDirectory는 스크립트를 모두 import하므로(시작 시간의 대부분) 대신 파일에서 리비전 ID만 읽습니다.
+    """
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for path in (SCRIPT_LOCATION / "versions").glob("*.py"):
+        revision, down = _revision_ids(path)
+        if revision:
+            revisions.add(revision)
+            parents.update(down)
+    return ",".join(sorted(revisions - parents)) or None
+
+
+def schema_status(conn: Connection) -> SchemaStatus:
+    head = head_revision()
+    inspector = inspect(conn)
+    if not inspector.has_table("alembic_version"):
+        state = UNVERSIONED if inspector.get_table_names() else EMPTY
+        return SchemaStatus(state, None, head)
+    revision = ",".join(sorted(conn.execute(text("SELECT version_num FROM alembic_version")).scalars())) or None
+    return SchemaStatus(CURRENT if revision == head else OUTDATED, revision, head)
+
+
+def ensure_schema(conn: Connection, auto_create: bool = True) -> SchemaStatus:
+    """리비전을 확인하고, 빈 DB면 (auto_create) 현재 모델로 테이블을 만든 뒤 head로 stamp합니다."""
+    status = schema_status(conn)
+    if status.state != EMPTY or not auto_create:
+        return status
+
+    from alembic.runtime.migration import MigrationContext
+
+    from app.models import Base
+    from app.services.search import ensure_search_index
+
+    Base.metadata.create_all(bind=conn)
+    ensure_search_index(conn)
+    MigrationContext.configure(conn).stamp(_script_directory(), "heads")
+    return SchemaStatus(CREATED, status.head, status.head)
+
+
+async def check_database(engine: AsyncEngine) -> SchemaStatus:
+    """앱 시작 시 스키마 리비전을 확인합니다. head와 다르면 경고를 남깁니다 (요청은 계속 받음)."""
+    async with engine.begin() as conn:
+        status = await conn.run_sync(ensure_schema, get_settings().db_auto_create)
+    if status.state == CREATED:
+        logger.info("Created database schema and stamped revision %s", status.head)
+    elif status.state == OUTDATED:
+        logger.error("Database revision %s != head %s; run `alembic upgrade head`", status.revision, status.head)
+    elif status.state == UNVERSIONED:
+        logger.error("Database has tables but no alembic_version; run `alembic stamp head` if the schema is current")
+    elif status.state == EMPTY:
+        logger.error("Database is empty and DB_AUTO_CREATE is off; run `alembic upgrade head`")
+    return status
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Mapping, Optional
 
-import httpx
+from app.config import get_settings
+from app.services.http_client import get_http_client, http_clients, request_with_retries
 
 
 @dataclass
@@ -18,73 +19,137 @@ class NormalizedArticle:
     hash: str
 
 
+class CreditBudget:
+    """한 번의 수집 회차에서 사용할 NEWSDATA.io 크레딧 (요청 1회 = 1크레딧)."""
+
+    def __init__(self, credits: int):
+        self.remaining = credits
+        self.used = 0
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        self.used += 1
+        return True
+
+
+@dataclass
+class NewsdataWalk:
+    """
+    iter_newsdata_news 한 번의 페이지 순회 결과.
+    complete는 워터마크에 닿았거나 nextPage가 없어 끝까지 읽었는지 (페이지/크레딧 한도로 멈추면 False),
+    newest/oldest는 이번에 돌려준 기사의 발행 시각 범위입니다.
+    """
+
+    complete: bool = False
+    newest: Optional[datetime] = None
+    oldest: Optional[datetime] = None
+
+    def observe(self, published: Optional[datetime]) -> None:
+        if published is None:
+            return
+        if self.newest is None or published > self.newest:
+            self.newest = published
+        if self.oldest is None or published < self.oldest:
+            self.oldest = published
+
+
 def _compute_hash(link: str, title: str) -> str:
     return hashlib.sha256(f"{link}:{title}".encode("utf-8")).hexdigest()
 
 
-async def fetch_newsdata_news(api_key: str, country: str = "kr", language: str = "ko") -> List[NormalizedArticle]:
+def _parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    # NEWSDATA.io pubDate는 ISO 8601 형식 (예: "2026-01-05 12:34:56", UTC)
+    if not value:
+        return None
+    try:
+        published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    # DB는 naive UTC로 저장하므로 워터마크 비교를 위해 통일
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc).replace(tzinfo=None)
+    return published
+
+
+def _normalize(article: dict[str, Any]) -> Optional[NormalizedArticle]:
+    title = (article.get("title") or "").strip()
+    link = (article.get("link") or "").strip()
+    content = article.get("description", "") or article.get("content", "") or ""
+
+    if not title or not link:
+        return None
+
+    source_name = article.get("source_id", "newsdata")
+    return NormalizedArticle(
+        title=title,
+        link=link,
+        published_at=_parse_pub_date(article.get("pubDate")),
+        content=content.strip(),
+        source_name=f"newsdata:{source_name}",
+        hash=_compute_hash(link, title),
+    )
+
+
+async def iter_newsdata_news(
+    api_key: str,
+    country: str = "kr",
+    language: str = "ko",
+    since: Optional[datetime] = None,
+    max_pages: Optional[int] = None,
+    budget: Optional[CreditBudget] = None,
+    query: Optional[Mapping[str, str]] = None,
+    walk: Optional[NewsdataWalk] = None,
+) -> AsyncIterator[NormalizedArticle]:
     """
-    NEWSDATA.io API를 사용하여 뉴스를 가져옵니다.
+    NEWSDATA.io `/api/1/news`를 nextPage 토큰을 따라가며 최신순으로 가져옵니다.
+    since(워터마크)보다 오래된 기사가 나온 페이지에서 멈추고, 페이지/크레딧 한도도 지킵니다.
+    query(예: {"country": "kr", "category": "business"})를 넘기면 country/language 대신 그 파라미터로 검색합니다.
+    walk를 넘기면 끝까지 읽었는지와 돌려준 기사의 발행 시각 범위를 기록합니다 (워터마크 결정용).
     API 문서: https://newsdata.io/documentation
     """
-    url = "https://newsdata.io/api/1/news"
-    params = {
-        "apikey": api_key,
-        "country": country,
-        "language": language,
-    }
-
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(url, params=params)
+    settings = get_settings()
+    url = settings.newsdata_base_url.rstrip("/") + "/api/1/news"
+    max_pages = settings.newsdata_max_pages if max_pages is None else max_pages
+    params = {"apikey": api_key, **(query if query is not None else {"country": country, "language": language})}
+    walk = walk if walk is not None else NewsdataWalk()
+
+    page_token: Optional[str] = None
+    for _ in range(max_pages):
+        if budget is not None and not budget.take():
+            break
+        page_params = dict(params, page=page_token) if page_token else params
+        async with http_clients.host_slot(url):
+            response = await request_with_retries(get_http_client("newsdata"), "GET", url, params=page_params)
         response.raise_for_status()
         data = response.json()
 
-    items: List[NormalizedArticle] = []
-    results = data.get("results", [])
-    
-    for article in results:
-        title = article.get("title", "").strip()
-        link = article.get("link", "").strip()
-        content = article.get("description", "") or article.get("content", "") or ""
-        
-        if not title or not link:
-            continue
-
-        # NEWSDATA.io pubDate는 ISO 8601 형식
-        published = None
-        if article.get("pubDate"):
-            try:
-                # ISO 8601 파싱 (예: "2026-01-05 12:34:56")
-                published = datetime.fromisoformat(article["pubDate"].replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
-
-        source_name = article.get("source_id", "newsdata")
-        
-        items.append(
-            NormalizedArticle(
-                title=title,
-                link=link,
-                published_at=published,
-                content=content.strip(),
-                source_name=f"newsdata:{source_name}",
-                hash=_compute_hash(link, title),
-            )
-        )
-    return items
-
-
-async def fetch_all_news(newsdata_key: Optional[str]) -> List[NormalizedArticle]:
+        reached_watermark = False
+        for raw in data.get("results", []):
+            item = _normalize(raw)
+            if item is None:
+                continue
+            if since is not None and item.published_at is not None and item.published_at < since:
+                reached_watermark = True
+                continue
+            walk.observe(item.published_at)
+            yield item
+
+        page_token = data.get("nextPage")
+        if reached_watermark or not page_token:
+            walk.complete = True
+            break
+
+
+async def fetch_newsdata_news(
+    api_key: str,
+    country: str = "kr",
+    language: str = "ko",
+    since: Optional[datetime] = None,
+    budget: Optional[CreditBudget] = None,
+) -> List[NormalizedArticle]:
     """
-    NEWSDATA.io API를 호출하여 뉴스를 수집합니다.
+    NEWSDATA.io API를 사용하여 뉴스를 가져옵니다.
     """
-    items: List[NormalizedArticle] = []
-
-    if newsdata_key:
-        try:
-            newsdata_items = await fetch_newsdata_news(newsdata_key, country="kr", language="ko")
-            items.extend(newsdata_items)
-        except Exception as e:
-            print(f"Failed to fetch from NEWSDATA.io: {e}")
-
-    return items
+    return [item async for item in iter_newsdata_news(api_key, country, language, since=since, budget=budget)]
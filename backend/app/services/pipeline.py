@@ -1,128 +1,489 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import Callable, Dict, Optional
 
+from sqlalchemy import insert, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models import Analysis, Article, Source
-from app.schemas import AnalyzeRequest
-from app.services.analyzer import AnalyzerClient
-from app.services.news_fetcher import NormalizedArticle, fetch_all_news
+from app.schemas import AnalysisResult, AnalyzeRequest, SentimentResult
+from app.services.analysis_cache import AnalysisCache, cache_key, get_analysis_cache
+from app.services.analyzer import GEMINI_MODEL, PROMPT_VERSION, AnalyzerClient, pack_batches
+from app.services.collector import fetch_sources
+from app.services.dedup import assign_clusters
+from app.services.keywords import index_keywords
+from app.services.metrics import INGEST_ARTICLES
+from app.services.news_fetcher import NormalizedArticle
+from app.services.preprocess import get_text_cleaner
+from app.services.response_cache import get_response_cache
+from app.services.rollups import record_samples
+from app.services.search import insert_documents, update_documents
 from app.utils.text import clean_html
 
 logger = logging.getLogger(__name__)
 
+# 진행 상황 콜백: (단계 이름, 누적 카운트) — 백그라운드 작업 상태 조회용
+ProgressCallback = Callable[[str, Dict[str, int]], None]
 
-def _ensure_sources(db: Session) -> Dict[str, Source]:
+
+def _report(progress: Optional[ProgressCallback], stage: str, **counts: int) -> None:
+    if progress is not None:
+        progress(stage, counts)
+
+
+def _ensure_sources(db: Session, rss: bool = False) -> Dict[str, Source]:
     """
-    newsdata 소스가 DB에 존재하는지 확인하고, 없으면 생성합니다.
+    newsdata 소스(rss=True이면 rss 소스도)가 DB에 존재하는지 확인하고, 없으면 생성합니다.
     """
     existing = db.query(Source).all()
     by_name = {s.name: s for s in existing}
 
-    # newsdata 소스 확인
-    if "newsdata" not in by_name:
-        src = Source(name="newsdata", api_type="newsdata", active=True)
-        db.add(src)
-        db.flush()
-        by_name["newsdata"] = src
+    for name in ("newsdata", "rss") if rss else ("newsdata",):
+        if name not in by_name:
+            src = Source(name=name, api_type=name, active=True)
+            db.add(src)
+            db.flush()
+            by_name[name] = src
 
     db.commit()
     return by_name
 
 
-def _upsert_article(db: Session, source: Source, item: NormalizedArticle) -> Article | None:
-    found = db.query(Article).filter(Article.hash == item.hash).one_or_none()
-    if found:
+@dataclass
+class _NewArticle:
+    id: int
+    title: str
+    published_at: Optional[datetime]
+    content_clean: str
+    source_name: str
+    source_id: int
+    created_at: datetime
+
+
+def _existing_hashes(db: Session, hashes: list[str], chunk_size: int) -> set[str]:
+    found: set[str] = set()
+    for i in range(0, len(hashes), chunk_size):
+        chunk = hashes[i:i + chunk_size]
+        found.update(h for (h,) in db.query(Article.hash).filter(Article.hash.in_(chunk)))
+    return found
+
+
+def _insert_ignoring_duplicates(db: Session, rows: list[dict]) -> list[tuple[int, str]]:
+    """articles 다건 INSERT. 동시 수집과 경합해도 hash 중복은 건너뛰고 (id, hash)를 반환합니다."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(Article).on_conflict_do_nothing(index_elements=["hash"])
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(Article).on_conflict_do_nothing(index_elements=["hash"])
+    else:
+        db.execute(insert(Article), rows)
+        hashes = [row["hash"] for row in rows]
+        return [tuple(r) for r in db.query(Article.id, Article.hash).filter(Article.hash.in_(hashes))]
+    return [tuple(r) for r in db.execute(stmt.values(rows).returning(Article.id, Article.hash))]
+
+
+def unseen_items(
+    db: Session,
+    items: list[tuple[Source, NormalizedArticle]],
+    chunk_size: int = 500,
+) -> list[tuple[Source, NormalizedArticle]]:
+    """배치 안 중복과 이미 저장된 hash를 걸러 새 항목만 반환합니다 (정제 대상 줄이기)."""
+    unique: dict[str, tuple[Source, NormalizedArticle]] = {}
+    for src, item in items:
+        unique.setdefault(item.hash, (src, item))
+    existing = _existing_hashes(db, list(unique), chunk_size)
+    return [pair for h, pair in unique.items() if h not in existing]
+
+
+def bulk_insert_articles(
+    db: Session,
+    items: list[tuple[Source, NormalizedArticle]],
+    chunk_size: int = 500,
+    cleaned: Optional[dict[str, str]] = None,
+) -> list[_NewArticle]:
+    """
+    수집 항목을 일괄 저장하고 새로 저장된 기사만 반환합니다.
+    기존 hash는 IN 쿼리로 먼저 걸러 정제 비용을 줄이고, 청크마다 한 번의 INSERT와 커밋만 수행합니다.
+    cleaned(hash → 정제 본문)에 있는 항목은 다시 정제하지 않습니다.
+    """
+    candidates = unseen_items(db, items, chunk_size)
+    cleaned = cleaned or {}
+
+    inserted: list[_NewArticle] = []
+    now = datetime.utcnow()
+    for i in range(0, len(candidates), chunk_size):
+        chunk = candidates[i:i + chunk_size]
+        rows = [
+            {
+                "source_id": src.id,
+                "title": item.title,
+                "link": item.link,
+                "published_at": item.published_at,
+                "content_raw": item.content,
+                "content_clean": cleaned[item.hash] if item.hash in cleaned else clean_html(item.content),
+                "hash": item.hash,
+                "created_at": now,
+            }
+            for src, item in chunk
+        ]
+        by_hash = {row["hash"]: (row, src) for row, (src, _) in zip(rows, chunk)}
+        new_articles = []
+        for article_id, article_hash in _insert_ignoring_duplicates(db, rows):
+            row, src = by_hash[article_hash]
+            new_articles.append(
+                _NewArticle(
+                    article_id, row["title"], row["published_at"], row["content_clean"], src.name, src.id, now
+                )
+            )
+        # 검색 색인 동기화 (분석 키워드는 분석 단계에서 반영)
+        insert_documents(db, [(a.id, a.title, a.content_clean, None) for a in new_articles])
+        db.commit()
+        inserted.extend(new_articles)
+    return inserted
+
+
+def _advance_watermark(db: Session, source_id: int, newest: datetime) -> None:
+    """
+    소스 워터마크(last_fetched_at)를 newest로 올립니다.
+    조건부 UPDATE라 동시에 실행된 수집이 있어도 워터마크가 뒤로 가지 않습니다.
+    """
+    db.execute(
+        update(Source)
+        .where(Source.id == source_id)
+        .where(or_(Source.last_fetched_at.is_(None), Source.last_fetched_at < newest))
+        .values(last_fetched_at=newest)
+    )
+    db.commit()
+
+
+@dataclass
+class _PendingAnalysis:
+    article_id: int
+    title: str
+    content_clean: Optional[str]
+    request: AnalyzeRequest
+    cache_key: str
+    source_id: int
+    # 롤업 버킷/키워드 기간 집계 기준 시각 (발행 시각이 없으면 저장 시각)
+    bucket_time: datetime
+    # 근접 중복 묶음 id, 분석 결과를 복사해 올 대표 기사 id
+    cluster_id: Optional[int] = None
+    duplicate_of: Optional[int] = None
+
+
+def _build_request(article: _NewArticle) -> Optional[AnalyzeRequest]:
+    # 콘텐츠가 짧거나 없을 수 있으므로 title과 결합
+    content_to_analyze = article.content_clean or ""
+    if not content_to_analyze.strip() or len(content_to_analyze.strip()) < 50:
+        # 콘텐츠가 없거나 너무 짧으면 title을 포함
+        content_to_analyze = f"{article.title}. {content_to_analyze}".strip()
+        logger.info(f"Using title+content for article {article.id} (source: {article.source_name})")
+
+    if not content_to_analyze.strip():
+        logger.warning(f"Skipping article {article.id} - no content to analyze (source: {article.source_name})")
         return None
-    article = Article(
-        source_id=source.id,
-        title=item.title,
-        link=item.link,
-        published_at=item.published_at,
-        content_raw=item.content,
-        content_clean=clean_html(item.content),
-        hash=item.hash,
+
+    return AnalyzeRequest(
+        article={
+            "title": article.title,
+            "content": content_to_analyze,
+            "published_at": article.published_at.isoformat() if article.published_at else None,
+            "source": article.source_name,
+        },
+        need_keywords=True,
+    )
+
+
+def _write_analyses(db: Session, batch: list[tuple[_PendingAnalysis, AnalysisResult]], cached: bool = False) -> int:
+    now = datetime.utcnow()
+    rows = []
+    for pending, result in batch:
+        meta = {"reason": result.reason, "safety": result.safety_flag}
+        if cached:
+            meta["cached"] = True
+        if pending.duplicate_of is not None:
+            meta["duplicate_of"] = pending.duplicate_of
+        rows.append(
+            {
+                "article_id": pending.article_id,
+                "summary": result.summary,
+                "sentiment_label": result.sentiment.label,
+                "sentiment_score": result.sentiment.score,
+                "keywords": result.keywords,
+                "json_meta": meta,
+                "model_name": GEMINI_MODEL,
+                "created_at": now,
+            }
+        )
+    db.execute(insert(Analysis), rows)
+    # 감성 시계열 롤업 증분 갱신 (같은 트랜잭션)
+    record_samples(
+        db,
+        (
+            (pending.bucket_time, pending.source_id, result.sentiment.label, result.sentiment.score)
+            for pending, result in batch
+        ),
+    )
+    # 키워드 역색인 (정규화된 키워드 → 기사)
+    index_keywords(db, ((pending.article_id, pending.bucket_time, result.keywords) for pending, result in batch))
+    # 검색 색인에 분석 키워드 반영
+    update_documents(
+        db, [(pending.article_id, pending.title, pending.content_clean, result.keywords) for pending, result in batch]
     )
-    db.add(article)
-    db.flush()
-    return article
+    db.commit()
+    return len(batch)
+
 
+def _representative_results(db: Session, article_ids: list[int]) -> dict[int, AnalysisResult]:
+    """이전 회차에 분석된 묶음 대표 기사의 결과를 AnalysisResult로 읽습니다 (근접 중복 기사에 복사)."""
+    results: dict[int, AnalysisResult] = {}
+    for ana in db.query(Analysis).filter(Analysis.article_id.in_(article_ids)):
+        meta = ana.json_meta or {}
+        results[ana.article_id] = AnalysisResult(
+            summary=ana.summary,
+            sentiment=SentimentResult(label=ana.sentiment_label, score=ana.sentiment_score),
+            keywords=ana.keywords or [],
+            reason=meta.get("reason") or "",
+            safety_flag=bool(meta.get("safety")),
+        )
+    return results
 
-async def run_ingest(db: Session) -> dict[str, int]:
+
+def _write_analyses_and_cache(
+    db: Session,
+    batch: list[tuple[_PendingAnalysis, AnalysisResult]],
+    cache: AnalysisCache,
+    entries: list[tuple[str, AnalysisResult]],
+) -> int:
+    for key, result in entries:
+        cache.put(db, key, result, GEMINI_MODEL, PROMPT_VERSION)
+    return _write_analyses(db, batch)
+
+
+async def _run_analysis_stage(
+    db: AsyncSession,
+    analyzer: AnalyzerClient,
+    groups: list[list[_PendingAnalysis]],
+    cache: AnalysisCache,
+    workers: int,
+    batch_size: int,
+    prompt_batch_size: int = 1,
+    prompt_max_chars: int = 0,
+    on_written: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    최대 workers개의 분석 호출을 동시에 실행하고, 완료된 결과를 batch_size 단위로 DB에 기록합니다.
+    같은 캐시 키를 가진 기사 묶음(group)은 대표 기사 하나만 분석하고 결과를 공유합니다.
+    prompt_batch_size > 1이면 짧은 기사 여러 건을 한 프롬프트로 묶어 호출합니다.
+    분당 호출 수는 AnalyzerClient의 레이트 리미터가 제한하며, 기사별 실패는 해당 묶음만 건너뜁니다.
+    on_written은 배치를 기록할 때마다 기록한 건수로 호출됩니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, workers))
+    requests = [group[0].request for group in groups]
+    if prompt_batch_size > 1:
+        units = pack_batches(requests, prompt_batch_size, prompt_max_chars)
+    else:
+        units = [[i] for i in range(len(groups))]
+
+    async def _analyze(unit: list[int]) -> list[tuple[list[_PendingAnalysis], Optional[AnalysisResult]]]:
+        async with semaphore:
+            if len(unit) == 1:
+                head = groups[unit[0]][0]
+                try:
+                    results = [await analyzer.analyze(head.request)]
+                except Exception as exc:  # pragma: no cover - 모니터링 목적
+                    logger.exception("Analyze failed for article %s: %s", head.article_id, exc)
+                    results = [None]
+            else:
+                results = await analyzer.analyze_batch([requests[i] for i in unit])
+        return [(groups[i], result) for i, result in zip(unit, results)]
+
+    async def _flush(rows: list[tuple[_PendingAnalysis, AnalysisResult]], entries: list[tuple[str, AnalysisResult]]) -> int:
+        # 동기 ORM 코드를 async 드라이버 위에서 실행 (이벤트 루프를 막지 않음)
+        written = await db.run_sync(_write_analyses_and_cache, rows, cache, entries)
+        if on_written is not None:
+            on_written(written)
+        return written
+
+    analyzed = 0
+    batch: list[tuple[_PendingAnalysis, AnalysisResult]] = []
+    cache_entries: list[tuple[str, AnalysisResult]] = []
+    for next_done in asyncio.as_completed([_analyze(unit) for unit in units]):
+        for group, result in await next_done:
+            if result is None:
+                continue
+            cache_entries.append((group[0].cache_key, result))
+            batch.extend((item, result) for item in group)
+        if len(batch) >= batch_size:
+            analyzed += await _flush(batch, cache_entries)
+            batch, cache_entries = [], []
+    if batch:
+        analyzed += await _flush(batch, cache_entries)
+    return analyzed
+
+
+async def run_ingest(db: AsyncSession, progress: Optional[ProgressCallback] = None) -> dict[str, int]:
+    """
+    수집→정제→분석→저장 파이프라인을 한 번 실행합니다.
+    DB 작업은 AsyncSession.run_sync로 async 드라이버 위에서 실행되어, 분석 호출과 조회 요청을 막지 않습니다.
+    progress를 넘기면 단계가 바뀌거나 분석 결과가 기록될 때마다 누적 카운트와 함께 호출됩니다.
+    """
     settings = get_settings()
     if not settings.gemini_api_key:
         logger.warning("GEMINI_API_KEY not set, analysis will be skipped.")
     
-    # API 키가 없으면 종료
-    if not settings.newsdata_api_key:
-        logger.warning("NEWSDATA_API_KEY not configured")
-        return {"fetched": 0, "analyzed": 0}
+    # 수집 대상이 없으면 종료
+    if not settings.newsdata_api_key and not settings.rss_feeds:
+        logger.warning("No ingest targets configured (NEWSDATA_API_KEY and RSS_FEEDS both empty)")
+        return {"fetched": 0, "analyzed": 0, "cache_hits": 0, "cache_misses": 0, "duplicates": 0}
 
-    sources = _ensure_sources(db)
+    sources = await db.run_sync(_ensure_sources, bool(settings.rss_feeds))
+    newsdata_source = sources["newsdata"]
 
-    # NEWSDATA.io에서 뉴스 수집
-    fetched_items = await fetch_all_news(settings.newsdata_api_key)
+    # NEWSDATA 쿼리(워터마크 이후)와 RSS 피드를 동시에 수집
+    _report(progress, "fetch")
+    since = newsdata_source.last_fetched_at
+    fetch_report = await fetch_sources(settings.newsdata_api_key, since=since)
+    fetched_items = fetch_report.items
     
     analyzer = AnalyzerClient(api_key=settings.gemini_api_key) if settings.gemini_api_key else None
 
-    fetched_count = 0
-    analyzed_count = 0
-
+    items = []
     for item in fetched_items:
         # source_name 파싱 (예: "newsdata:kr")
         api_type = item.source_name.split(":")[0]
-        src = sources.get(api_type)
-        
-        if not src:
-            # 기본값으로 첫 번째 소스 사용
-            src = next(iter(sources.values()))
-        
-        article = _upsert_article(db, src, item)
-        if not article:
-            continue
-        
-        fetched_count += 1
-
-        if analyzer:
-            # 콘텐츠가 짧거나 없을 수 있으므로 title과 결합
-            content_to_analyze = article.content_clean or ""
-            if not content_to_analyze.strip() or len(content_to_analyze.strip()) < 50:
-                # 콘텐츠가 없거나 너무 짧으면 title을 포함
-                content_to_analyze = f"{article.title}. {content_to_analyze}".strip()
-                logger.info(f"Using title+content for article {article.id} (source: {src.name})")
-
-            if content_to_analyze.strip():
-                req = AnalyzeRequest(
-                    article={
-                        "title": article.title,
-                        "content": content_to_analyze,
-                        "published_at": article.published_at.isoformat() if article.published_at else None,
-                        "source": src.name,
-                    },
-                    need_keywords=True,
-                )
-                try:
-                    result = await analyzer.analyze(req)
-                    analysis = Analysis(
-                        article_id=article.id,
-                        summary=result.summary,
-                        sentiment_label=result.sentiment.label,
-                        sentiment_score=result.sentiment.score,
-                        keywords=result.keywords,
-                        json_meta={"reason": result.reason, "safety": result.safety_flag},
-                        model_name="gemini-2.5-flash",
+        # 없으면 기본값으로 첫 번째 소스 사용
+        items.append((sources.get(api_type) or next(iter(sources.values())), item))
+
+    _report(progress, "store", received=len(fetched_items))
+    # 새 항목의 본문만 이벤트 루프 밖에서 정제한 뒤 저장
+    fresh = await db.run_sync(unseen_items, items)
+    contents = await get_text_cleaner().clean([item.content for _, item in fresh])
+    cleaned = {item.hash: text for (_, item), text in zip(fresh, contents)}
+    new_articles = await db.run_sync(bulk_insert_articles, fresh, cleaned=cleaned)
+    fetched_count = len(new_articles)
+    if new_articles:
+        # 새 기사가 커밋되었으므로 조회 응답 캐시의 세대를 올린다
+        get_response_cache().bump()
+    # 실패했거나 페이지/크레딧 한도로 중간에 멈춘 NEWSDATA 쿼리가 있으면 밀린 기사를 다음 회차에 받을 수 있게
+    # 워터마크를 그대로 둔다 (FetchReport.newsdata_watermark)
+    watermark = fetch_report.newsdata_watermark(since)
+    if watermark is not None:
+        await db.run_sync(_advance_watermark, newsdata_source.id, watermark)
+
+    # 재배포 기사 묶기: 묶음마다 대표 기사만 분석하고 나머지는 결과를 복사한다
+    clusters: dict[int, int] = {}
+    if new_articles and settings.story_dedup_enabled:
+        clusters = await db.run_sync(
+            assign_clusters, [(a.id, a.content_clean) for a in new_articles], settings.story_dedup_threshold
+        )
+
+    pending: list[_PendingAnalysis] = []
+    if analyzer:
+        for article in new_articles:
+            req = _build_request(article)
+            if req is not None:
+                key = cache_key(req.article.content, GEMINI_MODEL, PROMPT_VERSION)
+                pending.append(
+                    _PendingAnalysis(
+                        article.id,
+                        article.title,
+                        article.content_clean,
+                        req,
+                        key,
+                        article.source_id,
+                        article.published_at or article.created_at,
+                        clusters.get(article.id),
                     )
-                    db.add(analysis)
-                    analyzed_count += 1
-                except Exception as exc:  # pragma: no cover - 모니터링 목적
-                    logger.exception("Analyze failed: %s", exc)
-            else:
-                logger.warning(f"Skipping article {article.id} - no content to analyze (source: {src.name})")
-        
-        db.commit()
+                )
+
+    analyzed_count = 0
+    cache_hits = 0
+    _report(progress, "analyze", received=len(fetched_items), fetched=fetched_count, pending=len(pending), analyzed=0)
+
+    def _on_written(written: int) -> None:
+        nonlocal analyzed_count
+        analyzed_count += written
+        if written:
+            get_response_cache().bump()
+        _report(progress, "analyze", analyzed=analyzed_count)
+
+    groups: dict[tuple, list[_PendingAnalysis]] = {}
+    duplicates = 0
+    if analyzer and pending:
+        # 캐시 적중 기사는 네트워크 호출 없이 바로 분석 결과를 저장
+        cache = get_analysis_cache()
+        cached = await db.run_sync(cache.get_many, [item.cache_key for item in pending])
+        hits = [(item, cached[item.cache_key]) for item in pending if item.cache_key in cached]
+        if hits:
+            _on_written(await db.run_sync(_write_analyses, hits, True))
+        cache_hits = len(hits)
+        misses = [item for item in pending if item.cache_key not in cached]
+
+        # 이전 회차에 분석된 대표 기사의 묶음에 합류한 기사는 대표의 결과를 복사
+        new_ids = {article.id for article in new_articles}
+        earlier = {item.cluster_id for item in misses if item.cluster_id is not None and item.cluster_id not in new_ids}
+        if earlier:
+            representatives = await db.run_sync(_representative_results, sorted(earlier))
+            copies = []
+            for item in misses:
+                if item.cluster_id in representatives:
+                    item.duplicate_of = item.cluster_id
+                    copies.append((item, representatives[item.cluster_id]))
+            if copies:
+                _on_written(await db.run_sync(_write_analyses, copies))
+                duplicates += len(copies)
+            misses = [item for item in misses if item.duplicate_of is None]
+
+        # 같은 묶음(없으면 같은 본문)끼리 대표 1건만 호출
+        for item in misses:
+            key = ("story", item.cluster_id) if item.cluster_id is not None else ("content", item.cache_key)
+            groups.setdefault(key, []).append(item)
+        for head, *followers in groups.values():
+            for item in followers:
+                item.duplicate_of = head.article_id
+                # 본문까지 같으면 캐시 적중, 조금 다르면 근접 중복으로 센다
+                if item.cache_key == head.cache_key:
+                    cache_hits += 1
+                else:
+                    duplicates += 1
+
+        await _run_analysis_stage(
+            db,
+            analyzer,
+            list(groups.values()),
+            cache,
+            workers=settings.analysis_concurrency,
+            batch_size=settings.analysis_write_batch_size,
+            prompt_batch_size=settings.analysis_prompt_batch_size,
+            prompt_max_chars=settings.analysis_prompt_max_chars,
+            on_written=_on_written,
+        )
+
+    outcomes = {
+        "stored": fetched_count,
+        "skipped_existing": len(fetched_items) - fetched_count,
+        "analyzed": analyzed_count,
+        "cache_hit": cache_hits,
+        "story_duplicate": duplicates,
+        # 분석 대상이었지만 결과가 저장되지 않은 기사 (Gemini 오류, 검증 실패)
+        "analysis_failed": len(pending) - analyzed_count if analyzer else 0,
+    }
+    for outcome, count in outcomes.items():
+        if count > 0:
+            INGEST_ARTICLES.labels(outcome).inc(count)
 
-    return {"fetched": fetched_count, "analyzed": analyzed_count}
+    return {
+        "fetched": fetched_count,
+        "analyzed": analyzed_count,
+        "cache_hits": cache_hits,
+        "cache_misses": len(groups),
+        "duplicates": duplicates,
+    }
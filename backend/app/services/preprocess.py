@@ -0,0 +1,62 @@
+"""
+수집 본문 전처리 단계 (HTML 정제).
+
+정제는 CPU 작업이므로 이벤트 루프 스레드에서 돌리지 않습니다. 작은 배치는 기본 스레드 풀에서,
+원문 글자 수 합계가 TEXT_CLEAN_PROCESS_THRESHOLD 이상인 큰 배치는 프로세스 풀로 나눠 처리합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from app.config import get_settings
+from app.utils.text import DEFAULT_MAX_LEN, clean_html_batch
+
+logger = logging.getLogger(__name__)
+
+
+class TextCleaner:
+    def __init__(self, workers: int, process_threshold: int, max_len: int = DEFAULT_MAX_LEN):
+        self.workers = workers
+        self.process_threshold = process_threshold
+        self.max_len = max_len
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._pool is None:
+            # 이벤트 루프/스레드가 떠 있는 프로세스를 fork하지 않도록 spawn으로 띄운다 (첫 큰 배치에서 1회)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    async def clean(self, contents: Sequence[Optional[str]]) -> list[str]:
+        """본문 목록을 같은 순서로 정제합니다. None은 빈 문자열이 됩니다."""
+        if not contents:
+            return []
+        total = sum(len(text) for text in contents if text)
+        pool = self._get_pool() if total >= self.process_threshold else None
+        if pool is not None:
+            try:
+                return await asyncio.to_thread(clean_html_batch, contents, self.max_len, pool)
+            except BrokenProcessPool:
+                # 워커가 죽었으면 풀을 버리고 이번 배치는 스레드에서 처리 (다음 큰 배치에서 다시 생성)
+                logger.warning("text clean process pool broken, falling back to thread")
+                self.shutdown()
+        return await asyncio.to_thread(clean_html_batch, contents, self.max_len)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+@lru_cache
+def get_text_cleaner() -> TextCleaner:
+    settings = get_settings()
+    return TextCleaner(settings.text_clean_workers, settings.text_clean_process_threshold)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+from app.config import get_settings
+from app.services.metrics import RATE_LIMIT_WAIT
+
+
+class TokenBucket:
+    """
+    분당 rate_per_min 속도로 채워지고 최대 capacity까지 쌓이는 토큰 버킷.
+    capacity가 곧 허용 버스트 크기입니다. 스레드/코루틴 동기화는 RateLimiter가 담당합니다.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate_per_min <= 0:
+            raise ValueError("rate_per_min must be positive")
+        self.rate_per_sec = rate_per_min / 60.0
+        self.capacity = float(capacity or rate_per_min)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+
+    @property
+    def fill_level(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def wait_time(self, amount: float) -> float:
+        """amount 만큼 꺼내기 위해 기다려야 하는 초 (0이면 즉시 가능)."""
+        self._refill()
+        # 버킷보다 큰 요청은 가득 찬 버킷 전체로 취급 (영원히 대기하지 않도록)
+        amount = min(amount, self.capacity)
+        missing = amount - self._tokens
+        return 0.0 if missing <= 0 else missing / self.rate_per_sec
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    요청 수(RPM)와 토큰 수(TPM) 버킷을 함께 적용하는 asyncio 레이트 리미터.
+    대기자는 asyncio.Lock의 FIFO 순서로 처리되며, 대기 중에도 이벤트 루프는 막히지 않습니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_min: int,
+        tokens_per_min: int = 0,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests = TokenBucket(requests_per_min, burst or requests_per_min, clock=clock)
+        self.tokens = TokenBucket(tokens_per_min, clock=clock) if tokens_per_min > 0 else None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock은 처음 사용된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _wait_time(self, tokens: int) -> float:
+        wait = self.requests.wait_time(1)
+        if self.tokens is not None and tokens:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """요청 1건과 tokens 만큼의 예산을 확보합니다. 실제로 기다린 초를 반환합니다."""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._get_lock():
+                while True:
+                    wait = self._wait_time(tokens)
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                self.requests.take(1)
+                if self.tokens is not None and tokens:
+                    self.tokens.take(tokens)
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - started
+        self.total_wait_seconds += waited
+        RATE_LIMIT_WAIT.observe(waited)
+        return waited
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        """모니터링용 현재 버킷 상태."""
+        return {
+            "requests_available": round(self.requests.fill_level, 3),
+            "requests_capacity": self.requests.capacity,
+            "tokens_available": round(self.tokens.fill_level, 3) if self.tokens else None,
+            "tokens_capacity": self.tokens.capacity if self.tokens else None,
+            "waiting": self.waiting,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+def estimate_tokens(text: str) -> int:
+    # 한국어는 대략 1~2자당 1토큰이므로 보수적으로 2자당 1토큰으로 추정
+    return len(text) // 2 + 1
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전체에서 공유하는 Gemini 레이트 리미터."""
+    settings = get_settings()
+    return RateLimiter(
+        requests_per_min=settings.rate_limit_per_min,
+        tokens_per_min=settings.tokens_per_min,
+        burst=settings.rate_limit_burst,
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+from app.services.analysis_cache import LruTtlCache
+from app.services.serialization import compress, negotiate_encoding
+
+# 캐시 키에서 제외할 파라미터 (캐시 무효화용 타임스탬프 등 응답 내용과 무관)
+IGNORED_PARAMS = {"_"}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    # 압축본은 인코딩별로 처음 요청될 때 한 번 만들어 같은 세대 동안 재사용 (본문보다 작아 크기 계산에서는 제외)
+    variants: dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    def encoded(self, encoding: str) -> bytes:
+        data = self.variants.get(encoding)
+        if data is None:
+            data = self.variants[encoding] = compress(self.body, encoding)
+        return data
+
+
+class ResponseCache:
+    """
+    조회 API 응답 캐시. 직렬화된 JSON 본문과 ETag를 LRU(항목 수/바이트/TTL 제한)에 보관합니다.
+    키에는 "수집 세대(generation)"가 포함되며, 파이프라인이 기사/분석을 커밋할 때마다 bump()로 세대를 올려
+    이전 응답을 모두 무효화합니다. ETag는 본문 해시라 프로세스가 재시작되어도 유효합니다.
+    compress_min_bytes 이상인 본문은 Accept-Encoding에 따라 br/gzip으로 압축해 보내며, 압축본의 ETag는
+    `"<해시>-<인코딩>"`입니다 (If-None-Match는 어느 쪽이든 304).
+    """
+
+    def __init__(self, memory: LruTtlCache, max_age: int = 0, compress_min_bytes: int = 0):
+        self.memory = memory
+        self.max_age = max_age
+        self.compress_min_bytes = compress_min_bytes
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def bump(self) -> int:
+        """데이터가 바뀌었음을 알립니다. 이전 세대 항목은 더 이상 조회되지 않으므로 바로 비웁니다."""
+        with self._lock:
+            self.generation += 1
+            self.memory.clear()
+            return self.generation
+
+    def key(self, request: Request, generation: Optional[int] = None) -> str:
+        # 파라미터 순서와 빈 값 차이를 없애 같은 조회는 같은 키가 되도록 정규화
+        params = sorted(
+            (name, value.strip())
+            for name, value in request.query_params.multi_items()
+            if value.strip() and name not in IGNORED_PARAMS
+        )
+        query = "&".join(f"{name}={value}" for name, value in params)
+        generation = self.generation if generation is None else generation
+        return f"{generation}:{request.url.path}?{query}"
+
+    async def get_or_build(self, request: Request, build: Callable[[], Awaitable[bytes]]) -> CachedResponse:
+        generation = self.generation
+        key = self.key(request, generation)
+        with self._lock:
+            entry = self.memory.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        body = await build()
+        entry = CachedResponse(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+        with self._lock:
+            # 조회하는 동안 세대가 바뀌었다면 오래된 결과를 저장하지 않는다
+            if generation == self.generation:
+                self.memory.put(key, entry)
+        return entry
+
+    async def respond(self, request: Request, build: Callable[[], Awaitable[bytes]]) -> Response:
+        """캐시된 JSON 응답을 반환합니다. If-None-Match가 ETag와 일치하면 본문 없이 304를 반환합니다."""
+        entry = await self.get_or_build(request, build)
+        encoding = None
+        if self.compress_min_bytes and len(entry.body) >= self.compress_min_bytes:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        etag = f'{entry.etag[:-1]}-{encoding}"' if encoding else entry.etag
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={self.max_age}, must-revalidate"}
+        if self.compress_min_bytes:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = request.headers.get("if-none-match")
+        if _etag_matches(if_none_match, etag) or _etag_matches(if_none_match, entry.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return Response(content=entry.body, media_type="application/json", headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(content=entry.encoded(encoding), media_type="application/json", headers=headers)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "entries": len(self.memory),
+            "bytes": self.memory.size_bytes,
+        }
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두어는 무시
+    candidates = (part.strip().removeprefix("W/") for part in header.split(","))
+    return etag in candidates
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        LruTtlCache(
+            max_entries=settings.response_cache_max_entries,
+            max_bytes=settings.response_cache_max_bytes,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+            sizeof=lambda entry: len(entry.body),
+        ),
+        max_age=settings.response_cache_max_age,
+        compress_min_bytes=settings.response_compression_min_bytes,
+    )
@@ -0,0 +1,270 @@
+"""
+보존 정책: 오래된 기사와 분석을 아카이브 파일로 옮긴 뒤 DB에서 지웁니다.
+
+기사는 id 순서의 청크(RETENTION_CHUNK_SIZE)로 처리합니다. 청크마다 기사/출처/분석을 한 번에 읽어 아카이브에 쓰고
+디스크에 flush한 다음, 딸린 행(검색 문서, 키워드 색인, 중복 탐지 서명/밴드, 분석)과 기사를 `id IN (...)` DELETE로
+지우고 커밋합니다. 트랜잭션과 메모리가 청크 크기로 제한되고, 중간에 멈춰도 지워진 행은 이미 아카이브에 있습니다.
+(아카이브 후 커밋 전에 멈추면 다음 실행에서 같은 기사가 다시 아카이브될 수 있습니다.)
+
+감성 롤업은 집계값이라 그대로 둡니다 (기간별 추이는 삭제 후에도 유지).
+아카이브 형식은 gzip JSONL(기본)과 Parquet(pyarrow가 설치된 경우)입니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Analysis, Article, Source
+from app.services.dedup import delete_article_signatures
+from app.services.keywords import delete_article_keywords
+from app.services.metrics import RETENTION_ARTICLES
+from app.services.response_cache import get_response_cache
+from app.services.search import delete_documents
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str, Dict[str, int]], None]
+
+_PARQUET_COLUMNS = (
+    ("id", "int64"),
+    ("source", "string"),
+    ("title", "string"),
+    ("link", "string"),
+    ("published_at", "string"),
+    ("created_at", "string"),
+    ("content_raw", "string"),
+    ("content_clean", "string"),
+    ("hash", "string"),
+    ("cluster_id", "int64"),
+    ("analysis", "string"),  # 분석 결과 JSON (없으면 null)
+)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def expired_chunk(db: Session, cutoff: datetime, after_id: int, limit: int) -> list[dict[str, Any]]:
+    """
+    cutoff 이전(발행 시각, 없으면 저장 시각)의 기사를 id > after_id부터 limit건 아카이브 레코드로 읽습니다.
+    출처 이름과 분석 결과를 조인으로 함께 가져오므로 청크당 쿼리는 한 번입니다.
+    """
+    expired = or_(Article.published_at < cutoff, and_(Article.published_at.is_(None), Article.created_at < cutoff))
+    rows = db.execute(
+        select(Article, Source.name, Analysis)
+        .join(Source, Source.id == Article.source_id)
+        .join(Analysis, Analysis.article_id == Article.id, isouter=True)
+        .where(Article.id > after_id, expired)
+        .order_by(Article.id)
+        .limit(limit)
+    ).all()
+    records = []
+    for article, source_name, analysis in rows:
+        records.append(
+            {
+                "id": article.id,
+                "source": source_name,
+                "title": article.title,
+                "link": article.link,
+                "published_at": _iso(article.published_at),
+                "created_at": _iso(article.created_at),
+                "content_raw": article.content_raw,
+                "content_clean": article.content_clean,
+                "hash": article.hash,
+                "cluster_id": article.cluster_id,
+                "analysis": None
+                if analysis is None
+                else {
+                    "summary": analysis.summary,
+                    "sentiment_label": analysis.sentiment_label,
+                    "sentiment_score": analysis.sentiment_score,
+                    "keywords": analysis.keywords,
+                    "json_meta": analysis.json_meta,
+                    "model_name": analysis.model_name,
+                    "created_at": _iso(analysis.created_at),
+                },
+            }
+        )
+    # 아카이브에 쓴 뒤 지울 때 다시 읽지 않도록 세션에서 떼어낸다
+    db.expunge_all()
+    return records
+
+
+def delete_articles(db: Session, article_ids: Iterable[int]) -> dict[str, int]:
+    """기사와 딸린 행(검색 문서, 키워드 색인, 서명/밴드, 분석)을 집합 DELETE로 지우고 커밋합니다."""
+    ids = list(article_ids)
+    if not ids:
+        return {"articles": 0, "analyses": 0}
+    delete_documents(db, ids)
+    delete_article_keywords(db, ids)
+    delete_article_signatures(db, ids)
+    analyses = db.execute(delete(Analysis).where(Analysis.article_id.in_(ids))).rowcount
+    articles = db.execute(delete(Article).where(Article.id.in_(ids))).rowcount
+    db.commit()
+    return {"articles": articles, "analyses": analyses}
+
+
+def purge_source_articles(db: Session, source_id: int, chunk_size: int = 500) -> dict[str, int]:
+    """소스의 모든 기사를 chunk_size씩 지웁니다 (청크마다 커밋, id만 읽음)."""
+    totals = {"articles": 0, "analyses": 0}
+    while True:
+        ids = db.execute(
+            select(Article.id).where(Article.source_id == source_id).order_by(Article.id).limit(chunk_size)
+        ).scalars().all()
+        if not ids:
+            return totals
+        for key, count in delete_articles(db, ids).items():
+            totals[key] += count
+
+
+class JsonlArchive:
+    """gzip JSONL 아카이브. 청크마다 sync flush + fsync하므로 중간에 멈춰도 그때까지 쓴 줄은 읽을 수 있습니다."""
+
+    suffix = ".jsonl.gz"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._raw = open(path, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self._gzip.write(lines.encode("utf-8"))
+        self._gzip.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def close(self) -> None:
+        self._gzip.close()
+        self._raw.close()
+
+
+class ParquetArchive:
+    """Parquet 아카이브 (청크마다 row group 하나, zstd 압축). 파일은 close() 후에 읽을 수 있습니다."""
+
+    suffix = ".parquet"
+
+    def __init__(self, path: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self._pa = pa
+        self._schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in _PARQUET_COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        columns = {name: [record[name] for record in records] for name, _ in _PARQUET_COLUMNS}
+        columns["analysis"] = [
+            json.dumps(value, ensure_ascii=False) if value is not None else None for value in columns["analysis"]
+        ]
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def open_archive(directory: str, fmt: str, now: datetime):
+    """아카이브 파일을 엽니다. parquet을 요청했지만 pyarrow가 없으면 gzip JSONL로 씁니다."""
+    archive_cls = JsonlArchive
+    if fmt == "parquet":
+        if importlib.util.find_spec("pyarrow") is not None:
+            archive_cls = ParquetArchive
+        else:
+            logger.warning("RETENTION_ARCHIVE_FORMAT=parquet but 'pyarrow' is not installed; writing gzip JSONL")
+    elif fmt != "jsonl":
+        raise ValueError(f"Unknown archive format: {fmt}")
+    os.makedirs(directory, exist_ok=True)
+    return archive_cls(os.path.join(directory, f"articles-{now:%Y%m%dT%H%M%S}{archive_cls.suffix}"))
+
+
+async def run_retention(
+    db: AsyncSession,
+    progress: Optional[ProgressCallback] = None,
+    now: Optional[datetime] = None,
+) -> dict[str, Any]:
+    """
+    RETENTION_DAYS보다 오래된 기사를 청크 단위로 아카이브하고 지웁니다.
+    progress를 넘기면 청크마다 누적 카운트(archived, deleted, bytes_reclaimed, archive_bytes)와 함께 호출됩니다.
+    bytes_reclaimed는 지운 행의 JSON 직렬화 크기(압축 전)로 잰 근사값이며, 디스크 파일 크기는 VACUUM 전까지 줄지 않습니다.
+    """
+    settings = get_settings()
+    result: dict[str, Any] = {
+        "archived": 0,
+        "deleted": 0,
+        "deleted_analyses": 0,
+        "bytes_reclaimed": 0,
+        "archive_bytes": 0,
+        "archive_path": None,
+    }
+    if settings.retention_days <= 0:
+        return result
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=settings.retention_days)
+    result["cutoff"] = cutoff
+
+    archive = None
+    last_id = 0
+    try:
+        while True:
+            records = await db.run_sync(expired_chunk, cutoff, last_id, settings.retention_chunk_size)
+            if not records:
+                break
+            last_id = records[-1]["id"]
+            payload = sum(len(json.dumps(record, ensure_ascii=False).encode("utf-8")) for record in records)
+
+            if settings.retention_archive_dir:
+                if archive is None:
+                    archive = open_archive(settings.retention_archive_dir, settings.retention_archive_format, now)
+                    result["archive_path"] = archive.path
+                # 압축/쓰기는 이벤트 루프 밖에서, 삭제는 파일에 내려간 뒤에만
+                await asyncio.to_thread(archive.write, records)
+                result["archived"] += len(records)
+                RETENTION_ARTICLES.labels("archived").inc(len(records))
+                result["archive_bytes"] = os.path.getsize(archive.path)
+
+            counts = await db.run_sync(delete_articles, [record["id"] for record in records])
+            result["deleted"] += counts["articles"]
+            result["deleted_analyses"] += counts["analyses"]
+            result["bytes_reclaimed"] += payload
+            RETENTION_ARTICLES.labels("deleted").inc(counts["articles"])
+            if progress is not None:
+                progress(
+                    "purge",
+                    {key: result[key] for key in ("archived", "deleted", "bytes_reclaimed", "archive_bytes")},
+                )
+    finally:
+        if archive is not None:
+            await asyncio.to_thread(archive.close)
+            result["archive_bytes"] = os.path.getsize(archive.path)
+
+    if result["deleted"]:
+        get_response_cache().bump()
+    logger.info("Retention removed %s articles older than %s", result["deleted"], cutoff)
+    return result
+
+
+if __name__ == "__main__":
+    # python -m app.services.retention run
+    from app.database import get_async_sessionmaker
+
+    if sys.argv[1:] != ["run"]:
+        sys.exit("usage: python -m app.services.retention run")
+
+    async def _main() -> dict[str, Any]:
+        async with get_async_sessionmaker()() as session:
+            return await run_retention(session)
+
+    print(asyncio.run(_main()))
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import Select, delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, SentimentRollup, Source
+
+GRANULARITIES = ("hour", "day")
+
+# (발행 시각, source_id, 감성 라벨, 점수)
+RollupSample = tuple[datetime, int, str, float]
+
+# SQLAlchemy가 SQLite DateTime을 저장하는 문자열 형식과 같아야 증분 갱신과 재계산 키가 일치한다
+_SQLITE_BUCKET_FORMAT = {"hour": "%Y-%m-%d %H:00:00.000000", "day": "%Y-%m-%d 00:00:00.000000"}
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def record_samples(db: Session, samples: Iterable[RollupSample]) -> None:
+    """
+    새로 저장된 분석 결과를 롤업에 더합니다. 배치 안에서 먼저 합산한 뒤 버킷별로 한 번씩 upsert합니다.
+    커밋은 호출자가 담당하므로 분석 INSERT와 같은 트랜잭션에 묶입니다.
+    """
+    totals: dict[tuple, list] = defaultdict(lambda: [0, 0.0, None, None])
+    for published_at, source_id, label, score in samples:
+        for granularity in GRANULARITIES:
+            agg = totals[(granularity, bucket_start(published_at, granularity), source_id, label)]
+            agg[0] += 1
+            agg[1] += score
+            agg[2] = score if agg[2] is None else min(agg[2], score)
+            agg[3] = score if agg[3] is None else max(agg[3], score)
+    if not totals:
+        return
+
+    rows = [
+        {
+            "granularity": granularity,
+            "bucket": bucket,
+            "source_id": source_id,
+            "sentiment_label": label,
+            "count": count,
+            "score_sum": score_sum,
+            "score_min": score_min,
+            "score_max": score_max,
+        }
+        for (granularity, bucket, source_id, label), (count, score_sum, score_min, score_max) in totals.items()
+    ]
+    _upsert(db, rows)
+
+
+def _upsert(db: Session, rows: list[dict]) -> None:
+    dialect = db.get_bind().dialect.name
+    table = SentimentRollup.__table__
+    if dialect == "postgresql":
+        stmt = postgresql.insert(table)
+        lower, upper = func.least, func.greatest
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(table)
+        # SQLite의 인자 2개짜리 min()/max()는 스칼라 함수
+        lower, upper = func.min, func.max
+    else:
+        _merge_rows(db, rows)
+        return
+
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[c.name for c in table.primary_key.columns],
+        set_={
+            "count": table.c.count + excluded.count,
+            "score_sum": table.c.score_sum + excluded.score_sum,
+            "score_min": lower(table.c.score_min, excluded.score_min),
+            "score_max": upper(table.c.score_max, excluded.score_max),
+        },
+    )
+    db.execute(stmt, rows)
+
+
+def _merge_rows(db: Session, rows: list[dict]) -> None:
+    # ON CONFLICT를 지원하지 않는 dialect용 (읽고 더해서 저장)
+    for row in rows:
+        key = (row["granularity"], row["bucket"], row["source_id"], row["sentiment_label"])
+        current = db.get(SentimentRollup, key)
+        if current is None:
+            db.add(SentimentRollup(**row))
+            continue
+        current.count += row["count"]
+        current.score_sum += row["score_sum"]
+        current.score_min = min(current.score_min, row["score_min"])
+        current.score_max = max(current.score_max, row["score_max"])
+
+
+def _bucket_expr(dialect: str, granularity: str, column):
+    if dialect == "postgresql":
+        return func.date_trunc(granularity, column)
+    return func.strftime(_SQLITE_BUCKET_FORMAT[granularity], column)
+
+
+def rebuild_rollups(db: Session) -> int:
+    """analyses 전체에서 롤업을 다시 계산합니다 (집합 연산 INSERT ... SELECT). 생성된 행 수를 반환합니다."""
+    dialect = db.get_bind().dialect.name
+    published = func.coalesce(Article.published_at, Article.created_at)
+    db.execute(delete(SentimentRollup))
+    total = 0
+    for granularity in GRANULARITIES:
+        bucket = _bucket_expr(dialect, granularity, published).label("bucket")
+        source = (
+            select(
+                literal(granularity).label("granularity"),
+                bucket,
+                Article.source_id,
+                Analysis.sentiment_label,
+                func.count().label("count"),
+                func.sum(Analysis.sentiment_score).label("score_sum"),
+                func.min(Analysis.sentiment_score).label("score_min"),
+                func.max(Analysis.sentiment_score).label("score_max"),
+            )
+            .join(Analysis, Analysis.article_id == Article.id)
+            .group_by(bucket, Article.source_id, Analysis.sentiment_label)
+        )
+        columns = ["granularity", "bucket", "source_id", "sentiment_label", "count", "score_sum", "score_min", "score_max"]
+        result = db.execute(insert(SentimentRollup).from_select(columns, source))
+        total += result.rowcount or 0
+    db.commit()
+    return total
+
+
+def delete_source_rollups(db: Session, source_id: int) -> None:
+    db.execute(delete(SentimentRollup).where(SentimentRollup.source_id == source_id))
+
+
+def _range(stmt: Select, granularity: str, from_date: Optional[datetime], to_date: Optional[datetime]) -> Select:
+    # from이 버킷 중간이면 그 버킷부터 포함
+    if from_date:
+        stmt = stmt.where(SentimentRollup.bucket >= bucket_start(from_date, granularity))
+    if to_date:
+        stmt = stmt.where(SentimentRollup.bucket <= to_date)
+    return stmt
+
+
+def sentiment_series_query(
+    granularity: str,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    source_ids: Optional[Select] = None,
+    label: Optional[str] = None,
+) -> Select:
+    """버킷 × 라벨별 기사 수/평균/최소/최대 (소스 합산). 비용은 버킷 수에 비례."""
+    count = func.sum(SentimentRollup.count)
+    stmt = (
+        select(
+            SentimentRollup.bucket,
+            SentimentRollup.sentiment_label,
+            count.label("count"),
+            (func.sum(SentimentRollup.score_sum) / count).label("mean_score"),
+            func.min(SentimentRollup.score_min).label("min_score"),
+            func.max(SentimentRollup.score_max).label("max_score"),
+        )
+        .where(SentimentRollup.granularity == granularity)
+        .group_by(SentimentRollup.bucket, SentimentRollup.sentiment_label)
+        .order_by(SentimentRollup.bucket, SentimentRollup.sentiment_label)
+    )
+    if source_ids is not None:
+        stmt = stmt.where(SentimentRollup.source_id.in_(source_ids))
+    if label:
+        stmt = stmt.where(SentimentRollup.sentiment_label == label)
+    return _range(stmt, granularity, from_date, to_date)
+
+
+def source_stats_query(from_date: Optional[datetime] = None, to_date: Optional[datetime] = None) -> Select:
+    """소스 × 라벨별 합계 (일 단위 롤업 사용)."""
+    count = func.sum(SentimentRollup.count)
+    stmt = (
+        select(
+            Source.id.label("source_id"),
+            Source.name.label("source_name"),
+            SentimentRollup.sentiment_label,
+            count.label("count"),
+            func.sum(SentimentRollup.score_sum).label("score_sum"),
+            func.min(SentimentRollup.score_min).label("min_score"),
+            func.max(SentimentRollup.score_max).label("max_score"),
+        )
+        .join(Source, Source.id == SentimentRollup.source_id)
+        .where(SentimentRollup.granularity == "day")
+        .group_by(Source.id, Source.name, SentimentRollup.sentiment_label)
+        .order_by(Source.id, SentimentRollup.sentiment_label)
+    )
+    return _range(stmt, "day", from_date, to_date)
+
+
+if __name__ == "__main__":
+    # python -m app.services.rollups rebuild
+    from app.database import get_sessionmaker
+
+    if sys.argv[1:] != ["rebuild"]:
+        sys.exit("usage: python -m app.services.rollups rebuild")
+    session = get_sessionmaker()()
+    try:
+        print(f"rebuilt {rebuild_rollups(session)} rollup rows")
+    finally:
+        session.close()
@@ -1,33 +1,58 @@
+"""
+RSS/Atom 피드 수집.
+
+피드마다 마지막 응답의 ETag/Last-Modified를 기억했다가 다음 요청에 If-None-Match/If-Modified-Since로 보내므로,
+바뀌지 않은 피드는 본문 없는 304 한 번으로 끝납니다. feedparser 파싱은 CPU 작업이라 이벤트 루프 밖(스레드)에서 실행합니다.
+"""
 from __future__ import annotations
 
-import hashlib
-from dataclasses import dataclass
+import asyncio
 from datetime import datetime
 from typing import Iterable, List, Optional
 
 import feedparser
 import httpx
 
+from app.services.http_client import get_http_client, http_clients, request_with_retries
+from app.services.news_fetcher import NormalizedArticle, _compute_hash
+
+
+class FeedValidators:
+    """
+    피드 URL별 조건부 요청 검증자 (ETag, Last-Modified).
+    프로세스 메모리에만 보관하므로 재시작 후 첫 요청은 전체 응답을 받고, 중복 기사는 저장 단계의 hash로 걸러집니다.
+    """
+
+    def __init__(self) -> None:
+        self._by_url: dict[str, tuple[Optional[str], Optional[str]]] = {}
+
+    def headers(self, url: str) -> dict[str, str]:
+        etag, last_modified = self._by_url.get(url, (None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
 
-@dataclass
-class NormalizedArticle:
-    title: str
-    link: str
-    published_at: Optional[datetime]
-    content: str
-    source_name: str
-    hash: str
+    def update(self, url: str, response: httpx.Response) -> None:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._by_url[url] = (etag, last_modified)
+        else:
+            self._by_url.pop(url, None)
 
+    def clear(self) -> None:
+        self._by_url = {}
 
-def _compute_hash(link: str, title: str) -> str:
-    return hashlib.sha256(f"{link}:{title}".encode("utf-8")).hexdigest()
 
+feed_validators = FeedValidators()
 
-async def fetch_feed(url: str, source_name: str) -> List[NormalizedArticle]:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        parsed = feedparser.parse(response.text)
+
+def parse_feed(content: bytes, source_name: str) -> List[NormalizedArticle]:
+    """피드 본문(bytes, 인코딩은 feedparser가 XML 선언으로 판단)을 NormalizedArticle 목록으로 바꿉니다."""
+    parsed = feedparser.parse(content)
 
     items: List[NormalizedArticle] = []
     for entry in parsed.entries:
@@ -35,11 +60,11 @@ async def fetch_feed(url: str, source_name: str) -> List[NormalizedArticle]:
         if hasattr(entry, "published_parsed") and entry.published_parsed:
             published = datetime(*entry.published_parsed[:6])
 
-        content = ""
+        content_text = ""
         if entry.get("content"):
-            content = entry.content[0].value
+            content_text = entry.content[0].value
         elif entry.get("summary"):
-            content = entry.summary
+            content_text = entry.summary
 
         title = entry.get("title", "").strip()
         link = entry.get("link", "").strip()
@@ -51,7 +76,7 @@ async def fetch_feed(url: str, source_name: str) -> List[NormalizedArticle]:
                 title=title,
                 link=link,
                 published_at=published,
-                content=content,
+                content=content_text,
                 source_name=source_name,
                 hash=_compute_hash(link, title),
             )
@@ -59,9 +84,27 @@ async def fetch_feed(url: str, source_name: str) -> List[NormalizedArticle]:
     return items
 
 
-async def fetch_multiple(feeds: Iterable[tuple[str, str]]) -> list[NormalizedArticle]:
-    collected: list[NormalizedArticle] = []
-    for url, name in feeds:
-        collected.extend(await fetch_feed(url, name))
-    return collected
+async def fetch_feed(
+    url: str, source_name: str, validators: Optional[FeedValidators] = feed_validators
+) -> Optional[List[NormalizedArticle]]:
+    """
+    피드를 조건부 GET으로 가져옵니다. 304(변경 없음)이면 None을 반환합니다.
+    validators=None이면 조건부 헤더 없이 항상 전체 응답을 받습니다.
+    """
+    headers = validators.headers(url) if validators is not None else {}
+    async with http_clients.host_slot(url):
+        response = await request_with_retries(get_http_client("rss"), "GET", url, headers=headers)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    items = await asyncio.to_thread(parse_feed, response.content, source_name)
+    # 파싱에 성공한 뒤에만 검증자를 갱신 (깨진 응답을 304로 고정하지 않도록)
+    if validators is not None:
+        validators.update(url, response)
+    return items
 
+
+async def fetch_multiple(feeds: Iterable[tuple[str, str]]) -> list[NormalizedArticle]:
+    """여러 피드를 동시에 가져옵니다 (호스트별 동시 요청 한도 적용, 변경 없는 피드는 건너뜀)."""
+    results = await asyncio.gather(*(fetch_feed(url, name) for url, name in feeds))
+    return [item for items in results if items for item in items]
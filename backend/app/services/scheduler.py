@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.services.metrics import (
+    INGEST_RUN_DURATION,
+    INGEST_RUNS,
+    RETENTION_RUN_DURATION,
+    RETENTION_RUNS,
+    Counter,
+    Histogram,
+)
+from app.services.pipeline import run_ingest
+from app.services.retention import run_retention
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class IngestJob:
+    """수집 작업 하나의 상태, 진행 카운트, 단계별 소요 시간."""
+
+    id: str
+    trigger: str
+    status: str = QUEUED
+    stage: Optional[str] = None
+    progress: dict[str, int] = field(default_factory=dict)
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    result: Optional[dict[str, int]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    _stage_started: float = field(default=0.0, repr=False)
+
+    def update(self, stage: str, counts: dict[str, int]) -> None:
+        """파이프라인 progress 콜백. 단계가 바뀌면 이전 단계의 소요 시간을 기록합니다."""
+        if stage != self.stage:
+            self._close_stage()
+            self.stage = stage
+        self.progress.update(counts)
+
+    def _close_stage(self) -> None:
+        now = time.monotonic()
+        if self.stage is not None:
+            self.stage_seconds[self.stage] = round(now - self._stage_started, 3)
+        self._stage_started = now
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        end = self.finished_at or datetime.utcnow()
+        return round((end - self.started_at).total_seconds(), 3)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "trigger": self.trigger,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": dict(self.progress),
+            "stage_seconds": dict(self.stage_seconds),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+class IngestScheduler:
+    """
+    프로세스 내 수집 스케줄러.
+    작업은 큐에 쌓여 단일 워커가 하나씩 실행하므로 수집 회차가 겹치지 않습니다 (single-flight).
+    interval_seconds > 0이면 주기적으로 작업을 추가하며, 이미 실행/대기 중인 작업이 있으면 그 회차는 건너뜁니다.
+    runner와 메트릭을 바꾸면 다른 백그라운드 작업(보존 정책 등)에도 같은 큐/상태 조회를 씁니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval_seconds: float = 0,
+        history: int = 50,
+        runner: Callable[..., Any] = run_ingest,
+        name: str = "ingest",
+        runs_metric: Counter = INGEST_RUNS,
+        duration_metric: Histogram = INGEST_RUN_DURATION,
+    ):
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.history = history
+        self._runner = runner
+        self.name = name
+        self._runs_metric = runs_metric
+        self._duration_metric = duration_metric
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._queue: deque[IngestJob] = deque()
+        self._current: Optional[IngestJob] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def submit(self, trigger: str = "manual") -> IngestJob:
+        """작업을 큐에 넣습니다. 아직 시작하지 않은 작업이 있으면 새로 만들지 않고 그 작업을 돌려줍니다."""
+        if self._queue:
+            return self._queue[-1]
+        job = IngestJob(id=uuid.uuid4().hex, trigger=trigger)
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.history:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.status in (QUEUED, RUNNING):
+                break
+            self._jobs.popitem(last=False)
+        self._queue.append(job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> list[IngestJob]:
+        return list(reversed(self._jobs.values()))
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        if self._queue:
+            self._wakeup.set()
+        self._tasks.append(asyncio.create_task(self._worker(), name=f"{self.name}-worker"))
+        if self.interval_seconds > 0:
+            self._tasks.append(asyncio.create_task(self._ticker(), name=f"{self.name}-ticker"))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._wakeup = None
+
+    async def wait(self, job_id: str, poll: float = 0.01) -> IngestJob:
+        """작업이 끝날 때까지 기다립니다. (테스트, 스크립트용)"""
+        job = self._jobs[job_id]
+        while job.status in (QUEUED, RUNNING):
+            await asyncio.sleep(poll)
+        return job
+
+    async def _ticker(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            if self._current is not None or self._queue:
+                logger.info("Scheduled %s skipped: previous run still in progress", self.name)
+                continue
+            self.submit(trigger="schedule")
+
+    async def _worker(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._queue:
+                job = self._queue.popleft()
+                self._current = job
+                try:
+                    await self._run(job)
+                finally:
+                    self._current = None
+
+    async def _run(self, job: IngestJob) -> None:
+        job.status = RUNNING
+        job.started_at = datetime.utcnow()
+        job._close_stage()
+        started = time.perf_counter()
+        try:
+            async with self._session_factory() as db:
+                job.result = await self._runner(db, progress=job.update)
+            job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = FAILED
+            job.error = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("%s job %s failed", self.name, job.id)
+            job.status = FAILED
+            job.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            job._close_stage()
+            job.finished_at = datetime.utcnow()
+            self._runs_metric.labels(job.status).inc()
+            self._duration_metric.labels(job.status).observe(time.perf_counter() - started)
+
+
+@lru_cache
+def get_ingest_scheduler() -> IngestScheduler:
+    """앱 전체에서 공유하는 수집 스케줄러."""
+    from app.database import get_async_sessionmaker
+
+    settings = get_settings()
+    return IngestScheduler(
+        get_async_sessionmaker(),
+        interval_seconds=settings.ingest_interval_minutes * 60,
+        history=settings.ingest_job_history,
+    )
+
+
+@lru_cache
+def get_retention_scheduler() -> IngestScheduler:
+    """보존 정책(아카이브 후 삭제) 작업 스케줄러. RETENTION_INTERVAL_HOURS가 0이면 수동 실행만."""
+    from app.database import get_async_sessionmaker
+
+    settings = get_settings()
+    return IngestScheduler(
+        get_async_sessionmaker(),
+        interval_seconds=settings.retention_interval_hours * 3600,
+        history=settings.ingest_job_history,
+        runner=run_retention,
+        name="retention",
+        runs_metric=RETENTION_RUNS,
+        duration_metric=RETENTION_RUN_DURATION,
+    )
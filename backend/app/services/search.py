@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import re
+import sys
+from typing import Iterable, Optional
+
+from sqlalchemy import column, delete, false, func, insert, literal_column, select, table, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Query, Session
+
+from app.models import Analysis, Article, ArticleSearch
+
+FTS_TABLE = "article_search_fts"
+
+# SQLite FTS5 external-content 테이블: article_search 변경을 트리거로 따라간다
+SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "document, content='article_search', content_rowid='article_id', tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS article_search_ai AFTER INSERT ON article_search BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.article_id, new.document); END",
+    "CREATE TRIGGER IF NOT EXISTS article_search_ad AFTER DELETE ON article_search BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.article_id, old.document); END",
+    "CREATE TRIGGER IF NOT EXISTS article_search_au AFTER UPDATE ON article_search BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.article_id, old.document); "
+    f"INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.article_id, new.document); END",
+)
+
+_fts = table(FTS_TABLE, column("rowid"))
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ensure_search_index(bind: Engine | Connection) -> None:
+    """dialect별 보조 검색 구조를 만든다. (PostgreSQL GIN 인덱스는 모델 메타데이터가 생성)"""
+    if bind.dialect.name != "sqlite":
+        return
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            _create_sqlite_fts(conn)
+    else:
+        _create_sqlite_fts(bind)
+
+
+def _create_sqlite_fts(conn: Connection) -> None:
+    for ddl in SQLITE_FTS_DDL:
+        conn.execute(text(ddl))
+
+
+def build_document(title: str, content: Optional[str], keywords: Optional[Iterable[str]]) -> str:
+    parts = [title, content or "", " ".join(keywords or [])]
+    return " ".join(part for part in parts if part)
+
+
+def index_document(
+    db: Session,
+    article_id: int,
+    title: str,
+    content: Optional[str],
+    keywords: Optional[Iterable[str]] = None,
+) -> None:
+    """기사 검색 문서를 추가/갱신합니다. 커밋은 호출자가 담당합니다."""
+    db.merge(ArticleSearch(article_id=article_id, document=build_document(title, content, keywords)))
+
+
+def index_article(db: Session, article: Article, keywords: Optional[Iterable[str]] = None) -> None:
+    index_document(db, article.id, article.title, article.content_clean, keywords)
+
+
+DocumentSource = tuple[int, str, Optional[str], Optional[Iterable[str]]]
+
+
+def insert_documents(db: Session, docs: list[DocumentSource]) -> None:
+    """(article_id, title, content, keywords) 목록을 한 번에 색인합니다. 새 기사 전용."""
+    if docs:
+        db.execute(insert(ArticleSearch), [_document_row(*doc) for doc in docs])
+
+
+def update_documents(db: Session, docs: list[DocumentSource]) -> None:
+    """이미 색인된 기사들의 검색 문서를 기본키 기준으로 일괄 갱신합니다."""
+    if docs:
+        db.execute(update(ArticleSearch), [_document_row(*doc) for doc in docs])
+
+
+def delete_documents(db: Session, article_ids: Iterable[int]) -> None:
+    """기사들의 검색 문서를 지웁니다 (SQLite FTS5 색인은 트리거가 따라간다)."""
+    ids = list(article_ids)
+    if ids:
+        db.execute(delete(ArticleSearch).where(ArticleSearch.article_id.in_(ids)))
+
+
+def _document_row(article_id: int, title: str, content: Optional[str], keywords: Optional[Iterable[str]]) -> dict:
+    return {"article_id": article_id, "document": build_document(title, content, keywords)}
+
+
+def rebuild_search_index(db: Session, chunk_size: int = 1000) -> int:
+    """전체 기사의 검색 문서를 다시 생성합니다."""
+    ensure_search_index(db.connection())
+    db.query(ArticleSearch).delete(synchronize_session=False)
+    rows = (
+        db.query(Article.id, Article.title, Article.content_clean, Analysis.keywords)
+        .join(Analysis, Analysis.article_id == Article.id, isouter=True)
+        .order_by(Article.id)
+        .yield_per(chunk_size)
+    )
+    batch: list[dict] = []
+    total = 0
+    for row in rows:
+        batch.append({"article_id": row.id, "document": build_document(row.title, row.content_clean, row.keywords)})
+        if len(batch) >= chunk_size:
+            db.bulk_insert_mappings(ArticleSearch, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(ArticleSearch, batch)
+        total += len(batch)
+    db.commit()
+    return total
+
+
+def _tokens(q: str) -> list[str]:
+    return _TOKEN_RE.findall(q)
+
+
+def apply_search(query: Query, dialect_name: str, q: str):
+    """
+    검색어 조건을 쿼리에 적용하고 (query, rank 표현식)을 반환합니다.
+    각 토큰은 접두어 일치로 검색합니다 (예: '금리' → '금리가', '금리인하').
+    """
+    tokens = _tokens(q)
+    if not tokens:
+        return query.filter(false()), literal_column("0.0")
+
+    if dialect_name == "sqlite":
+        match = " ".join('"{}"*'.format(tok.replace('"', '""')) for tok in tokens)
+        hits = (
+            select(_fts.c.rowid.label("article_id"), (-func.bm25(literal_column(FTS_TABLE))).label("rank"))
+            .select_from(_fts)
+            .where(literal_column(FTS_TABLE).op("MATCH")(match))
+            .subquery("search_hits")
+        )
+        return query.join(hits, hits.c.article_id == Article.id), hits.c.rank
+
+    if dialect_name == "postgresql":
+        vector = func.to_tsvector(literal_column("'simple'"), ArticleSearch.document)
+        tsquery = func.to_tsquery(literal_column("'simple'"), " & ".join(f"{tok}:*" for tok in tokens))
+        query = query.join(ArticleSearch, ArticleSearch.article_id == Article.id).filter(vector.op("@@")(tsquery))
+        return query, func.ts_rank(vector, tsquery)
+
+    # 그 외 dialect: 색인 문서에 대한 단순 부분 일치
+    query = query.join(ArticleSearch, ArticleSearch.article_id == Article.id)
+    for tok in tokens:
+        query = query.filter(ArticleSearch.document.ilike(f"%{tok}%"))
+    return query, literal_column("0.0")
+
+
+if __name__ == "__main__":
+    # python -m app.services.search rebuild
+    from app.database import get_sessionmaker
+
+    if sys.argv[1:] != ["rebuild"]:
+        sys.exit("usage: python -m app.services.search rebuild")
+    session = get_sessionmaker()()
+    try:
+        print(f"indexed {rebuild_search_index(session)} articles")
+    finally:
+        session.close()
@@ -0,0 +1,106 @@
+"""
+JSON 직렬화와 응답 압축.
+
+조회 라우트는 컬럼 프로젝션 행을 dict로 만든 뒤 Pydantic 검증을 거치지 않고 orjson으로 바로 직렬화합니다
+(response_model은 OpenAPI 문서용). 출력 바이트는 `model_dump_json`과 같습니다 (naive datetime, UTF-8, 공백 없음).
+압축은 Accept-Encoding 협상으로 br(brotli 패키지가 설치된 경우) 또는 gzip을 고릅니다.
+"""
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import zlib
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache
+def brotli_available() -> bool:
+    return importlib.util.find_spec("brotli") is not None
+
+
+def supported_encodings() -> tuple[str, ...]:
+    # q값이 같으면 앞쪽 우선 (br이 같은 수준에서 gzip보다 작고 빠름)
+    return ("br", "gzip") if brotli_available() else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding에서 q값이 가장 높은 지원 인코딩을 고릅니다. 없으면 None(압축 안 함)."""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        import brotli
+
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0: 같은 본문은 같은 압축 결과 (압축본 ETag가 본문 해시에서 나오므로)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class StreamCompressor:
+    """스트리밍 응답용 압축기. 전체를 모으지 않고 청크마다 압축된 바이트를 돌려줍니다."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            import brotli
+
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress, self._finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = compressor.compress, compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data) if data else b""
+
+    def flush(self) -> bytes:
+        return self._finish()
+
+
+async def compress_stream(chunks: AsyncIterator[bytes], encoding: str) -> AsyncIterator[bytes]:
+    compressor = StreamCompressor(encoding)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    tail = compressor.flush()
+    if tail:
+        yield tail
@@ -1,11 +1,93 @@
 import html
 import re
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Sequence
 
+DEFAULT_MAX_LEN = 8000
 
-def clean_html(text: str, max_len: int = 8000) -> str:
-    # 단순 태그 제거 및 공백 정리
-    no_tags = re.sub(r"<[^>]+>", " ", text)
-    unescaped = html.unescape(no_tags)
-    normalized = re.sub(r"\s+", " ", unescaped).strip()
-    return normalized[:max_len]
+# 한 번의 스캔으로 토큰을 나눈다. 분기 순서가 우선순위:
+# script/style 여는 태그, 주석 시작, 태그, 엔티티, 텍스트 구간, 짝 없는 '<'/'&'
+# 태그는 다음 '<' 전까지만 찾으므로 짝 없는 '<'가 많아도 선형 시간,
+# 텍스트 구간은 1024자 단위로 끊어 태그 없는 긴 본문에서도 길이 한도에서 바로 멈춘다
+_TOKEN_RE = re.compile(
+    r"(?P<block><(?P<name>script|style)\b[^>]*>)"
+    r"|(?P<comment><!--)"
+    r"|(?P<tag><[^<>]*>)"
+    r"|(?P<entity>&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);?)"
+    r"|(?P<text>[^<&]{1,1024})"
+    r"|(?P<stray>[<&])",
+    re.IGNORECASE,
+)
+# 블록 안쪽은 토큰으로 나누지 않고 닫는 태그로 바로 건너뛴다 (닫는 태그가 없으면 끝까지)
+_BLOCK_END = {
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
 
+
+def clean_html(text: str, max_len: int = DEFAULT_MAX_LEN) -> str:
+    """
+    태그/스크립트/스타일/주석 제거, 엔티티 해제, 공백 정리를 한 번의 스캔으로 처리합니다.
+    결과가 max_len 글자에 도달하면 나머지 입력은 읽지 않습니다.
+    """
+    parts: list[str] = []
+    length = 0
+    pending_space = False
+    pos, end = 0, len(text)
+    while pos < end and length < max_len:
+        match = _TOKEN_RE.match(text, pos)
+        kind = match.lastgroup
+        pos = match.end()
+
+        if kind == "block":
+            close = _BLOCK_END[match.group("name").lower()].search(text, pos)
+            pos = close.end() if close else end
+            pending_space = True
+            continue
+        if kind == "comment":
+            close = text.find("-->", pos)
+            pos = close + 3 if close >= 0 else end
+            pending_space = True
+            continue
+        if kind == "tag":
+            # 태그도 단어 경계로 취급
+            pending_space = True
+            continue
+
+        token = html.unescape(match.group()) if kind == "entity" else match.group()
+        words = token.split()
+        if not words:
+            pending_space = True
+            continue
+        if (pending_space or token[0].isspace()) and parts:
+            parts.append(" ")
+            length += 1
+        parts.append(" ".join(words))
+        length += len(parts[-1])
+        pending_space = token[-1].isspace()
+
+    return "".join(parts)[:max_len].strip()
+
+
+def _clean_chunk(texts: Sequence[Optional[str]], max_len: int) -> list[str]:
+    return [clean_html(text or "", max_len) for text in texts]
+
+
+def clean_html_batch(
+    texts: Sequence[Optional[str]],
+    max_len: int = DEFAULT_MAX_LEN,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+) -> list[str]:
+    """
+    여러 본문을 정제합니다. executor(예: ProcessPoolExecutor)를 넘기면 chunk_size 단위로 나눠 병렬 처리합니다.
+    None인 본문은 빈 문자열이 됩니다.
+    """
+    if executor is None or len(texts) <= chunk_size:
+        return _clean_chunk(texts, max_len)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    cleaned: list[str] = []
+    for part in executor.map(partial(_clean_chunk, max_len=max_len), chunks):
+        cleaned.extend(part)
+    return cleaned
@@ -0,0 +1,153 @@
+"""
+수집 중 조회 지연 벤치마크: `/articles` 지연(p50/p95/p99)을 유휴 상태와 수집 실행 중에 비교합니다.
+
+    python -m benchmarks.bench_concurrency --articles 20000 --ingest 1000 --concurrency 16
+    python -m benchmarks.bench_concurrency --database-url postgresql+psycopg://...
+
+앱과 수집 파이프라인을 같은 이벤트 루프에서 실행합니다 (httpx ASGITransport).
+외부 API는 tests/fakes.py의 가짜 NEWSDATA/Gemini 서버로 대체하고, 응답 캐시는 꺼서 매 요청이 DB를 조회합니다.
+DB 작업이 이벤트 루프를 막으면 수집 중 p99가 분석 지연/커밋 시간만큼 튀고, async 엔진이면 유휴 상태와 비슷하게 유지됩니다.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _summary(label: str, latencies: list[float], elapsed: float) -> str:
+    ms = [v * 1000 for v in latencies]
+    return (
+        f"{label:<12} n={len(ms):>5} rps={len(ms) / elapsed:7.1f} "
+        f"p50={percentile(ms, 50):7.1f}ms p95={percentile(ms, 95):7.1f}ms "
+        f"p99={percentile(ms, 99):7.1f}ms max={max(ms):7.1f}ms mean={statistics.fmean(ms):7.1f}ms"
+    )
+
+
+async def _load(client, concurrency: int, until, latencies: list[float]) -> None:
+    async def worker(index: int) -> None:
+        sorts = ("published_desc", "score_desc")
+        i = 0
+        while not until():
+            started = time.perf_counter()
+            response = await client.get("/articles", params={"limit": 50, "sort": sorts[(index + i) % 2]})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+            i += 1
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+async def _run(args, database_url: str) -> None:
+    import httpx
+
+    from app.main import app
+    from app.database import async_url, get_async_db, pool_options
+    from app.services.pipeline import run_ingest
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(async_url(database_url), **pool_options(database_url, is_async=True))
+    factory = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    async def _db():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = _db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/articles", params={"limit": 50})  # 연결 풀 워밍업
+
+        idle: list[float] = []
+        deadline = time.perf_counter() + args.idle_seconds
+        started = time.perf_counter()
+        await _load(client, args.concurrency, lambda: time.perf_counter() >= deadline, idle)
+        print(_summary("idle", idle, time.perf_counter() - started))
+
+        busy: list[float] = []
+        async with factory() as db:
+            ingest = asyncio.create_task(run_ingest(db))
+            started = time.perf_counter()
+            await _load(client, args.concurrency, ingest.done, busy)
+            result = await ingest
+        elapsed = time.perf_counter() - started
+        print(_summary("ingesting", busy, elapsed))
+        print(f"ingest: {result} in {elapsed:.2f}s")
+
+    app.dependency_overrides.pop(get_async_db, None)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20_000, help="미리 채워 둘 기사 수")
+    parser.add_argument("--ingest", type=int, default=1_000, help="가짜 NEWSDATA가 돌려줄 신규 기사 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    parser.add_argument("--gemini-latency", type=float, default=0.05)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args()
+
+    from fakes import make_gemini_app, make_newsdata_app, newsdata_article, serve
+
+    newest = datetime(2026, 6, 1)
+    feed = [
+        newsdata_article(100_000 + i, (newest - timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"))
+        for i in range(args.ingest)
+    ]
+    from benchmarks.synthetic import iter_articles
+
+    for item, article in zip(feed, iter_articles(len(feed), seed=7)):
+        # 분석 대상이 되도록 본문을 충분히 길게, 근접 중복으로 묶이지 않도록 기사마다 다르게
+        item["description"] = f"{item['title']} {article['content']}"
+
+    with tempfile.TemporaryDirectory() as tmpdir, serve(make_newsdata_app(feed, page_size=50)) as newsdata_url, serve(
+        make_gemini_app(latency=args.gemini_latency)
+    ) as gemini_url:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        os.environ.update(
+            DATABASE_URL=database_url,
+            NEWSDATA_API_KEY="bench",
+            NEWSDATA_BASE_URL=newsdata_url,
+            NEWSDATA_MAX_PAGES=str(args.ingest // 50 + 1),
+            NEWSDATA_MAX_CREDITS=str(args.ingest // 50 + 1),
+            GEMINI_API_KEY="bench",
+            GEMINI_BASE_URL=gemini_url,
+            RATE_LIMIT_PER_MIN="1000000",
+            RESPONSE_CACHE_MAX_ENTRIES="0",
+        )
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from app.config import get_settings
+        from app.models import Base
+        from app.services.search import ensure_search_index
+        from benchmarks.synthetic import seed_database
+
+        get_settings.cache_clear()
+        sync_engine = create_engine(database_url)
+        Base.metadata.create_all(sync_engine)
+        ensure_search_index(sync_engine)
+        with Session(sync_engine) as db:
+            seed_database(db, args.articles)
+        sync_engine.dispose()
+
+        asyncio.run(_run(args, database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+근접 중복 탐지 벤치마크: MinHash 서명 계산 처리량과 저장된 서명 규모별 묶음 배정(LSH 조회) 시간.
+
+    python -m benchmarks.bench_dedup --sizes 10000 100000 1000000
+    python -m benchmarks.bench_dedup --database-url postgresql+psycopg://... --sizes 100000
+
+각 크기마다 새 DB에 합성 기사를 채우고 서명/밴드 버킷을 저장한 뒤(서명 계산 docs/s, 색인 저장 시간),
+수집 1회차 분량(--batch)의 새 기사로 assign_clusters를 실행해 기사당 조회 시간을 잽니다.
+새 기사의 절반은 저장된 기사를 조금 고친 재배포본이며, 이 중 원본 묶음에 합류한 비율(recall)과
+나머지 새 기사가 잘못 묶인 수(false merges)도 함께 출력합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Article, Base, StoryBand, StorySignature
+from app.services.dedup import assign_clusters, band_buckets, pack_signature, signature
+from benchmarks.synthetic import iter_articles, seed_database
+
+CHUNK_SIZE = 5000
+
+
+def _syndicate(text: str, rng: random.Random) -> str:
+    words = text.split()
+    for _ in range(max(1, len(words) // 25)):
+        words[rng.randrange(len(words))] = "수정"
+    return "(서울=연합뉴스) " + " ".join(words) + " 무단 전재 및 재배포 금지"
+
+
+def _index_stored(db: Session) -> tuple[int, float, float]:
+    """저장된 기사 전체의 서명을 계산해 저장합니다. (서명 수, 계산 시간, 저장 시간)을 반환합니다."""
+    computed, compute_time, write_time, last_id = 0, 0.0, 0.0, 0
+    while True:
+        rows = db.execute(
+            select(Article.id, Article.content_clean).where(Article.id > last_id).order_by(Article.id).limit(CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return computed, compute_time, write_time
+        last_id = rows[-1].id
+
+        started = time.perf_counter()
+        signed = [(article_id, sig) for article_id, text in rows if (sig := signature(text)) is not None]
+        buckets = [(article_id, band_buckets(sig)) for article_id, sig in signed]
+        compute_time += time.perf_counter() - started
+        computed += len(signed)
+
+        started = time.perf_counter()
+        db.execute(insert(StorySignature), [{"article_id": a, "signature": pack_signature(s)} for a, s in signed])
+        db.execute(insert(StoryBand), [{"bucket": k, "article_id": a} for a, keys in buckets for k in set(keys)])
+        db.execute(update(Article).where(Article.id <= last_id, Article.id > last_id - CHUNK_SIZE).values(cluster_id=Article.id))
+        db.commit()
+        write_time += time.perf_counter() - started
+
+
+def _add_batch(db: Session, size: int, batch: int, rng: random.Random) -> tuple[list[tuple[int, str]], dict[int, int]]:
+    """재배포본 batch/2건과 새 기사 batch/2건을 저장하고 (기사 목록, 재배포본 → 원본 id)를 반환합니다."""
+    originals = db.execute(
+        select(Article.id, Article.content_clean).where(Article.id.in_(rng.sample(range(1, size + 1), batch // 2)))
+    ).all()
+    texts = [(_syndicate(text, rng), source_id) for source_id, text in originals]
+    texts += [(item["content"], None) for item in iter_articles(batch - len(texts), seed=7, start=size + 1)]
+    source_id = db.execute(select(Article.source_id).limit(1)).scalar_one()
+
+    rows, expected = [], {}
+    for offset, (text, original) in enumerate(texts):
+        article = Article(
+            source_id=source_id, title="bench", link=f"https://bench.example.com/{offset}", content_clean=text, hash=f"bench-dup:{offset}"
+        )
+        db.add(article)
+        db.flush()
+        rows.append((article.id, text))
+        if original is not None:
+            expected[article.id] = original
+    db.commit()
+    return rows, expected
+
+
+def run(size: int, database_url: str | None, batch: int, threshold: float) -> None:
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    rng = random.Random(size)
+
+    with Session(engine) as db:
+        started = time.perf_counter()
+        seed_database(db, size, with_search=False)
+        print(f"[{size:>9,}] seeded in {time.perf_counter() - started:.1f}s")
+
+        computed, compute_time, write_time = _index_stored(db)
+        print(
+            f"[{size:>9,}] signatures: {computed:,} in {compute_time:.1f}s ({computed / compute_time:,.0f} docs/s), "
+            f"index write {write_time:.1f}s"
+        )
+
+        rows, expected = _add_batch(db, size, batch, rng)
+        started = time.perf_counter()
+        assigned = assign_clusters(db, rows, threshold)
+        elapsed = time.perf_counter() - started
+        found = sum(assigned.get(article_id) == original for article_id, original in expected.items())
+        false_merges = sum(
+            1 for article_id, _ in rows if article_id not in expected and assigned.get(article_id, article_id) != article_id
+        )
+        print(
+            f"[{size:>9,}] assign {len(rows)} new: {elapsed * 1000:.0f}ms ({elapsed / len(rows) * 1000:.2f}ms/article), "
+            f"recall={found / len(expected):.3f} false_merges={false_merges}"
+        )
+
+    engine.dispose()
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--batch", type=int, default=500, help="배정할 새 기사 수 (수집 1회차 분량)")
+    parser.add_argument("--threshold", type=float, default=get_settings().story_dedup_threshold)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.database_url, args.batch, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+내보내기 벤치마크: 행 수별 /export/articles 스트림의 처리량과 최대 메모리(tracemalloc).
+
+    python -m benchmarks.bench_export --rows 10000 100000 1000000
+    python -m benchmarks.bench_export --database-url postgresql+psycopg://... --rows 1000000 --formats csv
+
+각 크기마다 새 DB에 합성 기사/분석을 채운 뒤 형식(csv, csv+gzip, ndjson, parquet)별로 전체를 내보내
+rows/s, 출력 크기, 파이썬 힙 최대 사용량을 출력합니다. 서버 측 커서로 배치씩 읽으므로 최대 메모리는
+행 수가 늘어도 거의 같아야 합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+
+from app.database import async_url
+from app.models import Base
+from app.routes.articles import ArticleFilters, filtered_query
+from app.services.export import EXPORT_BATCH_SIZE, parquet_available, stream_export
+from benchmarks.synthetic import seed_database
+
+VARIANTS = {"csv": ("csv", False), "csv.gz": ("csv", True), "ndjson": ("ndjson", False), "parquet": ("parquet", False)}
+
+
+def _build_query(session, columns):
+    return filtered_query(session, columns, ArticleFilters())[0]
+
+
+async def _export(database_url: str, fmt: str, gzip: bool, batch_size: int) -> tuple[int, float, int]:
+    engine = create_async_engine(async_url(database_url))
+    try:
+        tracemalloc.start()
+        started = time.perf_counter()
+        written = 0
+        async for chunk in stream_export(engine, _build_query, fmt, gzip=gzip, batch_size=batch_size):
+            written += len(chunk)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return written, elapsed, peak
+    finally:
+        await engine.dispose()
+
+
+def run(rows: int, database_url: str | None, formats: list[str], batch_size: int) -> None:
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        started = time.perf_counter()
+        seed_database(db, rows, with_search=False)
+        print(f"[{rows:>9,}] seeded in {time.perf_counter() - started:.1f}s")
+    engine.dispose()
+
+    for name in formats:
+        fmt, gzip = VARIANTS[name]
+        if fmt == "parquet" and not parquet_available():
+            print(f"[{rows:>9,}] {name:<8} skipped (pyarrow not installed)")
+            continue
+        written, elapsed, peak = asyncio.run(_export(database_url, fmt, gzip, batch_size))
+        print(
+            f"[{rows:>9,}] {name:<8} {rows / elapsed:>9,.0f} rows/s  {written / 1024 / 1024:>8.1f} MiB out  "
+            f"peak heap {peak / 1024 / 1024:.1f} MiB"
+        )
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--formats", nargs="+", choices=sorted(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    for rows in args.rows:
+        run(rows, args.database_url, args.formats, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
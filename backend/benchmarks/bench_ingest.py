@@ -0,0 +1,107 @@
+"""
+기사 저장 벤치마크: 기존 건별 경로(SELECT + flush + 기사마다 commit) vs bulk_insert_articles.
+
+    python -m benchmarks.bench_ingest --sizes 100 1000 10000
+    python -m benchmarks.bench_ingest --database-url postgresql+psycopg://... --sizes 1000
+
+크기마다 새 DB에서 (1) 신규 N건 저장, (2) 같은 N건 재수집(전부 중복) 시간을 측정합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Article, Base, Source
+from app.services.news_fetcher import NormalizedArticle, _compute_hash
+from app.services.pipeline import bulk_insert_articles
+from app.services.search import ensure_search_index, index_article
+from app.utils.text import clean_html
+from benchmarks.synthetic import iter_articles
+
+
+def _items(count: int) -> list[NormalizedArticle]:
+    return [
+        NormalizedArticle(
+            title=row["title"],
+            link=row["link"],
+            published_at=row["published_at"],
+            content=f"<p>{row['content']}</p>",
+            source_name="newsdata:bench",
+            hash=_compute_hash(row["link"], row["title"]),
+        )
+        for row in iter_articles(count)
+    ]
+
+
+def legacy_ingest(db: Session, source: Source, items: list[NormalizedArticle]) -> int:
+    """일괄 INSERT 이전 run_ingest의 저장 루프: 기사마다 해시로 조회한 뒤 없으면 한 건씩 INSERT."""
+    inserted = 0
+    for item in items:
+        found = db.query(Article).filter(Article.hash == item.hash).one_or_none()
+        if found:
+            continue
+        article = Article(
+            source_id=source.id,
+            title=item.title,
+            link=item.link,
+            published_at=item.published_at,
+            content_raw=item.content,
+            content_clean=clean_html(item.content),
+            hash=item.hash,
+        )
+        db.add(article)
+        db.flush()
+        index_article(db, article)
+        db.commit()
+        inserted += 1
+    return inserted
+
+
+def bulk_ingest(db: Session, source: Source, items: list[NormalizedArticle]) -> int:
+    return len(bulk_insert_articles(db, [(source, item) for item in items]))
+
+
+def _measure(database_url: str, ingest, items: list[NormalizedArticle]) -> tuple[float, float]:
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    ensure_search_index(engine)
+    with Session(engine) as db:
+        source = Source(name="newsdata", api_type="newsdata", active=True)
+        db.add(source)
+        db.commit()
+        timings = []
+        for expected in (len(items), 0):
+            started = time.perf_counter()
+            assert ingest(db, source, items) == expected
+            timings.append(time.perf_counter() - started)
+    engine.dispose()
+    return timings[0], timings[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        for size in args.sizes:
+            items = _items(size)
+            legacy_new, legacy_dup = _measure(database_url, legacy_ingest, items)
+            bulk_new, bulk_dup = _measure(database_url, bulk_ingest, items)
+            print(
+                f"[{size:>6,}] new: legacy={legacy_new * 1000:9.1f}ms bulk={bulk_new * 1000:8.1f}ms "
+                f"({legacy_new / bulk_new:5.1f}x) | duplicates: legacy={legacy_dup * 1000:8.1f}ms "
+                f"bulk={bulk_dup * 1000:7.1f}ms ({legacy_dup / bulk_dup:5.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
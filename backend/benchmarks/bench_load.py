@@ -0,0 +1,300 @@
+"""
+부하 테스트: 조회(list, search, detail)와 전체 수집(ingest) 시나리오의 처리량과 지연(p50/p95/p99)을 JSON으로 기록합니다.
+
+    python -m benchmarks.bench_load --output load.json
+    python -m benchmarks.bench_load --scenarios list search --duration 10 --concurrency 32
+    python -m benchmarks.bench_load --baseline load-main.json --output load.json
+    python -m benchmarks.bench_load --database-url postgresql+psycopg://... --articles 100000
+
+새 DB에 합성 기사/분석(benchmarks/synthetic.py)을 --articles건 채우고, 앱은 httpx ASGITransport로 같은 프로세스에서 실행합니다.
+외부 API는 tests/fakes.py의 가짜 NEWSDATA/Gemini 서버(지연, 오류율 설정 가능)로 대체합니다.
+응답 캐시는 꺼서 조회 요청마다 DB를 조회하며, 같은 --seed면 같은 데이터와 같은 요청 순서로 실행됩니다.
+ingest는 회차마다 새 기사 --ingest건을 수집/분석하고, 지연은 회차별 소요 시간, 처리량은 기사/초입니다.
+--baseline을 주면 이전 결과 파일(다른 커밋에서 실행)과 처리량/p95/p99 변화를 비교해 출력합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from benchmarks.bench_concurrency import percentile
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+READ_SCENARIOS = ("list", "search", "detail")
+SCENARIOS = READ_SCENARIOS + ("ingest",)
+
+# (경로, 쿼리 파라미터)를 만드는 요청 생성기: rng, 기사 수 → 요청
+RequestFactory = Callable[[random.Random, int], tuple[str, dict]]
+
+
+def _list_request(rng: random.Random, articles: int) -> tuple[str, dict]:
+    from benchmarks.synthetic import LABELS
+
+    params = {"limit": 50, "sort": rng.choice(("published_desc", "score_desc"))}
+    if rng.random() < 0.3:
+        params["sentiment"] = rng.choice(LABELS)
+    return "/articles", params
+
+
+def _search_request(rng: random.Random, articles: int) -> tuple[str, dict]:
+    from benchmarks.synthetic import SUBJECTS, TOPICS
+
+    terms = [rng.choice(TOPICS)] if rng.random() < 0.7 else [rng.choice(SUBJECTS), rng.choice(TOPICS)]
+    return "/articles", {"q": " ".join(terms), "limit": 20, "sort": rng.choice(("relevance", "published_desc"))}
+
+
+def _detail_request(rng: random.Random, articles: int) -> tuple[str, dict]:
+    return f"/articles/{rng.randint(1, articles)}", {}
+
+
+REQUESTS: dict[str, RequestFactory] = {"list": _list_request, "search": _search_request, "detail": _detail_request}
+
+
+def latency_summary(latencies: list[float]) -> dict[str, float]:
+    ms = [value * 1000 for value in latencies] or [0.0]
+    return {
+        "p50": round(percentile(ms, 50), 3),
+        "p95": round(percentile(ms, 95), 3),
+        "p99": round(percentile(ms, 99), 3),
+        "max": round(max(ms), 3),
+        "mean": round(statistics.fmean(ms), 3),
+    }
+
+
+async def _read_scenario(client, name: str, args) -> dict:
+    make_request = REQUESTS[name]
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(index: int, deadline: float, record: bool) -> None:
+        nonlocal errors
+        rng = random.Random(f"{args.seed}:{name}:{index}")
+        while time.perf_counter() < deadline:
+            path, params = make_request(rng, args.articles)
+            started = time.perf_counter()
+            response = await client.get(path, params=params)
+            if not record:
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    # 워밍업(연결 풀, 쿼리 플랜 캐시)은 기록하지 않는다
+    warmup_deadline = time.perf_counter() + args.warmup
+    await asyncio.gather(*(worker(-1 - i, warmup_deadline, False) for i in range(args.concurrency)))
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(worker(i, deadline, True) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": args.concurrency,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": latency_summary(latencies),
+    }
+
+
+def _ingest_batch(run: int, count: int, seed: int) -> list[dict]:
+    from fakes import newsdata_article
+
+    from benchmarks.synthetic import iter_articles
+
+    # 회차마다 워터마크보다 새 기사가 되도록 발행 시각을 하루씩 뒤로
+    newest = datetime(2026, 6, 1) + timedelta(days=run)
+    start = 1_000_000 + run * count
+    batch = []
+    for i, article in enumerate(iter_articles(count, seed=seed, start=start)):
+        item = newsdata_article(start + i, (newest - timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"))
+        # 분석 대상이 되도록 본문을 충분히 길게, 근접 중복으로 묶이지 않도록 기사마다 다르게
+        item["description"] = f"{item['title']} {article['content']}"
+        batch.append(item)
+    return batch
+
+
+async def _ingest_scenario(newsdata_app, gemini_app, args) -> dict:
+    from app.database import get_async_sessionmaker
+    from app.services.pipeline import run_ingest
+
+    durations: list[float] = []
+    totals = {"fetched": 0, "analyzed": 0, "duplicates": 0}
+    for run in range(args.ingest_runs):
+        newsdata_app.state.articles = _ingest_batch(run, args.ingest, args.seed)
+        async with get_async_sessionmaker()() as db:
+            started = time.perf_counter()
+            result = await run_ingest(db)
+            durations.append(time.perf_counter() - started)
+        for key in totals:
+            totals[key] += result.get(key, 0)
+    elapsed = sum(durations)
+    return {
+        "runs": args.ingest_runs,
+        **totals,
+        "errors": {"newsdata": newsdata_app.state.errors, "gemini": gemini_app.state.errors},
+        "gemini_calls": gemini_app.state.calls,
+        "duration_s": round(elapsed, 3),
+        "throughput_articles_per_s": round(totals["fetched"] / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": latency_summary(durations),
+    }
+
+
+async def _run(args, newsdata_app, gemini_app) -> dict:
+    import httpx
+
+    from app.database import dispose_engines
+    from app.main import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in args.scenarios:
+            if name == "ingest":
+                results[name] = await _ingest_scenario(newsdata_app, gemini_app, args)
+            else:
+                results[name] = await _read_scenario(client, name, args)
+            print(_format(name, results[name]))
+    await dispose_engines()
+    return results
+
+
+def _format(name: str, result: dict) -> str:
+    latency = result["latency_ms"]
+    if name == "ingest":
+        rate = f"{result['throughput_articles_per_s']:>8.1f} articles/s  runs={result['runs']} fetched={result['fetched']}"
+    else:
+        rate = f"{result['throughput_rps']:>8.1f} req/s  n={result['requests']} errors={result['errors']}"
+    return f"{name:<7} {rate}  p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms"
+
+
+def _git_commit() -> dict:
+    def git(*argv: str) -> Optional[str]:
+        try:
+            out = subprocess.run(["git", *argv], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return out.stdout.strip()
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(status) if status is not None else None}
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """두 결과 파일의 시나리오별 처리량, p95, p99 변화율을 줄 단위로 돌려줍니다."""
+    lines = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        key = "throughput_articles_per_s" if name == "ingest" else "throughput_rps"
+        changes = [("throughput", before[key], result[key])]
+        changes += [(pct, before["latency_ms"][pct], result["latency_ms"][pct]) for pct in ("p95", "p99")]
+        parts = [
+            f"{label} {old:.1f} -> {new:.1f} ({(new - old) / old:+.1%})" if old else f"{label} {old:.1f} -> {new:.1f}"
+            for label, old, new in changes
+        ]
+        lines.append(f"{name:<7} " + "  ".join(parts))
+    return lines
+
+
+def _prepare_database(database_url: str, articles: int) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.models import Base
+    from app.services.search import ensure_search_index
+    from benchmarks.synthetic import seed_database
+
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    ensure_search_index(engine)
+    with Session(engine) as db:
+        started = time.perf_counter()
+        seed_database(db, articles)
+        print(f"seeded {articles:,} articles in {time.perf_counter() - started:.1f}s")
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--articles", type=int, default=20_000, help="미리 채워 둘 기사 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="조회 시나리오별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="조회 시나리오별 워밍업 시간(초, 기록 안 함)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--ingest", type=int, default=200, help="ingest 회차마다 가짜 NEWSDATA가 돌려줄 신규 기사 수")
+    parser.add_argument("--ingest-runs", type=int, default=3)
+    parser.add_argument("--newsdata-latency", type=float, default=0.05)
+    parser.add_argument("--newsdata-error-rate", type=float, default=0.0)
+    parser.add_argument("--gemini-latency", type=float, default=0.05)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일 (주어진 DB는 비우고 다시 채움)")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    from fakes import make_gemini_app, make_newsdata_app, serve
+
+    newsdata_app = make_newsdata_app([], page_size=50, latency=args.newsdata_latency, error_rate=args.newsdata_error_rate, seed=args.seed)
+    gemini_app = make_gemini_app(latency=args.gemini_latency, error_rate=args.gemini_error_rate, seed=args.seed)
+    pages = args.ingest // 50 + 1
+
+    with tempfile.TemporaryDirectory() as tmpdir, serve(newsdata_app) as newsdata_url, serve(gemini_app) as gemini_url:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        os.environ.update(
+            DATABASE_URL=database_url,
+            NEWSDATA_API_KEY="bench",
+            NEWSDATA_BASE_URL=newsdata_url,
+            NEWSDATA_QUERIES="country=kr&language=ko",
+            NEWSDATA_MAX_PAGES=str(pages),
+            NEWSDATA_MAX_CREDITS=str(pages),
+            RSS_FEEDS="",
+            GEMINI_API_KEY="bench",
+            GEMINI_BASE_URL=gemini_url,
+            RATE_LIMIT_PER_MIN="1000000",
+            RESPONSE_CACHE_MAX_ENTRIES="0",
+            INGEST_INTERVAL_MINUTES="0",
+            RETENTION_INTERVAL_HOURS="0",
+        )
+        from app.config import get_settings
+
+        get_settings.cache_clear()
+        _prepare_database(database_url, args.articles)
+        scenarios = asyncio.run(_run(args, newsdata_app, gemini_app))
+
+    report = {
+        "meta": {
+            **_git_commit(),
+            "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database_url.split(":", 1)[0] if args.database_url else "sqlite (temporary file)",
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "baseline", "database_url")},
+        },
+        "scenarios": scenarios,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.output}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        print(f"compared with {args.baseline} ({(baseline.get('meta') or {}).get('commit') or 'unknown commit'}):")
+        for line in compare(baseline, report):
+            print("  " + line)
+
+
+if __name__ == "__main__":
+    main()
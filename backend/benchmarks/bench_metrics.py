@@ -0,0 +1,154 @@
+"""
+메트릭 계측 오버헤드 마이크로벤치마크.
+
+    python -m benchmarks.bench_metrics
+    python -m benchmarks.bench_metrics --requests 20000 --queries 50000
+
+1) Counter.inc / Histogram.observe 1회 비용(ns)
+2) 최소 FastAPI 앱을 ASGI로 직접 호출했을 때 MetricsMiddleware 유무에 따른 요청당 시간(µs)
+3) instrument_engine 유무에 따른 쿼리당 시간(µs): 인메모리 SQLite `SELECT 1`(최악의 경우)과
+   합성 기사 --articles건에서의 목록 첫 페이지 쿼리(기사+분석 조인, 정렬, 20건)
+계측 유무는 번갈아 --repeat회 측정하고 각각 가장 빠른 값을 씁니다 (스케줄링/CPU 클럭 잡음 제거).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import timeit
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.models import Article, Base
+from app.routes.articles import LIST_COLUMNS, ArticleFilters, filtered_query
+from app.services.metrics import Counter, Histogram, MetricsMiddleware, instrument_engine
+from benchmarks.synthetic import seed_database
+
+
+def _best(fn, number: int, repeat: int) -> float:
+    """1회 평균 시간(초) 중 최솟값."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def bench_primitives(number: int, repeat: int) -> None:
+    counter = Counter("bench_total", "bench", ("outcome",))
+    hist = Histogram("bench_seconds", "bench", ("route",))
+    child = hist.labels("/articles")
+    rows = [
+        ("counter.labels().inc()", lambda: counter.labels("ok").inc()),
+        ("histogram.labels().observe()", lambda: hist.labels("/articles").observe(0.0123)),
+        ("child.observe()", lambda: child.observe(0.0123)),
+        ("time.perf_counter() x2", lambda: (time.perf_counter(), time.perf_counter())),
+    ]
+    for label, fn in rows:
+        print(f"{label:<32} {_best(fn, number, repeat) * 1e9:8.0f} ns")
+
+
+def _asgi_app(instrumented: bool):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _drive(app, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/items/1", "raw_path": b"/items/1", "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def _report(label: str, base: float, with_metrics: float) -> None:
+    print(
+        f"{label:<32} base={base * 1e6:7.1f} µs  metrics={with_metrics * 1e6:7.1f} µs  "
+        f"overhead={(with_metrics - base) * 1e6:+6.1f} µs ({(with_metrics / base - 1) * 100:+.1f}%)"
+    )
+
+
+def bench_middleware(requests: int, repeat: int) -> None:
+    apps = {instrumented: _asgi_app(instrumented) for instrumented in (False, True)}
+    results = {False: float("inf"), True: float("inf")}
+
+    async def _rounds():
+        for app in apps.values():
+            await _drive(app, 200)  # 워밍업 (미들웨어 스택 생성)
+        for round_ in range(repeat):
+            # 매 회차 실행 순서를 바꿔 순서에 따른 편향을 없앤다
+            for instrumented in (False, True) if round_ % 2 else (True, False):
+                results[instrumented] = min(results[instrumented], await _drive(apps[instrumented], requests))
+
+    asyncio.run(_rounds())
+    _report("ASGI request", results[False], results[True])
+
+
+def _compare(label: str, calls: dict[bool, object], number: int, repeat: int) -> None:
+    results = {False: float("inf"), True: float("inf")}
+    for round_ in range(repeat):
+        for instrumented in (False, True) if round_ % 2 else (True, False):
+            results[instrumented] = min(results[instrumented], _best(calls[instrumented], number, 1))
+    _report(label, results[False], results[True])
+
+
+def bench_db(queries: int, articles: int, repeat: int) -> None:
+    engines = {instrumented: create_engine("sqlite://", future=True) for instrumented in (False, True)}
+    instrument_engine(engines[True])
+    conns = {instrumented: engine.connect() for instrumented, engine in engines.items()}
+    stmt = text("SELECT 1")
+    _compare("SQLite SELECT 1", {k: (lambda c=c: c.execute(stmt).scalar()) for k, c in conns.items()}, queries, repeat)
+    for conn in conns.values():
+        conn.close()
+
+    sessions = {}
+    for instrumented, engine in engines.items():
+        Base.metadata.create_all(engine)
+        sessions[instrumented] = Session(engine)
+        seed_database(sessions[instrumented], articles, with_search=False)
+    def _list_page(session: Session) -> list:
+        query, _ = filtered_query(session, LIST_COLUMNS, ArticleFilters())
+        return query.order_by(Article.published_at.desc(), Article.id.desc()).limit(20).all()
+
+    _compare(
+        f"list page ({articles:,} articles)",
+        {k: (lambda s=s: _list_page(s)) for k, s in sessions.items()},
+        max(1, queries // 20),
+        repeat,
+    )
+    for instrumented, session in sessions.items():
+        session.close()
+        engines[instrumented].dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observations", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--articles", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+    bench_primitives(args.observations, args.repeat)
+    bench_middleware(args.requests, args.repeat)
+    bench_db(args.queries, args.articles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
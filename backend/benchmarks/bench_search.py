@@ -0,0 +1,100 @@
+"""
+검색 벤치마크: 색인 검색(FTS5/tsvector) vs 기존 ILIKE '%q%' 스캔.
+
+    python -m benchmarks.bench_search --sizes 10000 100000 1000000
+    python -m benchmarks.bench_search --database-url postgresql+psycopg://... --sizes 10000
+
+각 크기마다 새 DB를 만들어 합성 기사를 채운 뒤, 검색어별 첫 페이지(limit 50) 조회 시간의 중앙값을 출력합니다.
+흔한 검색어는 색인 검색도 일치 건수에 비례해 정렬 비용이 들고, 드문 검색어에서 차이가 가장 큽니다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import String, create_engine, desc, func, or_
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, Base
+from app.routes.articles import LIST_COLUMNS, ArticleFilters, filtered_query
+from app.services.search import ensure_search_index
+from benchmarks.synthetic import seed_database
+
+QUERIES = ["금리", "반도체 수출", "한국은행", "존재하지않는단어"]
+
+
+def _legacy_query(db: Session, q: str):
+    like = f"%{q}%"
+    return (
+        db.query(*LIST_COLUMNS)
+        .join(Analysis, Analysis.article_id == Article.id, isouter=True)
+        .filter(
+            or_(
+                Article.title.ilike(like),
+                Article.content_clean.ilike(like),
+                func.cast(Analysis.keywords, String).ilike(like),
+            )
+        )
+        .order_by(desc(Article.published_at).nullslast())
+    )
+
+
+def _indexed_query(db: Session, q: str, relevance: bool):
+    query, rank = filtered_query(db, LIST_COLUMNS, ArticleFilters(q=q))
+    if relevance:
+        return query.add_columns(rank.label("rank")).order_by(desc(rank), desc(Article.id))
+    return query.order_by(desc(Article.published_at).nullslast(), desc(Article.id))
+
+
+def _time(build, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build().limit(50).all()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run(size: int, database_url: str | None, repeat: int) -> None:
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+    engine = create_engine(database_url, future=True)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    ensure_search_index(engine)
+
+    with Session(engine) as db:
+        started = time.perf_counter()
+        seed_database(db, size)
+        print(f"[{size:>9,}] seeded in {time.perf_counter() - started:.1f}s")
+        for q in QUERIES:
+            recency = _time(lambda: _indexed_query(db, q, relevance=False), repeat)
+            relevance = _time(lambda: _indexed_query(db, q, relevance=True), repeat)
+            legacy = _time(lambda: _legacy_query(db, q), repeat)
+            print(
+                f"[{size:>9,}] q={q!r:<14} indexed(recency)={recency:8.2f}ms  "
+                f"indexed(relevance)={relevance:8.2f}ms  ilike={legacy:9.2f}ms"
+            )
+
+    engine.dispose()
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.database_url, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+직렬화 마이크로벤치마크: 목록/상세 행 1k건당 응답 본문을 만드는 비용 (DB 조회 제외).
+
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --rows 200 --repeat 50
+
+before: 행마다 필드를 꺼내 dict → Pydantic `model_validate` → `model_dump_json` (이전 경로)
+after:  컬럼 프로젝션 행을 zip으로 dict → orjson `dumps` (현재 경로)
+두 경로의 출력 바이트가 같은지 확인한 뒤, 1k행당 시간과 gzip/br 압축 비용·크기를 출력합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, Base
+from app.routes.articles import DETAIL_COLUMNS, DETAIL_KEYS, LIST_COLUMNS, ArticleFilters, _row_to_item, filtered_query
+from app.schemas import ArticleDetail, ArticleListResponse
+from app.services.serialization import brotli_available, compress, dumps
+from benchmarks.synthetic import seed_database
+
+
+def _legacy_item(row) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "link": row.link,
+        "published_at": row.published_at,
+        "summary": row.summary,
+        "sentiment_label": row.sentiment_label,
+        "sentiment_score": row.sentiment_score,
+        "keywords": row.keywords,
+        "cluster_id": row.cluster_id,
+        "cluster_size": row.cluster_size if row.cluster_id is not None else None,
+    }
+
+
+def _legacy_detail(row) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "link": row.link,
+        "published_at": row.published_at,
+        "summary": row.summary,
+        "sentiment_label": row.sentiment_label,
+        "sentiment_score": row.sentiment_score,
+        "keywords": row.keywords,
+        "source_id": row.source_id,
+    }
+
+
+def _load_rows(count: int):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'bench.db')}", future=True)
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed_database(db, count, with_search=False)
+            list_rows = filtered_query(db, LIST_COLUMNS, ArticleFilters())[0].order_by(Article.id).all()
+            detail_rows = db.execute(
+                select(*DETAIL_COLUMNS).join(Analysis, Analysis.article_id == Article.id, isouter=True).order_by(Article.id)
+            ).all()
+        engine.dispose()
+    return list_rows, detail_rows
+
+
+def _per_1k(fn, rows: int, repeat: int) -> float:
+    """fn 한 번 실행 시간의 중앙값을 1k행 기준 밀리초로 환산합니다."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000 * 1000 / rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    list_rows, detail_rows = _load_rows(args.rows)
+    cases = {
+        "list": (
+            lambda: ArticleListResponse.model_validate(
+                {"items": [_legacy_item(row) for row in list_rows], "next_cursor": None}
+            ).model_dump_json().encode("utf-8"),
+            lambda: dumps({"items": [_row_to_item(row) for row in list_rows], "next_cursor": None}),
+        ),
+        # 상세는 요청마다 한 행: 행 1k개를 하나씩 직렬화
+        "detail": (
+            lambda: [ArticleDetail.model_validate(_legacy_detail(row)).model_dump_json().encode("utf-8") for row in detail_rows],
+            lambda: [dumps(dict(zip(DETAIL_KEYS, row))) for row in detail_rows],
+        ),
+    }
+
+    for name, (before, after) in cases.items():
+        assert before() == after(), f"{name}: outputs differ"
+        before_ms = _per_1k(before, args.rows, args.repeat)
+        after_ms = _per_1k(after, args.rows, args.repeat)
+        print(f"{name:<7} before {before_ms:>7.2f} ms/1k rows  after {after_ms:>7.2f} ms/1k rows  ({before_ms / after_ms:.1f}x)")
+
+    body = cases["list"][1]()
+    encodings = ("gzip", "br") if brotli_available() else ("gzip",)
+    for encoding in encodings:
+        compressed = compress(body, encoding)
+        ms = _per_1k(lambda: compress(body, encoding), args.rows, args.repeat)
+        print(
+            f"{encoding:<7} {ms:>7.2f} ms/1k rows  {len(body) / 1024:>7.1f} KiB -> {len(compressed) / 1024:.1f} KiB "
+            f"({len(compressed) / len(body):.0%})"
+        )
+    if not brotli_available():
+        print("br      skipped (brotli not installed)")
+
+
+if __name__ == "__main__":
+    main()
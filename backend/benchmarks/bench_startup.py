@@ -0,0 +1,127 @@
+"""
+시작 시간 벤치마크: 새 프로세스에서 `app.main` import → startup → 첫 요청까지 걸리는 시간.
+
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --database-url postgresql+psycopg://... --articles 0
+
+이미 마이그레이션된(head로 stamp된) DB에 대해 실행마다 새 파이썬 프로세스를 띄워
+import, startup(스키마 확인), 첫 요청(GET /articles), /ready(연결 풀 워밍업) 시간을 재고 중앙값을 출력합니다.
+`create_all` 모드는 이전 방식(시작할 때마다 Base.metadata.create_all + 검색 인덱스 확인)과 비교하기 위한 것입니다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+MODES = ("revision", "create_all")
+
+
+def _child(mode: str) -> None:
+    """측정 대상 프로세스. 결과를 JSON 한 줄로 출력합니다."""
+    started = time.perf_counter()
+    import app.main as main
+    from fastapi.testclient import TestClient
+
+    imported = time.perf_counter()
+    if mode == "create_all":
+        from app.database import get_engine
+        from app.models import Base
+        from app.services.search import ensure_search_index
+
+        async def _legacy_init(_engine):
+            Base.metadata.create_all(bind=get_engine())
+            ensure_search_index(get_engine())
+
+        main.check_database = _legacy_init
+
+    with TestClient(main.app) as client:
+        ready_to_serve = time.perf_counter()
+        assert client.get("/articles", params={"limit": 20}).status_code == 200
+        first_request = time.perf_counter()
+        client.get("/ready")
+        ready = time.perf_counter()
+    print(
+        json.dumps(
+            {
+                "import_ms": (imported - started) * 1000,
+                "startup_ms": (ready_to_serve - imported) * 1000,
+                "first_request_ms": (first_request - ready_to_serve) * 1000,
+                "ready_ms": (ready - first_request) * 1000,
+                "to_first_request_ms": (first_request - started) * 1000,
+            }
+        )
+    )
+
+
+def _prepare(database_url: str, articles: int) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.services.migrations import ensure_schema, schema_status
+    from benchmarks.synthetic import seed_database
+
+    engine = create_engine(database_url, future=True)
+    with engine.begin() as conn:
+        status = ensure_schema(conn)
+    if not status.ok:
+        raise SystemExit(f"database schema is {status.state}; run `alembic upgrade head` first")
+    if articles:
+        with Session(engine) as db:
+            seed_database(db, articles)
+    with engine.connect() as conn:
+        print(f"schema {schema_status(conn).state} at {status.head}, seeded {articles:,} articles")
+    engine.dispose()
+
+
+def _measure(mode: str, env: dict) -> dict:
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--articles", type=int, default=1000, help="미리 채울 기사 수 (0이면 채우지 않음)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        _prepare(database_url, args.articles)
+        # 수집/보관 스케줄러는 끄고 앱 시작 자체만 잰다
+        env = {**os.environ, "DATABASE_URL": database_url, "INGEST_INTERVAL_MINUTES": "0", "RETENTION_INTERVAL_HOURS": "0"}
+        for mode in args.modes:
+            runs = [_measure(mode, env) for _ in range(args.runs)]
+            medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+            print(
+                f"{mode:<10} import {medians['import_ms']:>7.1f} ms  startup {medians['startup_ms']:>7.1f} ms  "
+                f"first request {medians['first_request_ms']:>6.1f} ms  /ready {medians['ready_ms']:>6.1f} ms  "
+                f"import→first request {medians['to_first_request_ms']:>7.1f} ms  process {medians['process_ms']:>7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
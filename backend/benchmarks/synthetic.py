@@ -0,0 +1,132 @@
+"""벤치마크용 합성 한국어 기사 데이터 생성기."""
+from __future__ import annotations
+
+import hashlib
+import random
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, ArticleSearch, Source
+from app.services.search import build_document
+
+SUBJECTS = ["한국은행", "기획재정부", "삼성전자", "SK하이닉스", "현대차", "금융위원회", "코스피", "코스닥", "국토교통부", "LG에너지솔루션"]
+TOPICS = ["금리", "물가", "반도체", "수출", "환율", "부동산", "고용", "배터리", "전기차", "인공지능", "무역수지", "가계부채"]
+VERBS = ["발표했다", "밝혔다", "전망했다", "상승했다", "하락했다", "동결했다", "확대했다", "축소했다"]
+PARTICLES = ["가", "는", "를", "의", "에", "와", ""]
+LABELS = ["positive", "neutral", "negative"]
+
+
+def _sentence(rng: random.Random) -> str:
+    subject = rng.choice(SUBJECTS)
+    topic = rng.choice(TOPICS) + rng.choice(PARTICLES)
+    number = f"{rng.randint(1, 99)}.{rng.randint(0, 9)}%"
+    return f"{subject}는 {topic} {number} {rng.choice(VERBS)}."
+
+
+def make_article(rng: random.Random, index: int, base: datetime) -> dict:
+    title = f"{rng.choice(SUBJECTS)} {rng.choice(TOPICS)} {rng.choice(VERBS)}"
+    content = " ".join(_sentence(rng) for _ in range(rng.randint(5, 30)))
+    label = rng.choice(LABELS)
+    return {
+        "title": title,
+        "link": f"https://news.example.com/{index}",
+        "published_at": base - timedelta(minutes=index),
+        "content": content,
+        "hash": hashlib.sha256(f"bench:{index}".encode("utf-8")).hexdigest(),
+        "summary": " ".join(_sentence(rng) for _ in range(3)),
+        "sentiment_label": label,
+        "sentiment_score": round(rng.uniform(-1.0, 1.0), 3),
+        "keywords": rng.sample(TOPICS, 4),
+    }
+
+
+_SCRIPT = (
+    "window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);} "
+    "gtag('config', 'G-XXXX'); if (a < b && b > c) { document.querySelector('<div>'); } "
+)
+_STYLE = ".article_body p { margin: 0 0 1.2em; line-height: 1.8; } .ad > a { display: none; } "
+
+
+def make_news_html(rng: random.Random, paragraphs: int = 12, script_kb: int = 20) -> str:
+    """
+    포털/언론사 기사 페이지 형태의 HTML: head의 script/style, 광고 영역, 주석, 엔티티가 섞인 본문 단락.
+    script_kb는 페이지에 넣을 인라인 스크립트 크기(KB)입니다.
+    """
+    script = _SCRIPT * max(1, script_kb * 1024 // len(_SCRIPT))
+    body = "\n".join(
+        f'<p class="text">{_sentence(rng)} &quot;{rng.choice(TOPICS)}&quot; 관련 {_sentence(rng)}'
+        f"&nbsp;{_sentence(rng)} &lt;{rng.choice(SUBJECTS)}&gt; &middot; {_sentence(rng)}</p>"
+        + ("<!-- ad slot --><div class=\"ad\"><a href=\"#\">광고</a></div>" if i % 4 == 3 else "")
+        for i in range(paragraphs)
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        f"<title>{rng.choice(SUBJECTS)} {rng.choice(TOPICS)} | 뉴스</title>"
+        f"<style>{_STYLE * 40}</style><script type=\"text/javascript\">{script}</script></head>"
+        "<body><header><nav><ul><li><a href=\"/\">홈</a></li><li><a href=\"/economy\">경제</a></li></ul></nav></header>"
+        f'<article><h1>{rng.choice(SUBJECTS)} {rng.choice(TOPICS)} {rng.choice(VERBS)}</h1>'
+        f'<div class="article_body">\n{body}\n</div></article>'
+        f"<footer>무단 전재 및 재배포 금지 &copy; 2026</footer><script>{script}</script></body></html>"
+    )
+
+
+def iter_articles(count: int, seed: int = 42, start: int = 0) -> Iterator[dict]:
+    rng = random.Random(seed + start)
+    base = datetime(2026, 1, 1)
+    for index in range(start, start + count):
+        yield make_article(rng, index, base)
+
+
+def seed_database(db: Session, count: int, chunk_size: int = 5000, with_search: bool = True) -> int:
+    """합성 기사/분석(및 검색 문서)을 count건 삽입하고 source id를 반환합니다."""
+    source = db.query(Source).filter(Source.name == "newsdata").one_or_none()
+    if source is None:
+        source = Source(name="newsdata", api_type="newsdata", active=True)
+        db.add(source)
+        db.flush()
+
+    next_id = (db.query(Article.id).order_by(Article.id.desc()).limit(1).scalar() or 0) + 1
+    done = 0
+    while done < count:
+        batch = list(iter_articles(min(chunk_size, count - done), start=next_id + done))
+        article_rows, analysis_rows, search_rows = [], [], []
+        for offset, item in enumerate(batch):
+            article_id = next_id + done + offset
+            article_rows.append(
+                {
+                    "id": article_id,
+                    "source_id": source.id,
+                    "title": item["title"],
+                    "link": item["link"],
+                    "published_at": item["published_at"],
+                    "content_raw": item["content"],
+                    "content_clean": item["content"],
+                    "hash": item["hash"],
+                    "created_at": item["published_at"],
+                }
+            )
+            analysis_rows.append(
+                {
+                    "article_id": article_id,
+                    "summary": item["summary"],
+                    "sentiment_label": item["sentiment_label"],
+                    "sentiment_score": item["sentiment_score"],
+                    "keywords": item["keywords"],
+                    "model_name": "synthetic",
+                    "created_at": item["published_at"],
+                }
+            )
+            if with_search:
+                search_rows.append(
+                    {"article_id": article_id, "document": build_document(item["title"], item["content"], item["keywords"])}
+                )
+        db.execute(insert(Article), article_rows)
+        db.execute(insert(Analysis), analysis_rows)
+        if search_rows:
+            db.execute(insert(ArticleSearch), search_rows)
+        db.commit()
+        done += len(batch)
+    return source.id
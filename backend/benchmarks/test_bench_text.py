@@ -0,0 +1,88 @@
+"""
+본문 정제(clean_html) 벤치마크 — pytest-benchmark 필요 (pip install pytest-benchmark).
+
+    python -m pytest benchmarks/test_bench_text.py
+    python -m pytest benchmarks/test_bench_text.py --benchmark-json text.json
+
+합성 한국어 기사 페이지(script/style/광고/주석/엔티티 포함)를 크기별로 만들어
+이전 구현(정규식 3회 + unescape 후 자르기)과 단일 스캔 구현, 배치 인라인/프로세스 풀 처리를 비교합니다.
+처리량은 벤치마크 표의 OPS(회/초)와 extra_info의 pages_per_s / mb_per_s, 호출 1회의 최대 메모리는 peak_kib에 기록됩니다.
+프로세스 풀은 페이지 전송(pickle) 비용이 있으므로 CPU가 1~2개면 인라인보다 느릴 수 있습니다.
+"""
+import html
+import os
+import random
+import re
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app.utils.text import clean_html, clean_html_batch
+from benchmarks.synthetic import make_news_html
+
+pytest.importorskip("pytest_benchmark")
+
+# (단락 수, 인라인 스크립트 KB): 일반 기사 / 긴 기사 / 스크립트가 큰 비정상 페이지
+PAGES = {"article": (12, 20), "long": (200, 20), "huge": (2000, 200)}
+BATCH_SIZE = 200
+
+
+def legacy_clean_html(text: str, max_len: int = 8000) -> str:
+    no_tags = re.sub(r"<[^>]+>", " ", text)
+    unescaped = html.unescape(no_tags)
+    normalized = re.sub(r"\s+", " ", unescaped).strip()
+    return normalized[:max_len]
+
+
+IMPLEMENTATIONS = {"legacy": legacy_clean_html, "single_pass": clean_html}
+
+
+def _pages(kind: str, count: int) -> list[str]:
+    paragraphs, script_kb = PAGES[kind]
+    rng = random.Random(kind)
+    return [make_news_html(rng, paragraphs, script_kb) for _ in range(count)]
+
+
+def _peak_kib(fn, *args) -> int:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _record(benchmark, pages: list[str], peak_kib: int) -> None:
+    mean = benchmark.stats.stats.mean
+    benchmark.extra_info["pages_per_s"] = round(len(pages) / mean)
+    benchmark.extra_info["mb_per_s"] = round(sum(len(p.encode("utf-8")) for p in pages) / mean / 1e6, 1)
+    benchmark.extra_info["peak_kib"] = peak_kib
+    benchmark.extra_info["cpus"] = os.cpu_count()
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+@pytest.mark.parametrize("kind", PAGES)
+def test_clean_html(benchmark, kind, impl):
+    fn = IMPLEMENTATIONS[impl]
+    pages = _pages(kind, 10)
+    benchmark.group = f"clean_html[{kind}]"
+    benchmark(lambda: [fn(page) for page in pages])
+    _record(benchmark, pages, _peak_kib(fn, pages[0]))
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        # 워커 기동 비용은 측정에서 제외
+        list(pool.map(clean_html, ["<p>warmup</p>"] * 2))
+        yield pool
+
+
+@pytest.mark.parametrize("mode", ["inline", "process_pool"])
+def test_clean_html_batch(benchmark, process_pool, mode):
+    pages = _pages("long", BATCH_SIZE)
+    executor = process_pool if mode == "process_pool" else None
+    benchmark.group = f"clean_html_batch[{BATCH_SIZE} long pages]"
+    benchmark.pedantic(clean_html_batch, args=(pages,), kwargs={"executor": executor}, rounds=5, warmup_rounds=1)
+    _record(benchmark, pages, _peak_kib(clean_html_batch, pages))
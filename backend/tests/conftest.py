@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.config import get_settings
+from app.database import async_url, get_async_db, get_async_engine, get_db
+from app.main import app
+from app.models import Base
+from app.services import pipeline
+from app.services.analysis_cache import get_analysis_cache
+from app.services.rate_limit import get_rate_limiter
+from app.services.response_cache import get_response_cache
+from app.services.search import ensure_search_index
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """
+    환경 변수로 설정을 덮어씁니다: settings_env(newsdata_max_pages=2, gemini_api_key=None, ...).
+    값이 None이면 변수를 지우고, 적용할 때와 테스트가 끝날 때 설정과 설정에 묶인 싱글턴 캐시를 비웁니다.
+    """
+
+    def _reset():
+        get_settings.cache_clear()
+        get_rate_limiter.cache_clear()
+        get_analysis_cache.cache_clear()
+
+    def _apply(**values):
+        for key, value in values.items():
+            if value is None:
+                monkeypatch.delenv(key.upper(), raising=False)
+            else:
+                monkeypatch.setenv(key.upper(), str(value))
+        _reset()
+
+    yield _apply
+    _reset()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # 동기 엔진(시드/검증)과 async 엔진(라우트/파이프라인)이 같은 DB를 보도록 파일 SQLite 사용
+    eng = create_engine(f"sqlite:///{tmp_path / 'test.db'}", future=True)
+    Base.metadata.create_all(bind=eng)
+    ensure_search_index(eng)
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture
+def async_engine(engine):
+    # TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 연결을 재사용하지 않는다
+    eng = create_async_engine(async_url(engine.url.render_as_string()), poolclass=NullPool)
+    yield eng
+    asyncio.run(eng.dispose())
+
+
+@pytest.fixture
+def async_session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def ingest(async_session_factory):
+    """새 async 세션으로 run_ingest를 한 번 실행하고 결과를 반환합니다."""
+
+    def _run(**kwargs):
+        async def _go():
+            async with async_session_factory() as db:
+                return await pipeline.run_ingest(db, **kwargs)
+
+        return asyncio.run(_go())
+
+    return _run
+
+
+@pytest.fixture
+def db_session(engine):
+    session = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(engine, async_engine, async_session_factory):
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+    def _override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def _override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_async_db] = _override_get_async_db
+    app.dependency_overrides[get_async_engine] = lambda: async_engine
+    # 테스트마다 DB가 새로 만들어지므로 이전 테스트의 응답 캐시를 버린다
+    get_response_cache.cache_clear()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_async_db, None)
+        app.dependency_overrides.pop(get_async_engine, None)
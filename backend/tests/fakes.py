@@ -0,0 +1,199 @@
+"""테스트/벤치마크용 로컬 가짜 외부 API 서버."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.services.analyzer import BATCH_INPUT_HEADER
+
+
+def make_gemini_app(
+    latency: float = 0.0,
+    fail_marker: str = "FAIL",
+    bad_batch_marker: str = "BAD",
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> FastAPI:
+    """
+    generateContent 응답을 흉내 내는 가짜 Gemini 서버.
+    프롬프트에 fail_marker가 포함되면 500을 반환합니다.
+    배치 프롬프트에서는 제목에 bad_batch_marker가 있는 항목만 스키마에 맞지 않는 객체로 돌려줍니다.
+    error_rate 비율의 요청은 무작위로(seed 고정) 503을 반환합니다 (app.state.errors에 개수).
+    """
+    app = FastAPI()
+    rng = random.Random(seed)
+    app.state.calls = 0
+    app.state.errors = 0
+    app.state.batch_calls = 0
+    app.state.in_flight = 0
+    app.state.max_in_flight = 0
+
+    @app.post("/v1/models/{model_action}")
+    async def generate(model_action: str, request: Request):
+        body = await request.json()
+        prompt = body["contents"][0]["parts"][0]["text"]
+        app.state.calls += 1
+        app.state.in_flight += 1
+        app.state.max_in_flight = max(app.state.max_in_flight, app.state.in_flight)
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            app.state.in_flight -= 1
+        if fail_marker and fail_marker in prompt:
+            return JSONResponse({"error": {"code": 500, "message": "fake failure"}}, status_code=500)
+        if error_rate and rng.random() < error_rate:
+            app.state.errors += 1
+            return JSONResponse({"error": {"code": 503, "message": "fake overload"}}, status_code=503)
+        result = {
+            "summary": "가짜 요약입니다.",
+            "sentiment": {"label": "neutral", "score": 0.0},
+            "keywords": ["테스트", "뉴스"],
+            "reason": "테스트 응답",
+            "safety_flag": False,
+            "safety_reason": "",
+        }
+        if BATCH_INPUT_HEADER in prompt:
+            app.state.batch_calls += 1
+            articles = json.loads(prompt.split(BATCH_INPUT_HEADER, 1)[1])
+            result = [
+                {"id": art["id"], "summary": "깨진 항목"}
+                if bad_batch_marker in art["article"]["title"]
+                else {"id": art["id"], **result}
+                for art in articles
+            ]
+        text = "```json\n" + json.dumps(result, ensure_ascii=False) + "\n```"
+        usage = {"promptTokenCount": len(prompt) // 2, "candidatesTokenCount": len(text) // 2}
+        return {"candidates": [{"content": {"parts": [{"text": text}]}}], "usageMetadata": usage}
+
+    return app
+
+
+def _track_in_flight(app: FastAPI):
+    app.state.in_flight = 0
+    app.state.max_in_flight = 0
+
+    @contextmanager
+    def _tracked():
+        app.state.in_flight += 1
+        app.state.max_in_flight = max(app.state.max_in_flight, app.state.in_flight)
+        try:
+            yield
+        finally:
+            app.state.in_flight -= 1
+
+    return _tracked
+
+
+def make_newsdata_app(
+    articles: list[dict],
+    page_size: int = 10,
+    latency: float = 0.0,
+    fail_marker: str = "broken",
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> FastAPI:
+    """
+    `/api/1/news`를 흉내 내는 가짜 NEWSDATA.io 서버.
+    app.state.articles(최신순)를 page_size씩 나눠 주고, 다음 페이지가 있으면 nextPage 토큰을 넣습니다.
+    쿼리 파라미터 값에 fail_marker가 있으면 500을, error_rate 비율의 요청은 무작위로(seed 고정) 503을 반환합니다.
+    """
+    app = FastAPI()
+    rng = random.Random(seed)
+    app.state.articles = articles
+    app.state.requests = []
+    app.state.errors = 0
+    tracked = _track_in_flight(app)
+
+    @app.get("/api/1/news")
+    async def news(request: Request):
+        params = dict(request.query_params)
+        app.state.requests.append(params)
+        with tracked():
+            await asyncio.sleep(latency)
+        if any(fail_marker in value for value in params.values()):
+            return JSONResponse({"status": "error"}, status_code=500)
+        if error_rate and rng.random() < error_rate:
+            app.state.errors += 1
+            return JSONResponse({"status": "error"}, status_code=503)
+        offset = int(params.get("page") or 0)
+        page = app.state.articles[offset:offset + page_size]
+        body = {"status": "success", "totalResults": len(app.state.articles), "results": page}
+        if offset + page_size < len(app.state.articles):
+            body["nextPage"] = str(offset + page_size)
+        return body
+
+    return app
+
+
+def newsdata_article(index: int, published: str) -> dict:
+    return {
+        "title": f"뉴스 {index}",
+        "link": f"https://news.example.com/{index}",
+        "description": f"뉴스 {index} 본문",
+        "pubDate": published,
+        "source_id": "example",
+    }
+
+
+def make_rss_app(feeds: dict[str, list[dict]], latency: float = 0.0) -> FastAPI:
+    """
+    `/feeds/{name}`로 RSS 2.0 피드를 주는 가짜 피드 서버. app.state.feeds[name]은 {"title", "link", "description"} 목록입니다.
+    본문 해시를 ETag로 붙이고 If-None-Match가 같으면 304를 반환합니다. app.state.requests에 (이름, 상태 코드)를 남깁니다.
+    """
+    app = FastAPI()
+    app.state.feeds = feeds
+    app.state.requests = []
+    tracked = _track_in_flight(app)
+
+    @app.get("/feeds/{name}")
+    async def feed(name: str, request: Request):
+        with tracked():
+            await asyncio.sleep(latency)
+        items = "".join(
+            f"<item><title>{entry['title']}</title><link>{entry['link']}</link>"
+            f"<description>{entry.get('description', '')}</description>"
+            f"<pubDate>Mon, 05 Jan 2026 12:00:00 GMT</pubDate></item>"
+            for entry in app.state.feeds[name]
+        )
+        body = f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>{name}</title>{items}</channel></rss>'
+        etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+        status = 304 if request.headers.get("if-none-match") == etag else 200
+        app.state.requests.append((name, status))
+        if status == 304:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(body.encode("utf-8"), media_type="application/rss+xml", headers={"ETag": etag})
+
+    return app
+
+
+def rss_entry(index: int) -> dict:
+    return {"title": f"피드 기사 {index}", "link": f"https://feed.example.com/{index}", "description": f"피드 기사 {index} 본문"}
+
+
+@contextmanager
+def serve(app: FastAPI) -> Iterator[str]:
+    """앱을 임의 포트의 로컬 uvicorn 서버로 띄우고 base URL을 돌려줍니다."""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", ws="none", lifespan="off"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("fake server failed to start")
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
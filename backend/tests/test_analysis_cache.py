@@ -0,0 +1,36 @@
+from app.schemas import AnalysisResult
+from app.services.analysis_cache import LruTtlCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _result(summary="요약"):
+    return AnalysisResult(summary=summary, sentiment={"label": "neutral", "score": 0.0}, reason="")
+
+
+def test_cache_key_normalizes_whitespace_and_width():
+    a = cache_key("한국은행이  금리를\n동결했다 ＡＢＣ", "m", "v1")
+    b = cache_key("한국은행이 금리를 동결했다 abc", "m", "v1")
+    assert a == b
+    assert a != cache_key("한국은행이 금리를 동결했다 abc", "m", "v2")
+
+
+def test_lru_ttl_and_size_eviction():
+    clock = FakeClock()
+    size = len(_result().model_dump_json())
+    cache = LruTtlCache(max_entries=3, max_bytes=size * 2, ttl_seconds=10, clock=clock)
+    cache.put("a", _result())
+    cache.put("b", _result())
+    assert cache.get("a") is not None  # a가 최근 사용으로 이동
+    cache.put("c", _result())  # 바이트 한도 초과 → 가장 오래된 b 제거
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.size_bytes == size
@@ -0,0 +1,226 @@
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, Source
+from app.routes.articles import ArticleFilters, facets_statement
+from app.schemas import ArticleDetail, ArticleListResponse
+from app.services.response_cache import get_response_cache
+from app.services.search import index_article
+from app.services.serialization import negotiate_encoding
+
+
+def _seed(db, n=7):
+    src = Source(name="newsdata", api_type="newsdata", active=True)
+    db.add(src)
+    db.flush()
+    base = datetime(2026, 1, 1)
+    for i in range(n):
+        art = Article(
+            source_id=src.id,
+            title=f"기사 {i}",
+            link=f"https://example.com/{i}",
+            # 같은 발행 시각이 섞여 있어야 id 타이브레이커가 검증된다
+            published_at=None if i == 0 else base + timedelta(hours=i // 2),
+            content_raw="원문",
+            content_clean="정제 본문",
+            hash=f"h{i}",
+        )
+        db.add(art)
+        db.flush()
+        index_article(db, art, ["금리"] if i % 3 else None)
+        if i % 3:
+            db.add(
+                Analysis(
+                    article_id=art.id,
+                    summary=f"요약 {i}",
+                    sentiment_label="positive",
+                    sentiment_score=round(0.1 * (i % 4), 1),
+                    keywords=["금리"],
+                )
+            )
+    db.commit()
+
+
+def _walk(client, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, limit=2)
+        if cursor:
+            query["cursor"] = cursor
+        body = client.get("/articles", params=query).json()
+        ids.extend(item["id"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def test_keyset_pages_match_full_listing(client, db_session):
+    _seed(db_session)
+    for sort in ("published_desc", "score_desc"):
+        full = client.get("/articles", params={"sort": sort}).json()
+        assert full["next_cursor"] is None
+        expected = [item["id"] for item in full["items"]]
+        assert len(expected) == 7
+        assert _walk(client, sort=sort) == expected
+
+
+def test_invalid_cursor_rejected(client, db_session):
+    _seed(db_session)
+    resp = client.get("/articles", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+def test_ndjson_stream(client, db_session):
+    _seed(db_session)
+    resp = client.get("/articles", params={"format": "ndjson", "sentiment": "positive"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 4
+    assert all(row["sentiment_label"] == "positive" for row in rows)
+    assert "content_clean" not in rows[0]
+
+
+def test_search_uses_index_and_relevance_sort(client, db_session):
+    _seed(db_session)
+    src = db_session.query(Source).first()
+    for i, (title, body) in enumerate(
+        [
+            ("반도체 수출 호조", "반도체 반도체 수출이 늘었다"),
+            ("증시 마감", "코스피 반도체주 강세"),
+            ("날씨", "전국에 비"),
+        ]
+    ):
+        art = Article(source_id=src.id, title=title, link=f"https://example.com/s{i}", content_clean=body, hash=f"s{i}")
+        db_session.add(art)
+        db_session.flush()
+        index_article(db_session, art)
+    db_session.commit()
+
+    # '반도체'는 접두어 일치로 '반도체주'도 찾는다
+    body = client.get("/articles", params={"q": "반도체", "sort": "relevance"}).json()
+    assert [item["title"] for item in body["items"]] == ["반도체 수출 호조", "증시 마감"]
+
+    # 키워드도 색인 문서에 포함된다
+    keyword_hits = client.get("/articles", params={"q": "금리", "limit": 200}).json()["items"]
+    assert len(keyword_hits) == 4
+
+
+def test_response_cache_until_ingest_generation_changes(client, db_session):
+    _seed(db_session)
+    cache = get_response_cache()
+    first = client.get("/articles", params={"sentiment": "positive", "limit": 3})
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public")
+    etag = first.headers["etag"]
+
+    # 파라미터 순서/빈 값이 달라도 같은 캐시 항목
+    again = client.get("/articles?source=&limit=3&sentiment=positive")
+    assert again.json() == first.json() and again.headers["etag"] == etag
+    assert cache.hits == 1
+
+    not_modified = client.get("/articles", params={"sentiment": "positive", "limit": 3}, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    # 세대가 바뀌기 전에는 DB 변경이 보이지 않고, bump 후에는 새 결과와 새 ETag
+    db_session.query(Analysis).update({"summary": "변경"})
+    db_session.commit()
+    assert client.get("/articles", params={"sentiment": "positive", "limit": 3}).headers["etag"] == etag
+    cache.bump()
+    fresh = client.get("/articles", params={"sentiment": "positive", "limit": 3}, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert {item["summary"] for item in fresh.json()["items"]} == {"변경"}
+
+
+def test_article_detail_cached_with_etag(client, db_session):
+    _seed(db_session)
+    resp = client.get("/articles/2")
+    assert resp.status_code == 200 and resp.json()["summary"] == "요약 1"
+    assert client.get("/articles/2", headers={"If-None-Match": f'W/{resp.headers["etag"]}'}).status_code == 304
+    assert client.get("/articles/999").status_code == 404
+
+
+def test_fast_serialization_matches_pydantic_output(client, db_session):
+    _seed(db_session)
+    identity = {"Accept-Encoding": "identity"}
+    # Pydantic 검증/직렬화를 거치지 않지만 바이트 단위로 같은 응답 (ETag도 그대로 유지)
+    listing = client.get("/articles", params={"limit": 200}, headers=identity)
+    assert listing.content == ArticleListResponse.model_validate(listing.json()).model_dump_json().encode("utf-8")
+    assert [item["cluster_size"] for item in listing.json()["items"]] == [None] * 7
+    detail = client.get("/articles/2", headers=identity)
+    assert detail.content == ArticleDetail.model_validate(detail.json()).model_dump_json().encode("utf-8")
+
+
+def test_large_responses_negotiate_compression(client, db_session):
+    _seed(db_session, n=30)
+    plain = client.get("/articles", params={"limit": 30}, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers and plain.headers["vary"] == "Accept-Encoding"
+
+    gz = client.get("/articles", params={"limit": 30}, headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert int(gz.headers["content-length"]) < len(plain.content)
+    assert gz.json() == plain.json()
+    assert gz.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    # 압축본/원본 ETag 어느 쪽으로 재검증해도 304
+    for etag in (gz.headers["etag"], plain.headers["etag"]):
+        assert client.get("/articles", params={"limit": 30}, headers={"If-None-Match": etag}).status_code == 304
+
+    # 작은 응답은 그대로
+    assert "content-encoding" not in client.get("/articles/2", headers={"Accept-Encoding": "gzip"}).headers
+
+    stream = client.get("/articles", params={"format": "ndjson"}, headers={"Accept-Encoding": "gzip"})
+    assert stream.headers["content-encoding"] == "gzip"
+    assert len(stream.text.splitlines()) == 30
+
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("*;q=0.5") in ("br", "gzip")
+    assert negotiate_encoding(None) is None
+
+
+def test_facets_match_filtered_listing(client, db_session):
+    _seed(db_session)
+    other = Source(name="rss:yna", api_type="rss", active=True)
+    db_session.add(other)
+    db_session.flush()
+    art = Article(
+        source_id=other.id, title="환율 기사", link="https://yna.example.com/1", published_at=datetime(2026, 1, 3, 9),
+        content_raw="원문", content_clean="정제 본문", hash="yna-1",
+    )
+    db_session.add(art)
+    db_session.flush()
+    db_session.add(Analysis(article_id=art.id, summary="요약", sentiment_label="negative", sentiment_score=-0.5, keywords=[]))
+    db_session.commit()
+
+    assert client.get("/articles/facets").json() == {
+        "total": 8,
+        "sentiment": [
+            {"sentiment_label": "positive", "count": 4},
+            {"sentiment_label": None, "count": 3},
+            {"sentiment_label": "negative", "count": 1},
+        ],
+        "sources": [
+            {"source_id": 1, "source_name": "newsdata", "count": 7},
+            {"source_id": other.id, "source_name": "rss:yna", "count": 1},
+        ],
+        # 발행 시각이 없는 기사는 일별 히스토그램에서 빠진다
+        "days": [{"day": "2026-01-01", "count": 6}, {"day": "2026-01-03", "count": 1}],
+    }
+
+    # 목록과 같은 필터가 적용된다
+    for params in ({"sentiment": "positive"}, {"source": "rss"}, {"q": "금리"}, {"from": "2026-01-01T02:00:00"}):
+        facets = client.get("/articles/facets", params=params).json()
+        listed = client.get("/articles", params={**params, "limit": 200}).json()["items"]
+        assert facets["total"] == len(listed)
+        assert sum(item["count"] for item in facets["sources"]) == len(listed)
+
+
+def test_facets_use_grouping_sets_on_postgresql():
+    session = Session(create_engine("postgresql+psycopg://user@localhost/db"))
+    sql = str(facets_statement(session, ArticleFilters(sentiment="positive")).compile(session.get_bind()))
+    assert "GROUPING SETS" in sql and "UNION" not in sql
+    assert sql.count("FROM articles") == 1
@@ -0,0 +1,77 @@
+from app.models import Article, Source, StoryBand, StorySignature
+from app.services.dedup import BANDS, assign_clusters, rebuild_clusters, signature, similarity
+from benchmarks.synthetic import iter_articles
+
+THRESHOLD = 0.5
+
+
+def _syndicated(text, n):
+    """통신사 기사를 조금씩 고친 재배포본: 머리말/꼬리말을 붙이고 몇 단어를 바꾼다."""
+    words = text.split()
+    for i in range(n, len(words), 25):
+        words[i] = "수정"
+    return f"(서울=뉴스{n}) " + " ".join(words) + " 무단 전재 및 재배포 금지"
+
+
+def _bodies(n):
+    # 충분히 긴 서로 다른 본문
+    return [a["content"] for a in iter_articles(n * 3) if len(a["content"]) > 400][:n]
+
+
+def _add_articles(db, texts):
+    src = db.query(Source).first() or Source(name="newsdata:kr", api_type="newsdata")
+    db.add(src)
+    db.flush()
+    start = db.query(Article).count()
+    rows = []
+    for i, text in enumerate(texts, start=start):
+        art = Article(source_id=src.id, title=f"기사 {i}", link=f"https://example.com/{i}", content_clean=text, hash=f"h{i}")
+        db.add(art)
+        db.flush()
+        rows.append((art.id, text))
+    db.commit()
+    return rows
+
+
+def test_signature_similarity():
+    original, other = _bodies(2)
+    assert similarity(signature(original), signature(original)) == 1.0
+    assert similarity(signature(original), signature(_syndicated(original, 1))) >= THRESHOLD
+    assert similarity(signature(original), signature(other)) < THRESHOLD
+    assert signature("짧은 본문") is None
+
+
+def test_assign_clusters_across_batches(db_session):
+    first, second = _bodies(2)
+    batch = _add_articles(db_session, [first, _syndicated(first, 1), second, "짧음"])
+    assigned = assign_clusters(db_session, batch, THRESHOLD)
+    ids = [article_id for article_id, _ in batch]
+    # 같은 배치 안의 재배포본은 앞선 기사를 대표로, 짧은 본문은 묶지 않음
+    assert assigned == {ids[0]: ids[0], ids[1]: ids[0], ids[2]: ids[2]}
+    assert db_session.query(StorySignature).count() == 3
+    assert db_session.query(StoryBand).count() <= 3 * BANDS
+
+    later = _add_articles(db_session, [_syndicated(first, 2), _syndicated(second, 3)])
+    assert list(assign_clusters(db_session, later, THRESHOLD).values()) == [ids[0], ids[2]]
+    db_session.expire_all()
+    assert db_session.get(Article, later[0][0]).cluster_id == ids[0]
+
+    # 재계산해도 같은 묶음
+    clusters = {a.id: a.cluster_id for a in db_session.query(Article)}
+    assert rebuild_clusters(db_session, THRESHOLD, chunk_size=2) == 5
+    db_session.expire_all()
+    assert {a.id: a.cluster_id for a in db_session.query(Article)} == clusters
+
+
+def test_list_items_expose_cluster(client, db_session):
+    first, second = _bodies(2)
+    batch = _add_articles(db_session, [first, _syndicated(first, 1), _syndicated(first, 2), second])
+    assign_clusters(db_session, batch, THRESHOLD)
+    items = {item["id"]: item for item in client.get("/articles").json()["items"]}
+    head = batch[0][0]
+    assert [(items[a]["cluster_id"], items[a]["cluster_size"]) for a, _ in batch] == [
+        (head, 3),
+        (head, 3),
+        (head, 3),
+        (batch[3][0], 1),
+    ]
@@ -0,0 +1,76 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from app.models import Analysis
+from app.routes.articles import ArticleFilters, filtered_query
+from app.services.export import stream_export
+from benchmarks.synthetic import seed_database
+
+
+def test_export_formats_include_analysis_metadata(client, db_session):
+    seed_database(db_session, 30)
+    analysis = db_session.query(Analysis).order_by(Analysis.article_id).first()
+    analysis.json_meta = {"reason": "테스트"}
+    db_session.commit()
+    positive = db_session.query(Analysis).filter(Analysis.sentiment_label == "positive").count()
+
+    res = client.get("/export/articles", params={"format": "csv"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert res.headers["content-disposition"].endswith('.csv"')
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [int(row["id"]) for row in rows] == list(range(1, 31))
+    assert {"content_clean", "json_meta", "model_name", "source"} <= set(rows[0])
+    assert "content_raw" not in rows[0]
+    assert json.loads(rows[0]["json_meta"]) == {"reason": "테스트"}
+    assert rows[0]["model_name"] == "synthetic" and rows[0]["source"] == "newsdata"
+
+    # 목록 API와 같은 필터, gzip 스트림
+    res = client.get("/export/articles", params={"sentiment": "positive", "compression": "gzip", "include_raw": "true"})
+    assert res.headers["content-type"] == "application/gzip"
+    records = [json.loads(line) for line in gzip.decompress(res.content).decode("utf-8").splitlines()]
+    assert len(records) == positive
+    assert all(r["sentiment_label"] == "positive" and r["content_raw"] for r in records)
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    res = client.get("/export/articles", params={"format": "parquet", "limit": 10})
+    table = pq.read_table(io.BytesIO(res.content))
+    assert table.num_rows == 10
+    assert table.column("json_meta")[0].as_py() == '{"reason": "테스트"}'
+    assert client.get("/export/articles", params={"format": "parquet", "compression": "gzip"}).status_code == 400
+
+
+def _peak_export_bytes(async_engine, limit, fmt, gzip):
+    def build_query(session, columns):
+        return filtered_query(session, columns, ArticleFilters())[0]
+
+    async def consume():
+        total = 0
+        async for chunk in stream_export(async_engine, build_query, fmt, gzip=gzip, batch_size=500, limit=limit):
+            total += len(chunk)
+        return total
+
+    tracemalloc.start()
+    try:
+        written = asyncio.run(consume())
+        return tracemalloc.get_traced_memory()[1], written
+    finally:
+        tracemalloc.stop()
+
+
+def test_export_memory_does_not_grow_with_row_count(db_session, async_engine):
+    seed_database(db_session, 10_000, with_search=False)
+
+    for fmt, gzip in (("csv", True), ("ndjson", False)):
+        small_peak, small_written = _peak_export_bytes(async_engine, 1_000, fmt, gzip)
+        large_peak, large_written = _peak_export_bytes(async_engine, None, fmt, gzip)
+
+        # 10배 많은 행을 내보내도 최대 메모리는 배치 하나 분량에 머문다
+        assert large_written > 8 * small_written
+        assert large_peak < small_peak * 1.5, (fmt, small_peak, large_peak)
@@ -1,6 +1,17 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from alembic.runtime.migration import MigrationContext
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
 
 from app.main import app
+from app.services import migrations
+from app.services.migrations import ensure_schema, schema_status
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
 
 
 def test_health():
@@ -9,3 +20,43 @@ def test_health():
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
 
+
+def test_import_does_not_open_database(tmp_path):
+    # import만으로는 엔진(연결 풀)을 만들지 않는다
+    code = (
+        "import app.main, app.database as d; "
+        "assert d.get_engine.cache_info().currsize == 0; "
+        "assert d.get_async_engine.cache_info().currsize == 0"
+    )
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path / 'missing' / 'x.db'}"}
+    subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, check=True)
+
+
+def test_schema_check_creates_then_compares_revision(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}", future=True)
+    with eng.begin() as conn:
+        assert ensure_schema(conn, auto_create=False).state == migrations.EMPTY
+        created = ensure_schema(conn)
+    assert created.state == migrations.CREATED and created.head == migrations.head_revision()
+    with eng.begin() as conn:
+        assert "article_search_fts" in inspect(conn).get_table_names()
+        assert schema_status(conn).state == migrations.CURRENT
+        conn.execute(text("UPDATE alembic_version SET version_num = '006'"))
+        outdated = schema_status(conn)
+    assert (outdated.state, outdated.revision, outdated.ok) == (migrations.OUTDATED, "006", False)
+    eng.dispose()
+
+
+def test_ready_reports_schema_and_warms_pool(client, engine):
+    # conftest DB는 create_all로 만들어 alembic_version이 없다
+    res = client.get("/ready")
+    assert res.status_code == 503
+    assert res.json()["schema_state"] == migrations.UNVERSIONED
+
+    with engine.begin() as conn:
+        MigrationContext.configure(conn).stamp(migrations._script_directory(), "heads")
+    res = client.get("/ready")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["status"] == "ready" and body["revision"] == body["head"] == migrations.head_revision()
+    assert body["connections_warmed"] >= 1
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import httpx
+
+from app.config import get_settings
+from app.schemas import AnalyzeRequest
+from app.services.analyzer import AnalyzerClient
+from app.services.http_client import HttpClientRegistry, http_clients, request_with_retries
+from app.services.rate_limit import RateLimiter
+
+
+def _gemini_handler(request: httpx.Request) -> httpx.Response:
+    result = {
+        "summary": "요약",
+        "sentiment": {"label": "positive", "score": 0.5},
+        "keywords": ["테스트"],
+        "reason": "이유",
+    }
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": json.dumps(result)}]}}]})
+
+
+def test_analyzer_reuses_pooled_client_with_injected_transport():
+    http_clients.configure(transport=httpx.MockTransport(_gemini_handler))
+    try:
+        analyzer = AnalyzerClient(api_key="test", limiter=RateLimiter(requests_per_min=600))
+        req = AnalyzeRequest(article={"title": "제목", "content": "본문"})
+
+        async def scenario():
+            first = http_clients.get("gemini")
+            results = [await analyzer.analyze(req) for _ in range(3)]
+            assert http_clients.get("gemini") is first
+            return results
+
+        results = asyncio.run(scenario())
+        assert [r.sentiment.label for r in results] == ["positive"] * 3
+        assert http_clients.stats()["latency"]["gemini"]["count"] >= 3
+    finally:
+        http_clients.configure(transport=None)
+
+
+def test_retries_on_server_errors(monkeypatch):
+    monkeypatch.setenv("HTTP_RETRY_BACKOFF", "0")
+    get_settings.cache_clear()
+    statuses = iter([503, 429, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={})
+
+    registry = HttpClientRegistry()
+    registry.configure(transport=httpx.MockTransport(handler))
+
+    async def scenario():
+        return await request_with_retries(registry.get("newsdata"), "GET", "https://newsdata.io/api/1/news")
+
+    try:
+        assert asyncio.run(scenario()).status_code == 200
+        assert registry.latency.snapshot()["newsdata"]["count"] == 3
+    finally:
+        get_settings.cache_clear()
+
+
+def test_clients_from_previous_event_loop_are_closed():
+    registry = HttpClientRegistry()
+    registry.configure(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+    async def first():
+        return registry.get("rss")
+
+    async def second():
+        client = registry.get("rss")
+        await registry.aclose()
+        return client
+
+    old = asyncio.run(first())
+    assert not old.is_closed
+    # 루프가 바뀌면 새 클라이언트를 만들고 이전 루프의 클라이언트(연결 풀)는 닫는다
+    new = asyncio.run(second())
+    assert new is not old
+    assert old.is_closed and new.is_closed
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.schema import CreateIndex
+
+from app.models import Analysis, AnalysisKeyword, Article, Keyword, Source
+from app.services.keywords import index_keywords, keyword_article_ids, normalize_keyword, rebuild_keyword_index
+
+NOW = datetime(2026, 5, 10, 12, 0)
+
+
+def _seed(db):
+    src = Source(name="newsdata:kr", api_type="newsdata")
+    db.add(src)
+    db.flush()
+    keyword_sets = [["금리"], ["금리인하", "환율"], ["Fed  Rate"], ["금리", "환율"], ["ＡＩ"], None]
+    rows = []
+    for i, keywords in enumerate(keyword_sets):
+        published = NOW - timedelta(hours=6 * i)
+        art = Article(
+            source_id=src.id, title=f"기사 {i}", link=f"https://example.com/{i}", published_at=published, hash=f"h{i}"
+        )
+        db.add(art)
+        db.flush()
+        db.add(Analysis(article_id=art.id, summary="요약", sentiment_label="neutral", sentiment_score=0.0, keywords=keywords))
+        rows.append((art.id, published, keywords))
+    index_keywords(db, rows)
+    db.commit()
+    return [article_id for article_id, _, _ in rows]
+
+
+def _titles(client, **params):
+    return sorted(item["title"] for item in client.get("/articles", params=params).json()["items"])
+
+
+def test_normalize_keyword():
+    assert normalize_keyword("  Fed   Rate ") == "fed rate"
+    assert normalize_keyword("ＡＩ") == "ai"
+
+
+def test_keyword_filter_exact_and_prefix(client, db_session):
+    _seed(db_session)
+    # JSON 문자열 부분 일치와 달리 '금리'는 '금리인하'와 일치하지 않는다
+    assert _titles(client, keyword="금리") == ["기사 0", "기사 3"]
+    assert _titles(client, keyword="금리", keyword_match="prefix") == ["기사 0", "기사 1", "기사 3"]
+    assert _titles(client, keyword="fed rate") == ["기사 2"]
+    assert _titles(client, keyword="ai") == ["기사 4"]
+    assert _titles(client, keyword="금리", sentiment="neutral", keyword_match="prefix", source="newsdata") == [
+        "기사 0",
+        "기사 1",
+        "기사 3",
+    ]
+    assert client.get("/articles", params={"keyword": "금리", "keyword_match": "fuzzy"}).status_code == 422
+
+
+def test_prefix_match_uses_like_on_postgresql():
+    engine = create_engine("postgresql+psycopg://user@localhost/db")
+    compiled = keyword_article_ids("50%_할인/쿠폰", prefix=True, dialect="postgresql").compile(engine)
+    # 로케일 정렬에서 BETWEEN 범위는 접두어와 맞지 않으므로 LIKE + text_pattern_ops 인덱스
+    assert "LIKE" in str(compiled) and "BETWEEN" not in str(compiled)
+    assert list(compiled.params.values()) == ["50/%/_할인//쿠폰%"]
+    index = next(index for index in Keyword.__table__.indexes if index.name == "ix_keywords_term_pattern")
+    assert "text_pattern_ops" in str(CreateIndex(index).compile(engine))
+
+
+def test_top_keywords_window(client, db_session):
+    _seed(db_session)
+    body = client.get("/keywords/top", params={"to": NOW.isoformat(), "hours": 24}).json()
+    assert body["from"] == (NOW - timedelta(hours=24)).isoformat()
+    # 0~4번 기사(0h~24h 전)만 기간에 포함
+    assert body["items"][:2] == [{"keyword": "금리", "count": 2}, {"keyword": "환율", "count": 2}]
+    assert {item["keyword"] for item in body["items"]} == {"금리", "환율", "금리인하", "fed rate", "ai"}
+
+    recent = client.get("/keywords/top", params={"to": NOW.isoformat(), "hours": 7, "limit": 1}).json()["items"]
+    assert recent == [{"keyword": "금리", "count": 1}]
+
+
+def test_rebuild_matches_incremental_index(db_session):
+    _seed(db_session)
+    query = select(Keyword.term, AnalysisKeyword.article_id, AnalysisKeyword.published_at).join(
+        AnalysisKeyword, AnalysisKeyword.keyword_id == Keyword.id
+    )
+    before = sorted(db_session.execute(query).all())
+    db_session.add(Keyword(term="고아 키워드"))
+    db_session.commit()
+
+    assert rebuild_keyword_index(db_session, chunk_size=2) == len(before)
+    assert sorted(db_session.execute(query).all()) == before
+    assert db_session.query(Keyword).filter(Keyword.term == "고아 키워드").count() == 0
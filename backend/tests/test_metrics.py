@@ -0,0 +1,44 @@
+from app.services.metrics import DB_QUERY_DURATION, REGISTRY, Histogram, instrument_engine
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        hist.labels('/a"b').observe(value)
+    assert hist.render() == [
+        "# HELP demo_seconds Demo.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+        'demo_seconds_bucket{route="/a\\"b",le="1"} 3',
+        'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        'demo_seconds_sum{route="/a\\"b"} 3.65',
+        'demo_seconds_count{route="/a\\"b"} 4',
+    ]
+
+
+def test_metrics_endpoint(client, async_engine):
+    instrument_engine(async_engine.sync_engine)
+    REGISTRY.reset()
+    assert client.get("/articles").status_code == 200
+    assert client.get("/articles/999").status_code == 404
+    assert client.get("/no-such-path").status_code == 404
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = resp.text.splitlines()
+    # 경로 값이 아니라 라우트 템플릿으로 집계된다
+    assert 'http_request_duration_seconds_count{method="GET",route="/articles",status="200"} 1' in lines
+    assert 'http_request_duration_seconds_count{method="GET",route="/articles/{article_id}",status="404"} 1' in lines
+    assert 'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"} 1' in lines
+    assert DB_QUERY_DURATION.count("SELECT") > 0
+    for name in (
+        "db_query_duration_seconds",
+        "gemini_request_duration_seconds",
+        "gemini_tokens_total",
+        "fetch_duration_seconds",
+        "rate_limiter_wait_seconds",
+        "ingest_articles_total",
+        "http_client_request_duration_seconds",
+    ):
+        assert f"# TYPE {name} " in resp.text
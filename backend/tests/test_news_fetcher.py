@@ -0,0 +1,188 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Article, Source
+from app.services.collector import fetch_sources
+from app.services.news_fetcher import CreditBudget, iter_newsdata_news
+from app.services.rss import FeedValidators, fetch_feed
+from fakes import make_newsdata_app, make_rss_app, newsdata_article, rss_entry, serve
+
+
+def _articles(start, count, newest):
+    # 최신순: index가 클수록 최신
+    return [
+        newsdata_article(i, (newest - timedelta(minutes=start + count - 1 - i)).strftime("%Y-%m-%d %H:%M:%S"))
+        for i in reversed(range(start, start + count))
+    ]
+
+
+@pytest.fixture
+def newsdata_env(settings_env):
+    # 가짜 NEWSDATA 서버로 수집 (분석 단계는 끔)
+    def _apply(base_url, **values):
+        settings_env(newsdata_api_key="test", gemini_api_key=None, newsdata_base_url=base_url, **values)
+
+    return _apply
+
+
+def test_page_walk_respects_page_and_credit_budget(newsdata_env):
+    fake = make_newsdata_app(_articles(0, 45, datetime(2026, 1, 5, 12)), page_size=10)
+
+    async def collect(**kwargs):
+        return [item async for item in iter_newsdata_news("test", **kwargs)]
+
+    with serve(fake) as base_url:
+        newsdata_env(base_url, newsdata_max_pages=4)
+        assert len(asyncio.run(collect())) == 40
+        budget = CreditBudget(2)
+        assert len(asyncio.run(collect(budget=budget))) == 20
+        assert budget.remaining == 0
+
+    assert [r.get("page") for r in fake.state.requests[:4]] == [None, "10", "20", "30"]
+
+
+def test_transient_server_errors_are_retried(newsdata_env):
+    fake = make_newsdata_app(_articles(0, 40, datetime(2026, 1, 5, 12)), page_size=10, error_rate=0.4, seed=3)
+
+    async def collect():
+        return [item async for item in iter_newsdata_news("test")]
+
+    with serve(fake) as base_url:
+        newsdata_env(base_url, newsdata_max_pages=4, http_retries=5, http_retry_backoff=0)
+        assert len(asyncio.run(collect())) == 40
+
+    # 503 응답은 같은 페이지를 다시 요청한다
+    assert fake.state.errors > 0
+    assert len(fake.state.requests) == 4 + fake.state.errors
+
+
+def test_ingest_stops_at_watermark_and_advances_it(db_session, ingest, newsdata_env):
+    newest = datetime(2026, 1, 5, 12)
+    fake = make_newsdata_app(_articles(0, 25, newest), page_size=10)
+    with serve(fake) as base_url:
+        newsdata_env(base_url)
+        first = ingest()
+        assert first["fetched"] == 25
+        assert len(fake.state.requests) == 3
+
+        source = db_session.query(Source).filter(Source.name == "newsdata").one()
+        assert source.last_fetched_at == newest
+
+        # 새 기사 5건이 앞에 추가됨 → 첫 페이지에서 워터마크에 닿아 멈춘다
+        fake.state.articles = _articles(25, 5, newest + timedelta(minutes=5)) + fake.state.articles
+        second = ingest()
+
+    assert second["fetched"] == 5
+    assert len(fake.state.requests) == 4
+    db_session.refresh(source)
+    assert source.last_fetched_at == newest + timedelta(minutes=5)
+    assert db_session.query(Article).count() == 30
+
+
+def test_watermark_holds_when_walk_is_cut_short(db_session, ingest, newsdata_env):
+    newest = datetime(2026, 1, 5, 12)
+    fake = make_newsdata_app(_articles(0, 5, newest), page_size=10)
+    with serve(fake) as base_url:
+        newsdata_env(base_url)
+        assert ingest()["fetched"] == 5
+        source = db_session.query(Source).filter(Source.name == "newsdata").one()
+
+        # 새 기사 30건: 페이지 한도(2페이지)로 워터마크 전에 멈추면 밀린 10건을 건너뛰지 않도록 워터마크를 그대로 둔다
+        latest = newest + timedelta(minutes=30)
+        fake.state.articles = _articles(5, 30, latest) + fake.state.articles
+        newsdata_env(base_url, newsdata_max_pages=2)
+        assert ingest()["fetched"] == 20
+        db_session.refresh(source)
+        assert source.last_fetched_at == newest
+
+        # 크레딧 한도: 두 쿼리가 3크레딧을 나눠 쓰면 어느 쪽도 워터마크까지 못 읽는다
+        newsdata_env(base_url, newsdata_max_pages=5, newsdata_max_credits=3, newsdata_queries="country=kr;category=business")
+        ingest()
+        db_session.refresh(source)
+        assert source.last_fetched_at == newest
+
+        # 한도가 충분하면 밀린 기사까지 받고 최신 시각으로 올린다
+        newsdata_env(base_url, newsdata_max_credits=10)
+        ingest()
+        db_session.refresh(source)
+        assert source.last_fetched_at == latest
+
+    assert db_session.query(Article).count() == 35
+
+
+def test_first_cut_short_walk_sets_watermark_to_oldest_fetched(db_session, ingest, newsdata_env):
+    newest = datetime(2026, 1, 5, 12)
+    fake = make_newsdata_app(_articles(0, 30, newest), page_size=10)
+    with serve(fake) as base_url:
+        newsdata_env(base_url, newsdata_max_pages=2)
+        assert ingest()["fetched"] == 20
+
+    # 워터마크가 없던 첫 회차는 받은 범위의 가장 오래된 시각까지만 (그보다 오래된 기사는 받지 않음)
+    source = db_session.query(Source).filter(Source.name == "newsdata").one()
+    assert source.last_fetched_at == newest - timedelta(minutes=19)
+
+
+def test_feed_conditional_get_returns_not_modified(newsdata_env):
+    fake = make_rss_app({"main": [rss_entry(i) for i in range(3)]})
+    validators = FeedValidators()
+    with serve(fake) as base_url:
+        newsdata_env(base_url)
+        url = f"{base_url}/feeds/main"
+        first = asyncio.run(fetch_feed(url, "rss:main", validators))
+        assert [item.title for item in first] == ["피드 기사 0", "피드 기사 1", "피드 기사 2"]
+        assert first[0].source_name == "rss:main"
+        assert first[0].published_at == datetime(2026, 1, 5, 12)
+
+        # 변경 없음 → 304, 파싱 없이 None
+        assert asyncio.run(fetch_feed(url, "rss:main", validators)) is None
+
+        fake.state.feeds["main"].append(rss_entry(3))
+        assert len(asyncio.run(fetch_feed(url, "rss:main", validators))) == 4
+
+    assert fake.state.requests == [("main", 200), ("main", 304), ("main", 200)]
+
+
+def test_fan_out_is_bounded_by_slowest_source_and_per_host_limit(newsdata_env):
+    latency = 0.3
+    newsdata = make_newsdata_app(_articles(0, 5, datetime(2026, 1, 5, 12)), latency=latency)
+    feeds = make_rss_app({f"f{n}": [rss_entry(n * 10 + i) for i in range(2)] for n in range(3)}, latency=latency)
+    with serve(newsdata) as newsdata_url, serve(feeds) as feeds_url:
+        newsdata_env(
+            newsdata_url,
+            newsdata_queries="country=kr&language=ko;country=kr&category=business;country=kr&category=technology",
+            rss_feeds=",".join(f"f{n}={feeds_url}/feeds/f{n}" for n in range(3)),
+            fetch_per_host_concurrency=2,
+        )
+        started = time.perf_counter()
+        report = asyncio.run(fetch_sources("test"))
+        elapsed = time.perf_counter() - started
+
+    # 순차로는 6 * latency, 호스트당 2개씩 동시 → 호스트마다 2 * latency, 두 호스트는 서로 겹친다
+    assert elapsed < 4 * latency
+    assert newsdata.state.max_in_flight == 2
+    assert feeds.state.max_in_flight == 2
+    assert len(report.items) == 3 * 5 + 3 * 2
+    assert report.failed == [] and report.not_modified == []
+    assert sorted(r.get("category", "") for r in newsdata.state.requests) == ["", "business", "technology"]
+
+
+def test_ingest_keeps_watermark_when_a_query_fails(db_session, ingest, newsdata_env):
+    newsdata = make_newsdata_app(_articles(0, 5, datetime(2026, 1, 5, 12)))
+    feeds = make_rss_app({"main": [rss_entry(i) for i in range(2)]})
+    with serve(newsdata) as newsdata_url, serve(feeds) as feeds_url:
+        newsdata_env(
+            newsdata_url,
+            newsdata_queries="country=kr&language=ko;country=kr&category=broken",
+            rss_feeds=f"main={feeds_url}/feeds/main",
+            http_retries=0,
+        )
+        result = ingest()
+
+    # 성공한 쿼리와 피드의 기사는 저장되지만, 실패한 쿼리가 있으므로 NEWSDATA 워터마크는 그대로
+    assert result["fetched"] == 7
+    rss_source = db_session.query(Source).filter(Source.name == "rss").one()
+    assert db_session.query(Article).filter(Article.source_id == rss_source.id).count() == 2
+    assert db_session.query(Source).filter(Source.name == "newsdata").one().last_fetched_at is None
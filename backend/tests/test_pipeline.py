@@ -0,0 +1,159 @@
+import time
+
+from app.models import Analysis, AnalysisKeyword, Article, ArticleSearch, Keyword, SentimentRollup, Source
+from app.services import pipeline
+from app.services.analysis_cache import get_analysis_cache
+from app.services.collector import FetchReport
+from app.services.metrics import GEMINI_REQUEST_DURATION, GEMINI_TOKENS, INGEST_ARTICLES, REGISTRY
+from app.services.response_cache import get_response_cache
+from app.services.news_fetcher import NormalizedArticle, _compute_hash
+from benchmarks.synthetic import iter_articles
+from fakes import make_gemini_app, serve
+
+
+def _items(n, fail_every=0, link_prefix="https://example.com/", marker="FAIL"):
+    # 서로 다른 기사 본문 (근접 중복으로 묶이지 않도록)
+    bodies = [article["content"] for article in iter_articles(n)]
+    items = []
+    for i in range(n):
+        title = f"테스트 기사 {i}" + (f" {marker}" if fail_every and i % fail_every == 0 else "")
+        link = f"{link_prefix}{i}"
+        items.append(
+            NormalizedArticle(
+                title=title,
+                link=link,
+                published_at=None,
+                content=f"<p>{title} {bodies[i]}</p>",
+                source_name="newsdata:test",
+                hash=_compute_hash(link, title),
+            )
+        )
+    return items
+
+
+def _run(ingest, monkeypatch, items, progress=None):
+    async def _fake_fetch(_key, since=None):
+        return FetchReport(items=items)
+
+    monkeypatch.setattr(pipeline, "fetch_sources", _fake_fetch)
+    return ingest(progress=progress)
+
+
+def test_concurrent_analysis_stage_speedup(db_session, ingest, monkeypatch, settings_env):
+    latency, n, workers = 0.2, 12, 6
+    REGISTRY.reset()
+    gemini = make_gemini_app(latency=latency)
+    with serve(gemini) as base_url:
+        settings_env(
+            gemini_api_key="test",
+            newsdata_api_key="test",
+            gemini_base_url=base_url,
+            analysis_concurrency=workers,
+            analysis_write_batch_size=5,
+            http_retries=0,
+        )
+        started = time.perf_counter()
+        result = _run(ingest, monkeypatch, _items(n, fail_every=5))
+        elapsed = time.perf_counter() - started
+
+    # 0, 5, 10번 기사는 가짜 서버가 실패시키지만 나머지는 저장되어야 한다
+    assert result == {"fetched": n, "analyzed": n - 3, "cache_hits": 0, "cache_misses": n, "duplicates": 0}
+    assert db_session.query(Analysis).count() == n - 3
+    assert db_session.query(Article).count() == n
+    # 분석 키워드가 검색 문서에 반영된다
+    assert db_session.query(ArticleSearch).filter(ArticleSearch.document.contains("뉴스")).count() == n - 3
+    # 키워드 역색인: 분석된 기사마다 키워드 2개
+    assert db_session.query(Keyword.term).order_by(Keyword.term).all() == [("뉴스",), ("테스트",)]
+    assert db_session.query(AnalysisKeyword).count() == 2 * (n - 3)
+    assert gemini.state.max_in_flight == workers
+    # 순차 실행이면 n * latency(2.4s)가 걸린다
+    assert elapsed < n * latency / 2
+    # 수집 결과와 Gemini 호출이 메트릭에 기록된다
+    assert INGEST_ARTICLES.value("stored") == n
+    assert INGEST_ARTICLES.value("analyzed") == n - 3
+    assert INGEST_ARTICLES.value("analysis_failed") == 3
+    assert GEMINI_REQUEST_DURATION.count("ok") == n - 3
+    assert GEMINI_REQUEST_DURATION.count("error") == 3
+    assert GEMINI_TOKENS.value("prompt") > 0
+
+
+def test_republished_stories_hit_analysis_cache(db_session, ingest, monkeypatch, settings_env):
+    gemini = make_gemini_app()
+    with serve(gemini) as base_url:
+        settings_env(gemini_api_key="test", newsdata_api_key="test", gemini_base_url=base_url)
+        events = []
+        generation = get_response_cache().generation
+        first = _run(ingest, monkeypatch, _items(4), progress=lambda stage, counts: events.append((stage, counts)))
+        # 같은 기사가 다른 링크로 재배포됨 → 해시는 다르지만 본문은 동일
+        get_analysis_cache().memory.clear()  # 영구(DB) 계층만으로도 적중해야 한다
+        second = _run(ingest, monkeypatch, _items(4, link_prefix="https://mirror.example.com/"))
+
+    assert first["cache_misses"] == 4
+    assert [stage for stage, _ in events][:3] == ["fetch", "store", "analyze"]
+    assert events[-1] == ("analyze", {"analyzed": 4})
+    # 기사 커밋, 분석 커밋마다 조회 응답 캐시 세대가 올라간다
+    assert get_response_cache().generation > generation
+    assert second == {"fetched": 4, "analyzed": 4, "cache_hits": 4, "cache_misses": 0, "duplicates": 0}
+    assert gemini.state.calls == 4
+    assert db_session.query(Analysis).count() == 8
+    # 캐시 적중으로 복사된 분석도 롤업에 반영된다
+    daily = db_session.query(SentimentRollup).filter(SentimentRollup.granularity == "day").all()
+    assert sum(row.count for row in daily) == 8
+
+
+def test_near_duplicate_stories_analyzed_once(db_session, ingest, monkeypatch, settings_env):
+    items = _items(3)
+    # 0번 기사를 조금씩 고친 재배포본 2건 (링크/제목/본문이 달라 해시와 캐시 키도 다름)
+    for n, copy in enumerate(_items(2, link_prefix="https://wire.example.com/"), start=1):
+        copy.content = items[0].content.replace("</p>", f" 무단 전재 및 재배포 금지 {n}</p>")
+        items.append(copy)
+    gemini = make_gemini_app()
+    with serve(gemini) as base_url:
+        settings_env(gemini_api_key="test", newsdata_api_key="test", gemini_base_url=base_url)
+        first = _run(ingest, monkeypatch, items)
+        # 다음 회차의 재배포본은 이전 대표 기사의 결과를 복사
+        late = _items(1, link_prefix="https://late.example.com/")
+        late[0].content = items[0].content.replace("<p>", "<p>(서울=뉴스) ")
+        second = _run(ingest, monkeypatch, late)
+
+    assert first == {"fetched": 5, "analyzed": 5, "cache_hits": 0, "cache_misses": 3, "duplicates": 2}
+    assert second == {"fetched": 1, "analyzed": 1, "cache_hits": 0, "cache_misses": 0, "duplicates": 1}
+    assert gemini.state.calls == 3
+    head = db_session.query(Article).filter(Article.link == "https://example.com/0").one()
+    copies = db_session.query(Article).filter(Article.cluster_id == head.id, Article.id != head.id).all()
+    assert len(copies) == 3
+    assert {a.analysis.json_meta["duplicate_of"] for a in copies} == {head.id}
+    assert "duplicate_of" not in head.analysis.json_meta
+
+
+def test_batched_prompts_fall_back_per_item(db_session, ingest, monkeypatch, settings_env):
+    gemini = make_gemini_app(latency=0.02)
+    with serve(gemini) as base_url:
+        settings_env(
+            gemini_api_key="test",
+            newsdata_api_key="test",
+            gemini_base_url=base_url,
+            analysis_concurrency=1,
+            analysis_prompt_batch_size=3,
+        )
+        # 0, 2, 4번 기사는 배치 응답에서 스키마가 깨진다
+        result = _run(ingest, monkeypatch, _items(6, fail_every=2, marker="BAD"))
+
+    assert result["analyzed"] == 6
+    assert gemini.state.batch_calls == 2
+    assert gemini.state.calls == 5  # 배치 2회 + 깨진 항목 단건 재시도 3회
+    assert gemini.state.max_in_flight == 1  # 단건 재시도도 동시성 한도 안에서
+
+
+def test_bulk_insert_skips_existing_and_in_batch_duplicates(db_session):
+    src = Source(name="newsdata", api_type="newsdata", active=True)
+    db_session.add(src)
+    db_session.commit()
+    items = _items(5)
+    first = pipeline.bulk_insert_articles(db_session, [(src, item) for item in items + items[:2]], chunk_size=2)
+    assert len(first) == 5
+    assert db_session.query(ArticleSearch).count() == 5
+
+    second = pipeline.bulk_insert_articles(db_session, [(src, item) for item in items + _items(7)[5:]])
+    assert [a.title for a in second] == ["테스트 기사 5", "테스트 기사 6"]
+    assert db_session.query(Article).count() == 7
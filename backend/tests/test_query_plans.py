@@ -0,0 +1,69 @@
+"""목록 쿼리 모양별 실행 계획 검증: 대용량 합성 데이터에서 전체 정렬 대신 인덱스를 타는지 확인합니다."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.models import Analysis, Article, Base
+from app.routes.articles import LIST_COLUMNS, ArticleFilters, _apply_keyset, _encode_cursor, filtered_query
+from benchmarks.synthetic import seed_database
+
+SEED_SIZE = 20_000
+
+
+@pytest.fixture(scope="module")
+def plan_engine(tmp_path_factory):
+    eng = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}", future=True)
+    Base.metadata.create_all(bind=eng)
+    with Session(eng) as db:
+        seed_database(db, SEED_SIZE, with_search=False)
+    with eng.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    yield eng
+    eng.dispose()
+
+
+def _plan(engine, filters: ArticleFilters, sort: str, cursor=None) -> list[str]:
+    with Session(engine) as db:
+        query, _ = filtered_query(db, LIST_COLUMNS, filters)
+        sort_col = Analysis.sentiment_score if sort == "score_desc" else Article.published_at
+        query = _apply_keyset(query, sort_col, cursor, sort).limit(51)
+        sql = query.statement.compile(engine, compile_kwargs={"literal_binds": True})
+        return [row[3] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+def _assert_no_full_sort(plan: list[str]) -> None:
+    # "RIGHT PART OF ORDER BY"(같은 점수끼리 id 정렬)만 허용
+    assert not any(step == "USE TEMP B-TREE FOR ORDER BY" for step in plan), plan
+
+
+def test_latest_list_walks_published_index(plan_engine):
+    plan = _plan(plan_engine, ArticleFilters(), "published_desc")
+    assert any("ix_articles_published_at_id" in step for step in plan), plan
+    _assert_no_full_sort(plan)
+
+    cursor = _encode_cursor(datetime(2025, 12, 20), 5000)
+    plan = _plan(plan_engine, ArticleFilters(), "published_desc", cursor)
+    assert any("ix_articles_published_at_id" in step for step in plan), plan
+    _assert_no_full_sort(plan)
+
+
+def test_source_filter_uses_index_without_sort(plan_engine):
+    plan = _plan(plan_engine, ArticleFilters(source="newsdata"), "published_desc")
+    assert any(step.startswith(("SCAN articles USING", "SEARCH articles USING")) for step in plan), plan
+    assert not any(step == "SCAN sources LEFT-JOIN" for step in plan), plan
+    _assert_no_full_sort(plan)
+
+
+def test_sentiment_filter_score_sort_uses_composite_index(plan_engine):
+    plan = _plan(plan_engine, ArticleFilters(sentiment="positive"), "score_desc")
+    assert any("ix_analyses_label_score (sentiment_label=?)" in step for step in plan), plan
+    _assert_no_full_sort(plan)
+
+
+def test_keyword_filter_uses_inverted_index(plan_engine):
+    for match in ("exact", "prefix"):
+        plan = _plan(plan_engine, ArticleFilters(keyword="금리", keyword_match=match), "published_desc")
+        assert any(step.startswith("SEARCH keywords USING COVERING INDEX") for step in plan), plan
+        assert any(step.startswith("SEARCH analysis_keywords USING COVERING INDEX") for step in plan), plan
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from app.services.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_and_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_min=60, capacity=3, clock=clock)
+    for _ in range(3):
+        assert bucket.wait_time(1) == 0
+        bucket.take(1)
+    assert bucket.wait_time(1) == 1.0
+    clock.now = 2.0
+    assert bucket.fill_level == 2.0
+    # 용량보다 큰 요청도 언젠가는 통과해야 한다
+    assert bucket.wait_time(100) == 1.0
+
+
+def test_rate_limiter_waits_without_blocking_loop():
+    async def scenario():
+        limiter = RateLimiter(requests_per_min=600, tokens_per_min=60_000, burst=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.create_task(ticker())
+        started = time.monotonic()
+        # 버스트 2건 후 나머지 3건은 초당 10건 속도로 통과
+        await asyncio.gather(*(limiter.acquire(tokens=10) for _ in range(5)))
+        elapsed = time.monotonic() - started
+        tick_task.cancel()
+        return elapsed, ticks, limiter.snapshot()
+
+    elapsed, ticks, snapshot = asyncio.run(scenario())
+    assert 0.25 <= elapsed < 1.0
+    assert ticks >= 10
+    assert snapshot["waiting"] == 0
+    assert snapshot["requests_available"] < 1
+    assert snapshot["tokens_available"] < snapshot["tokens_capacity"]
@@ -0,0 +1,113 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.models import Analysis, AnalysisKeyword, Article, ArticleSearch, Source, StoryBand, StorySignature
+from app.services.dedup import assign_clusters
+from app.services.keywords import index_keywords
+from app.services.retention import run_retention
+from app.services.scheduler import SUCCEEDED, IngestScheduler, get_retention_scheduler
+from app.services.search import insert_documents
+from benchmarks.synthetic import iter_articles
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def _seed(db, ages_days):
+    src = Source(name="newsdata", api_type="newsdata")
+    db.add(src)
+    db.flush()
+    bodies = [article["content"] for article in iter_articles(len(ages_days))]
+    rows = []
+    for i, age in enumerate(ages_days):
+        published = NOW - timedelta(days=age) if age is not None else None
+        art = Article(
+            source_id=src.id,
+            title=f"기사 {i}",
+            link=f"https://example.com/{i}",
+            published_at=published,
+            content_clean=bodies[i],
+            hash=f"h{i}",
+            created_at=NOW - timedelta(days=200) if age is None else NOW,
+        )
+        db.add(art)
+        db.flush()
+        db.add(Analysis(article_id=art.id, summary="요약", sentiment_label="neutral", sentiment_score=0.0, keywords=["금리"]))
+        rows.append((art.id, published or art.created_at, ["금리"]))
+        insert_documents(db, [(art.id, art.title, art.content_clean, ["금리"])])
+    index_keywords(db, rows)
+    db.commit()
+    assign_clusters(db, [(article_id, body) for (article_id, _, _), body in zip(rows, bodies)], 0.5)
+    return [article_id for article_id, _, _ in rows]
+
+
+def _run(async_session_factory, progress=None):
+    async def _go():
+        async with async_session_factory() as db:
+            return await run_retention(db, progress=progress, now=NOW)
+
+    return asyncio.run(_go())
+
+
+def test_archives_then_purges_expired_articles_in_chunks(db_session, async_session_factory, settings_env, tmp_path):
+    archive_dir = tmp_path / "archive"
+    settings_env(retention_days=90, retention_chunk_size=2, retention_archive_dir=archive_dir)
+    # 오래된 기사 4건(발행 시각 없는 1건은 저장 시각 기준) + 최근 기사 2건
+    ids = _seed(db_session, [120, 10, 95, None, 400, 30])
+    expired = {ids[0], ids[2], ids[3], ids[4]}
+
+    updates = []
+    result = _run(async_session_factory, progress=lambda stage, counts: updates.append(dict(counts)))
+
+    assert result["archived"] == result["deleted"] == result["deleted_analyses"] == 4
+    assert result["bytes_reclaimed"] > 0 and result["archive_bytes"] > 0
+    # 청크(2건)마다 진행 상황이 누적된다
+    assert [u["deleted"] for u in updates] == [2, 4]
+
+    remaining = {ids[1], ids[5]}
+    db_session.expire_all()
+    assert {a.id for a in db_session.query(Article)} == remaining
+    for model in (Analysis, AnalysisKeyword, ArticleSearch, StorySignature, StoryBand):
+        assert {row.article_id for row in db_session.query(model)} <= remaining
+
+    paths = list(archive_dir.iterdir())
+    assert [p.name for p in paths] == ["articles-20260601T120000.jsonl.gz"]
+    with gzip.open(paths[0], "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert {r["id"] for r in records} == expired
+    assert all(r["source"] == "newsdata" and r["analysis"]["keywords"] == ["금리"] for r in records)
+
+    # 두 번째 실행은 지울 것이 없고 새 파일도 만들지 않는다
+    assert _run(async_session_factory)["deleted"] == 0
+    assert len(list(archive_dir.iterdir())) == 1
+
+
+def test_retention_endpoint_reports_progress(client, db_session, async_session_factory, settings_env):
+    settings_env(retention_days=90, retention_archive_dir="")
+    _seed(db_session, [200, 1])
+
+    async def runner(db, progress):
+        return await run_retention(db, progress=progress, now=NOW)
+
+    scheduler = IngestScheduler(async_session_factory, runner=runner, name="retention")
+    app.dependency_overrides[get_retention_scheduler] = lambda: scheduler
+
+    async def scenario():
+        await scheduler.start()
+        job = scheduler.submit()
+        await scheduler.wait(job.id)
+        await scheduler.stop()
+        return job
+
+    try:
+        job = asyncio.run(scenario())
+        body = client.get(f"/admin/retention/jobs/{job.id}").json()
+    finally:
+        app.dependency_overrides.pop(get_retention_scheduler, None)
+
+    assert job.status == SUCCEEDED
+    assert body["progress"]["deleted"] == 1 and body["progress"]["archived"] == 0
+    assert body["result"]["bytes_reclaimed"] > 0 and body["result"]["archive_path"] is None
+    assert db_session.query(Article).count() == 1
@@ -0,0 +1,101 @@
+import asyncio
+
+from app.main import app
+from app.services.scheduler import FAILED, QUEUED, SUCCEEDED, IngestScheduler, get_ingest_scheduler
+
+
+def _scheduler(factory, runner, **kwargs):
+    return IngestScheduler(factory, runner=runner, **kwargs)
+
+
+def test_jobs_run_one_at_a_time_and_report_progress(async_session_factory):
+    in_flight = max_in_flight = 0
+
+    async def runner(db, progress):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        progress("fetch", {})
+        await asyncio.sleep(0.02)
+        progress("analyze", {"fetched": 3, "analyzed": 0})
+        progress("analyze", {"analyzed": 3})
+        in_flight -= 1
+        return {"fetched": 3, "analyzed": 3}
+
+    async def scenario():
+        scheduler = _scheduler(async_session_factory, runner)
+        await scheduler.start()
+        first = scheduler.submit()
+        await asyncio.sleep(0)  # 첫 작업이 실행을 시작하도록
+        second = scheduler.submit()
+        # 대기 중인 작업이 있으면 새로 만들지 않는다
+        assert scheduler.submit() is second
+        await scheduler.wait(second.id)
+        await scheduler.stop()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first.id != second.id
+    assert max_in_flight == 1
+    assert first.status == SUCCEEDED
+    assert first.result == {"fetched": 3, "analyzed": 3}
+    assert first.progress == {"fetched": 3, "analyzed": 3}
+    assert set(first.stage_seconds) == {"fetch", "analyze"}
+    assert first.finished_at >= first.started_at
+
+
+def test_failed_job_records_error(async_session_factory):
+    async def runner(db, progress):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        scheduler = _scheduler(async_session_factory, runner)
+        await scheduler.start()
+        job = await scheduler.wait(scheduler.submit().id)
+        await scheduler.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.status == FAILED
+    assert job.error == "RuntimeError: boom"
+
+
+def test_periodic_runs_do_not_overlap(async_session_factory):
+    started = []
+
+    async def runner(db, progress):
+        started.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.05)
+        return {"fetched": 0, "analyzed": 0}
+
+    async def scenario():
+        scheduler = _scheduler(async_session_factory, runner, interval_seconds=0.01)
+        await scheduler.start()
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert 2 <= len(started) <= 4
+    assert all(b - a >= 0.05 for a, b in zip(started, started[1:]))
+    assert {job.trigger for job in scheduler.jobs()} == {"schedule"}
+
+
+def test_admin_endpoint_enqueues_job(client, async_session_factory):
+    async def runner(db, progress):
+        return {"fetched": 0, "analyzed": 0}
+
+    scheduler = _scheduler(async_session_factory, runner)
+    app.dependency_overrides[get_ingest_scheduler] = lambda: scheduler
+    try:
+        res = client.post("/admin/ingest/run")
+        assert res.status_code == 202
+        job_id = res.json()["id"]
+        assert res.json()["status"] == QUEUED
+
+        job = client.get(f"/admin/ingest/jobs/{job_id}").json()
+        assert job["id"] == job_id and job["trigger"] == "manual"
+        assert [j["id"] for j in client.get("/admin/ingest/jobs").json()] == [job_id]
+        assert client.get("/admin/ingest/jobs/missing").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_ingest_scheduler, None)
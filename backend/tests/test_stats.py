@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.models import Analysis, Article, SentimentRollup, Source
+from app.services.rollups import record_samples, rebuild_rollups
+
+BASE = datetime(2026, 3, 1, 9, 0)
+
+
+def _seed(db):
+    """두 소스 × 3시간에 걸친 분석 결과를 저장하고, 파이프라인처럼 롤업을 증분 갱신합니다."""
+    sources = [Source(name="newsdata:kr", api_type="newsdata"), Source(name="rss:example", api_type="rss")]
+    db.add_all(sources)
+    db.flush()
+    samples = []
+    for i in range(12):
+        src = sources[i % 2]
+        published = BASE + timedelta(minutes=25 * i)
+        label = ("positive", "negative", "neutral")[i % 3]
+        score = {"positive": 0.5, "negative": -0.5, "neutral": 0.0}[label] + i / 100
+        art = Article(
+            source_id=src.id,
+            title=f"기사 {i}",
+            link=f"https://example.com/{i}",
+            published_at=published,
+            content_clean="본문",
+            hash=f"h{i}",
+        )
+        db.add(art)
+        db.flush()
+        db.add(Analysis(article_id=art.id, summary="요약", sentiment_label=label, sentiment_score=score, keywords=[]))
+        samples.append((published, src.id, label, score))
+    # 두 번에 나눠 기록해도 같은 버킷에 합산되어야 한다
+    record_samples(db, samples[:5])
+    record_samples(db, samples[5:])
+    db.commit()
+    return sources
+
+
+def _rollups(db):
+    rows = db.execute(select(SentimentRollup).order_by(*SentimentRollup.__table__.primary_key.columns)).scalars()
+    return [
+        (r.granularity, r.bucket, r.source_id, r.sentiment_label, r.count, round(r.score_sum, 6), r.score_min, r.score_max)
+        for r in rows
+    ]
+
+
+def test_incremental_rollups_match_rebuild(db_session):
+    _seed(db_session)
+    incremental = _rollups(db_session)
+    assert {row[0] for row in incremental} == {"hour", "day"}
+    assert sum(row[4] for row in incremental if row[0] == "day") == 12
+
+    rebuild_rollups(db_session)
+    db_session.expire_all()
+    assert _rollups(db_session) == incremental
+
+
+def test_sentiment_series_endpoint(client, db_session):
+    _seed(db_session)
+
+    body = client.get("/stats/sentiment", params={"granularity": "hour"}).json()
+    assert body["granularity"] == "hour"
+    buckets = sorted({item["bucket"] for item in body["items"]})
+    assert buckets == [f"2026-03-01T{hour:02d}:00:00" for hour in range(9, 14)]
+    assert sum(item["count"] for item in body["items"]) == 12
+
+    day = client.get("/stats/sentiment", params={"sentiment": "positive", "source": "newsdata"}).json()["items"]
+    positives = [i for i in range(0, 12, 2) if i % 3 == 0]  # newsdata 소스 = 짝수 번 기사
+    assert len(day) == 1
+    assert day[0]["count"] == len(positives)
+    assert day[0]["min_score"] == 0.5
+    assert abs(day[0]["mean_score"] - sum(0.5 + i / 100 for i in positives) / len(positives)) < 1e-9
+
+    # from이 버킷 중간이어도 그 버킷부터 포함
+    ranged = client.get(
+        "/stats/sentiment", params={"granularity": "hour", "from": "2026-03-01T10:30:00", "to": "2026-03-01T11:00:00"}
+    ).json()["items"]
+    assert {item["bucket"] for item in ranged} == {"2026-03-01T10:00:00", "2026-03-01T11:00:00"}
+
+    assert client.get("/stats/sentiment", params={"granularity": "week"}).status_code == 422
+
+
+def test_source_stats_endpoint(client, db_session):
+    sources = _seed(db_session)
+    items = {item["source_name"]: item for item in client.get("/stats/sources").json()["items"]}
+    assert set(items) == {"newsdata:kr", "rss:example"}
+    rss = items["rss:example"]
+    assert rss["source_id"] == sources[1].id
+    assert rss["count"] == 6
+    assert rss["labels"] == {"negative": 2, "neutral": 2, "positive": 2}
+    assert rss["min_score"] == -0.5 + 1 / 100
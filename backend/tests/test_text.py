@@ -0,0 +1,74 @@
+import asyncio
+import html
+import random
+import re
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.preprocess import TextCleaner
+from app.utils.text import clean_html, clean_html_batch
+from benchmarks.synthetic import make_news_html
+
+
+def _legacy_clean_html(text, max_len=8000):
+    # 이전 구현 (정규식 3회 + unescape 후 자르기)
+    no_tags = re.sub(r"<[^>]+>", " ", text)
+    return re.sub(r"\s+", " ", html.unescape(no_tags)).strip()[:max_len]
+
+
+def test_clean_html_matches_legacy_on_well_formed_html():
+    samples = [
+        "<p>안녕 &amp; 하세요</p>\n\n<b>굵게</b>&nbsp;끝",
+        "  앞뒤 공백 <br/>줄바꿈\r\n\t탭  ",
+        "&#54620;&#xAE00; &lt;태그&gt; &copy 2026 &amp;nbsp;",
+        "<div\nclass='body'>여러 줄 태그</div>단어<span>붙음</span>",
+    ]
+    rng = random.Random(0)
+    tokens = ["<p>", "</p>", "<br/>", "&amp;", "&nbsp;", "&#65;", "&lt;", " ", "\n", "\xa0", "가", "나", "a"]
+    samples += ["".join(rng.choice(tokens) for _ in range(rng.randint(0, 60))) for _ in range(500)]
+    for text in samples:
+        assert clean_html(text) == _legacy_clean_html(text)
+
+
+def test_clean_html_strips_script_style_and_comments():
+    text = (
+        "<style>p { color: red; }</style><p>본문</p><!-- <p>광고</p> -->"
+        "<SCRIPT type='text/javascript'>if (a < b) { x = '<p>숨김</p>'; }</SCRIPT>끝 3 < 5"
+        "<script>닫히지 않은 스크립트"
+    )
+    assert clean_html(text) == "본문 끝 3 < 5"
+
+
+def test_clean_html_stops_at_length_budget():
+    page = "<p>" + "가나다 라마바 " * 500_000 + "</p>"
+    tracemalloc.start()
+    cleaned = clean_html(page, max_len=100)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert cleaned == _legacy_clean_html(page, max_len=100).strip()
+    # 입력(수 MB)을 복사하거나 끝까지 토큰화하지 않는다
+    assert peak < 64 * 1024
+
+
+def test_clean_html_batch_with_executor_keeps_order():
+    rng = random.Random(1)
+    pages = [make_news_html(rng, paragraphs=3, script_kb=1) for _ in range(10)] + [None]
+    expected = [clean_html(page) for page in pages[:-1]] + [""]
+    assert clean_html_batch(pages) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert clean_html_batch(pages, executor=executor, chunk_size=3) == expected
+
+
+def test_text_cleaner_process_pool():
+    rng = random.Random(2)
+    pages = [make_news_html(rng, paragraphs=3, script_kb=1) for _ in range(4)]
+    cleaner = TextCleaner(workers=1, process_threshold=1)
+    try:
+        assert asyncio.run(cleaner.clean(pages)) == [clean_html(page) for page in pages]
+        assert cleaner._pool is not None
+    finally:
+        cleaner.shutdown()
+    # 기준 미만 배치는 프로세스 풀을 만들지 않는다
+    small = TextCleaner(workers=1, process_threshold=10**9)
+    assert asyncio.run(small.clean(pages[:1])) == [clean_html(pages[0])]
+    assert small._pool is None
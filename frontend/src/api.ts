@@ -26,6 +26,7 @@ export type Analysis = {
 
 export type ArticleListResponse = {
   items: Article[]
+  next_cursor?: string | null
 }
 
 async function handleResponse<T>(res: Response): Promise<T> {
@@ -43,6 +44,8 @@ export async function getArticles(params: {
   from?: string
   to?: string
   sort?: string
+  cursor?: string
+  limit?: string
 }): Promise<ArticleListResponse> {
   const qs = new URLSearchParams()
   Object.entries(params).forEach(([key, value]) => {
@@ -20,6 +20,7 @@ const sentimentOptions = [
 const sortOptions = [
   { value: 'published_desc', label: '최신순' },
   { value: 'score_desc', label: '감성점수순' },
+  { value: 'relevance', label: '관련도순' },
 ]
 
 export default function FilterBar({
@@ -1,5 +1,5 @@
 import { useMemo } from 'react'
-import { useQuery } from '@tanstack/react-query'
+import { useInfiniteQuery } from '@tanstack/react-query'
 import { useSearchParams } from 'react-router-dom'
 import { getArticles } from '../api'
 import ArticleCard from '../components/ArticleCard'
@@ -17,10 +17,13 @@ export default function ArticlesPage() {
 
   const queryParams = useMemo(() => ({ q, sentiment, source, from, to, sort }), [q, sentiment, source, from, to, sort])
 
-  const { data, isLoading, error } = useQuery({
+  const { data, isLoading, error, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
     queryKey: ['articles', queryParams],
-    queryFn: () => getArticles(queryParams),
+    queryFn: ({ pageParam }) => getArticles({ ...queryParams, cursor: pageParam }),
+    initialPageParam: '',
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
   })
+  const items = useMemo(() => data?.pages.flatMap((page) => page.items) ?? [], [data])
 
   const handleFilter = (params: { q: string; sentiment: string; source: string; from: string; to: string; sort: string }) => {
     const next = new URLSearchParams(searchParams)
@@ -56,14 +59,26 @@ export default function ArticlesPage() {
           데이터를 불러오지 못했습니다: {(error as Error).message}
         </div>
       )}
-      {!isLoading && data && data.items.length === 0 && (
+      {!isLoading && data && items.length === 0 && (
         <div className="text-sm text-gray-600">표시할 기사가 없습니다.</div>
       )}
       <div className="grid grid-cols-4 gap-8 lg:grid-cols-3 md:grid-cols-2 sm:grid-cols-1">
-        {data?.items.map((article) => (
+        {items.map((article) => (
           <ArticleCard key={article.id} article={article} />
         ))}
       </div>
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <button
+            type="button"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="border border-primary/30 bg-white px-6 py-2 text-sm shadow-sharp hover:border-primary disabled:opacity-50"
+          >
+            {isFetchingNextPage ? '불러오는 중...' : '더 보기'}
+          </button>
+        </div>
+      )}
     </div>
   )
 }